@@ -1,9 +1,24 @@
 """
 Module principal du package pymafia.
 C'est ici le point d'entrée du programme.
-Ce module définit 3 fonctions ainsi que les commandes principales qui lancent le jeu.
+Ce module définit les fonctions et les commandes principales qui lancent le jeu.
+
+Sans argument, le programme lance une partie interactive. Avec l'option --cotes, la partie affiche aussi les cotes de
+chaque ronde, lues dans un fichier de cotes (voir le module cotes):
+    python -m pymafia --cotes cotes.bin
+
+La sous-commande simuler joue plutôt un lot de parties automatiques, sans aucune question, par exemple:
+    python -m pymafia simuler --joueurs 5 --parties 1000000 --processus 8 --graine 42 --sortie resume.json
 """
+import argparse
+import json
+import sys
+import time
+
+from pymafia.cotes import FICHIER_COTES, NOMBRE_JOUEURS_MAX, TablesCotes
 from pymafia.partie import Partie
+from pymafia.simulation import TAILLE_BLOC, simuler_par_blocs
+from pymafia.statistiques import StatistiquesParties
 
 def demander_nombre_joueurs():
     """
@@ -70,8 +85,131 @@ joueurs ou plus sont à égalité avec le plus grand nombre de points (événeme
         """)
 
 
+def afficher_progression(parties_jouees, nombre_parties, debut, sortie=sys.stderr):
+    """
+    Fonction qui affiche, sur une seule ligne réécrite à chaque appel, le nombre de parties jouées, le débit et le
+    temps restant estimé.
+    Args:
+        parties_jouees (int): Nombre de parties jouées jusqu'à maintenant
+        nombre_parties (int): Nombre total de parties à jouer
+        debut (float): Moment du début de la simulation (time.perf_counter)
+        sortie (file, optional): Fichier où écrire la progression (la sortie d'erreur par défaut)
+    """
+    duree = time.perf_counter() - debut
+    debit = parties_jouees / duree if duree > 0 else 0.0
+    restant = (nombre_parties - parties_jouees) / debit if debit else 0.0
+    sortie.write("\r{:,}/{:,} parties  {:,.0f} parties/s  temps restant {:,.0f} s   ".format(
+        parties_jouees, nombre_parties, debit, restant))
+    sortie.flush()
+
+
+def analyser_options_partie(arguments=None):
+    """
+    Fonction qui lit les options de la partie interactive.
+    Args:
+        arguments (list, optional): Arguments de la ligne de commande (sys.argv[1:] par défaut)
+    Returns:
+        argparse.Namespace: Les options (cotes: chemin du fichier de cotes, ou None pour ne pas afficher les cotes)
+    """
+    analyseur = argparse.ArgumentParser(prog="python -m pymafia", description="Joue une partie interactive de pymafia.")
+    analyseur.add_argument("--cotes", nargs="?", const=FICHIER_COTES, default=None,
+                           help="Affiche les cotes de chaque ronde, lues dans ce fichier de cotes (par défaut, "
+                                "cotes.bin dans le dossier du package). Les tables couvrent les rondes de 2 à {} "
+                                "joueurs actifs; les autres rondes se jouent sans cotes.".format(NOMBRE_JOUEURS_MAX))
+    return analyseur.parse_args(arguments)
+
+
+def charger_cotes(chemin):
+    """
+    Fonction qui ouvre un fichier de cotes pour la partie interactive. Si le fichier ne peut pas être ouvert, la partie
+    se joue sans cotes.
+    Args:
+        chemin (str): Chemin du fichier de cotes
+    Returns:
+        TablesCotes: Les tables de cotes, ou None si le fichier ne peut pas être ouvert
+    """
+    try:
+        return TablesCotes(chemin)
+    except (OSError, ValueError) as erreur:
+        print("Les cotes ne seront pas affichées ({}). Pour construire le fichier: python -m pymafia.cotes".format(
+            str(erreur).rstrip(".")))
+        return None
+
+
+def simuler_en_lot(arguments=None):
+    """
+    Fonction de la sous-commande simuler: elle joue un lot de parties automatiques sur plusieurs processus, affiche la
+    progression, puis écrit le résumé des statistiques (et, si demandé, le résultat de chaque partie).
+    Args:
+        arguments (list, optional): Arguments de la sous-commande (sys.argv[2:] par défaut)
+    Returns:
+        int: Code de sortie du programme
+    """
+    analyseur = argparse.ArgumentParser(prog="python -m pymafia simuler",
+                                        description="Joue un lot de parties automatiques de pymafia sans interaction.")
+    analyseur.add_argument("--joueurs", type=int, default=5, help="Nombre de joueurs à chaque table (entre 2 et 8)")
+    analyseur.add_argument("--parties", type=int, default=10000, help="Nombre de parties à jouer")
+    analyseur.add_argument("--processus", type=int, default=None,
+                           help="Nombre de processus (par défaut, le nombre de coeurs)")
+    analyseur.add_argument("--graine", type=int, default=0,
+                           help="Graine maîtresse de la simulation (entre 0 et 2**64 - 1)")
+    analyseur.add_argument("--sortie", help="Fichier JSON où écrire le résumé (la sortie standard par défaut)")
+    analyseur.add_argument("--resultats", help="Fichier JSON Lines où écrire le résultat de chaque partie")
+    analyseur.add_argument("--stockage", help="Dossier d'un stockage en colonnes où ajouter le résultat de chaque "
+                                              "partie (nécessite NumPy)")
+    analyseur.add_argument("--taille-bloc", type=int, default=TAILLE_BLOC, help="Nombre de parties par bloc")
+    options = analyseur.parse_args(sys.argv[2:] if arguments is None else arguments)
+    if not 2 <= options.joueurs <= 8:
+        analyseur.error("le nombre de joueurs doit être entre 2 et 8")
+    if options.parties < 1 or options.taille_bloc < 1 or (options.processus is not None and options.processus < 1):
+        analyseur.error("le nombre de parties, la taille des blocs et le nombre de processus doivent être positifs")
+    if not 0 <= options.graine < 2 ** 64:
+        analyseur.error("la graine doit être entre 0 et 2**64 - 1 (elle est stockée sur 64 bits)")
+
+    statistiques = StatistiquesParties(options.joueurs)
+    fichier_resultats = open(options.resultats, "w", encoding="utf-8") if options.resultats else None
+    stockage = None
+    if options.stockage:
+        from pymafia.stockage import EcrivainResultats
+        stockage = EcrivainResultats(options.stockage)
+    debut = time.perf_counter()
+    try:
+        for premiere, _, rapport_bloc, resultats in simuler_par_blocs(
+                options.joueurs, options.parties, options.graine, options.processus, options.taille_bloc,
+                StatistiquesParties, fichier_resultats is not None or stockage is not None):
+            statistiques.fusionner(rapport_bloc)
+            if fichier_resultats is not None:
+                fichier_resultats.write("".join(json.dumps({
+                    "partie": premiere + index, "scores": resultat.scores, "gagnants": resultat.gagnants,
+                    "nombre_rondes": resultat.nombre_rondes}) + "\n" for index, resultat in enumerate(resultats)))
+            if stockage is not None:
+                for index, resultat in enumerate(resultats):
+                    stockage.ajouter(options.graine, premiere + index, resultat)
+            afficher_progression(statistiques.nombre_parties, options.parties, debut)
+    finally:
+        if fichier_resultats is not None:
+            fichier_resultats.close()
+        if stockage is not None:
+            stockage.fermer()
+    duree = time.perf_counter() - debut
+    sys.stderr.write("\n")
+
+    resume = {"graine": options.graine, "duree_s": duree, "parties_par_seconde": options.parties / duree}
+    resume.update(statistiques.resume())
+    if options.sortie:
+        with open(options.sortie, "w", encoding="utf-8") as fichier:
+            json.dump(resume, fichier, indent=2, ensure_ascii=False)
+    else:
+        print(json.dumps(resume, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == '__main__' and sys.argv[1:2] == ["simuler"]:
+    sys.exit(simuler_en_lot())
+
 if __name__ == '__main__':
 
+    options = analyser_options_partie()
     print("Jouons une partie de pyMafia!\n")
     # Afficher les instruction
     afficher_instructions()
@@ -81,6 +219,8 @@ if __name__ == '__main__':
     nombre_joueur_humain = demander_nombre_joueurs_humains(nombre_joueur)
     # Création de l'objet partie avec le nombre de joueurs spécifiés
     partie = Partie(nombre_joueur, nombre_joueur_humain)
+    if options.cotes is not None:
+        partie.cotes = charger_cotes(options.cotes)
     # Démarrage de cette partie.
     partie.jouer()
     input('Appuyer sur ENTER pour quitter.')
@@ -0,0 +1,174 @@
+"""
+Module des affichages du jeu pymafia.
+
+Une partie ne fait jamais print ni input directement: elle passe par son affichage. Chaque message est donné sous la
+forme d'un gabarit et de ses arguments (comme pour str.format); c'est l'affichage qui décide s'il assemble le message.
+Trois affichages sont offerts:
+    - AffichageConsole, qui affiche chaque message dès qu'il est produit et lit les réponses au clavier;
+    - AffichageTampon, qui accumule les messages et les écrit par gros morceaux;
+    - AffichageNul, qui n'assemble ni n'écrit aucun message et donne toujours la même réponse.
+Les méthodes qui assemblent un long message (par exemple Partie.message_points_des_joueurs) ne sont appelées que si
+l'attribut actif de l'affichage est vrai.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+
+# Nombre de lignes accumulées par défaut par AffichageTampon avant une écriture
+TAILLE_TAMPON = 256
+
+
+class Affichage(ABC):
+    """
+    Classe de base des affichages. Une sous-classe doit définir afficher et demander pour être instanciée.
+
+    Attributes:
+        actif (bool): True si les messages sont lus par quelqu'un (et valent donc la peine d'être assemblés)
+    """
+
+    actif = True
+
+    @abstractmethod
+    def afficher(self, gabarit="", *arguments):
+        """
+        Méthode qui affiche un message.
+        Args:
+            gabarit (str, optional): Le message, ou son gabarit s'il y a des arguments (voir str.format)
+            *arguments: Valeurs à insérer dans le gabarit
+        """
+
+    @abstractmethod
+    def demander(self, invite, *arguments):
+        """
+        Méthode qui pose une question à l'utilisateur.
+        Args:
+            invite (str): La question, ou son gabarit s'il y a des arguments (voir str.format)
+            *arguments: Valeurs à insérer dans le gabarit
+        Returns:
+            str: La réponse de l'utilisateur
+        """
+
+    def vider(self):
+        """
+        Méthode qui écrit les messages qui n'ont pas encore été écrits (rien à faire par défaut).
+        """
+
+
+class AffichageConsole(Affichage):
+    """
+    Affichage interactif à la console: chaque message est affiché avec print et chaque question est posée avec input.
+    """
+
+    def afficher(self, gabarit="", *arguments):
+        """
+        Méthode qui affiche un message à la console.
+        Args:
+            gabarit (str, optional): Le message, ou son gabarit s'il y a des arguments (voir str.format)
+            *arguments: Valeurs à insérer dans le gabarit
+        """
+        print(gabarit.format(*arguments) if arguments else gabarit)
+
+    def demander(self, invite, *arguments):
+        """
+        Méthode qui pose une question à la console.
+        Args:
+            invite (str): La question, ou son gabarit s'il y a des arguments (voir str.format)
+            *arguments: Valeurs à insérer dans le gabarit
+        Returns:
+            str: La réponse de l'utilisateur
+        """
+        return input(invite.format(*arguments) if arguments else invite)
+
+
+class AffichageTampon(Affichage):
+    """
+    Affichage qui accumule les messages et les écrit dans un fichier par morceaux de plusieurs lignes. Les messages en
+    attente sont écrits avant chaque question, pour que l'utilisateur les voie avant de répondre.
+
+    Attributes:
+        fichier (file): Fichier texte où les messages sont écrits
+        taille_tampon (int): Nombre de lignes accumulées avant une écriture
+        entree (function): Fonction qui pose une question et retourne la réponse
+    """
+
+    def __init__(self, fichier=None, taille_tampon=TAILLE_TAMPON, entree=input):
+        """
+        Constructeur de la classe AffichageTampon
+        Args:
+            fichier (file, optional): Fichier texte où écrire les messages (la sortie standard par défaut)
+            taille_tampon (int, optional): Nombre de lignes accumulées avant une écriture
+            entree (function, optional): Fonction qui pose une question et retourne la réponse (input par défaut)
+        """
+        self.fichier = sys.stdout if fichier is None else fichier
+        self.taille_tampon = taille_tampon
+        self.entree = entree
+        self._lignes = []
+
+    def afficher(self, gabarit="", *arguments):
+        """
+        Méthode qui ajoute un message au tampon.
+        Args:
+            gabarit (str, optional): Le message, ou son gabarit s'il y a des arguments (voir str.format)
+            *arguments: Valeurs à insérer dans le gabarit
+        """
+        self._lignes.append(gabarit.format(*arguments) if arguments else gabarit)
+        if len(self._lignes) >= self.taille_tampon:
+            self.vider()
+
+    def demander(self, invite, *arguments):
+        """
+        Méthode qui écrit les messages en attente puis pose une question.
+        Args:
+            invite (str): La question, ou son gabarit s'il y a des arguments (voir str.format)
+            *arguments: Valeurs à insérer dans le gabarit
+        Returns:
+            str: La réponse de l'utilisateur
+        """
+        self.vider()
+        return self.entree(invite.format(*arguments) if arguments else invite)
+
+    def vider(self):
+        """
+        Méthode qui écrit les messages accumulés dans le tampon.
+        """
+        if self._lignes:
+            self._lignes.append("")
+            self.fichier.write("\n".join(self._lignes))
+            self._lignes.clear()
+            self.fichier.flush()
+
+
+class AffichageNul(Affichage):
+    """
+    Affichage qui ne fait rien, pour les parties jouées sans personne pour les regarder. Les messages ne sont jamais
+    assemblés et chaque question reçoit la même réponse.
+
+    Attributes:
+        reponse (str): Réponse donnée à chaque question
+    """
+
+    actif = False
+
+    def __init__(self, reponse="1"):
+        """
+        Constructeur de la classe AffichageNul
+        Args:
+            reponse (str, optional): Réponse donnée à chaque question ("1" convient à toutes les questions du jeu)
+        """
+        self.reponse = reponse
+
+    def afficher(self, gabarit="", *arguments):
+        """
+        Méthode qui ignore un message.
+        """
+
+    def demander(self, invite, *arguments):
+        """
+        Méthode qui répond à une question sans la poser.
+        Args:
+            invite (str): La question (ignorée)
+            *arguments: Valeurs à insérer dans la question (ignorées)
+        Returns:
+            str: La réponse prévue
+        """
+        return self.reponse
@@ -0,0 +1,307 @@
+"""
+Module des sources de hasard du jeu pymafia.
+
+Toutes les valeurs aléatoires du jeu (lancers de dés, mélange des joueurs et choix du sens par l'ordinateur) sont
+tirées d'une source de hasard. La source par défaut est partagée par tout le programme; une partie peut aussi recevoir
+sa propre source, par exemple avec une graine pour pouvoir la reproduire exactement.
+
+Deux sources reproductibles sont offertes: SourceTamponnee, qui repose sur random.Random, et SourceCompteur, où chaque
+tirage est une fonction pure de la graine maîtresse, du numéro de la partie et du rang du tirage (hachage SHAKE-256).
+Avec SourceCompteur, n'importe quelle partie d'une simulation se recrée à elle seule, sur n'importe quelle machine,
+sans rejouer les parties qui la précèdent.
+"""
+
+import random
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from hashlib import shake_256
+
+# Table de traduction des octets aléatoires en valeurs de dé: les octets de 0 à 251 donnent (octet % 6) + 1 et les
+# octets de 252 à 255 sont rejetés, ce qui garde les six valeurs parfaitement équiprobables.
+_VALEURS_DÉS = bytes(octet % 6 + 1 for octet in range(252)) + bytes(4)
+_OCTETS_REJETÉS = bytes(range(252, 256))
+
+# Nombre d'octets aléatoires tirés à chaque remplissage du tampon de lancers
+TAILLE_TAMPON = 4096
+
+# Nombre d'octets calculés à chaque remplissage d'un tampon de SourceCompteur
+TAILLE_MORCEAU_COMPTEUR = 1024
+
+# Flux de SourceCompteur: les lancers de dés et les autres tirages ont chacun leur suite de morceaux
+_FLUX_DÉS = b"d"
+_FLUX_TIRAGES = b"t"
+
+
+class SourceAleatoire(ABC):
+    """
+    Classe de base des sources de hasard. Une source doit au minimum savoir lancer plusieurs dés d'un coup
+    (rouler_dés), tirer un entier (entier) et tirer un réel (aleatoire); les autres méthodes sont construites à partir
+    de celles-ci. Une sous-classe qui ne les définit pas toutes ne peut pas être instanciée.
+    """
+
+    @abstractmethod
+    def rouler_dés(self, nombre):
+        """
+        Méthode qui lance plusieurs dés.
+        Args:
+            nombre (int): Nombre de dés à lancer
+        Returns:
+            bytes: La valeur (entre 1 et 6) de chaque dé
+        """
+
+    @abstractmethod
+    def entier(self, borne):
+        """
+        Méthode qui tire un entier uniformément entre 0 et borne - 1.
+        Args:
+            borne (int): Nombre de valeurs possibles
+        Returns:
+            int: L'entier tiré
+        """
+
+    @abstractmethod
+    def aleatoire(self):
+        """
+        Méthode qui tire un réel uniformément dans l'intervalle [0, 1[.
+        Returns:
+            float: Le réel tiré
+        """
+
+    def rouler(self):
+        """
+        Méthode qui lance un seul dé.
+        Returns:
+            int: La valeur du dé, entre 1 et 6
+        """
+        return self.rouler_dés(1)[0]
+
+    def melanger(self, liste):
+        """
+        Méthode qui mélange une liste sur place (algorithme de Fisher-Yates).
+        Args:
+            liste (list): La liste à mélanger
+        """
+        for i in range(len(liste) - 1, 0, -1):
+            j = self.entier(i + 1)
+            liste[i], liste[j] = liste[j], liste[i]
+
+    def choisir_sens(self):
+        """
+        Méthode qui choisit au hasard un sens de jeu.
+        Returns:
+            int: 1 (ordre croissant) ou -1 (ordre décroissant)
+        """
+        return 2 * self.entier(2) - 1
+
+
+class SourceTamponnee(SourceAleatoire):
+    """
+    Source de hasard par défaut. Les lancers de dés sont tirés d'avance en grande quantité: un seul appel à
+    random.Random.randbytes remplit le tampon et une table de traduction transforme les octets en valeurs de dé. Lancer
+    une main complète revient ensuite à découper une tranche du tampon.
+
+    Attributes:
+        generateur (random.Random): Générateur utilisé pour remplir le tampon et pour les autres tirages
+        taille_tampon (int): Nombre d'octets aléatoires tirés à chaque remplissage
+    """
+
+    def __init__(self, graine=None, taille_tampon=TAILLE_TAMPON):
+        """
+        Constructeur de la classe SourceTamponnee
+        Args:
+            graine (int, optional): Graine du générateur. Deux sources de même graine donnent les mêmes tirages.
+            taille_tampon (int, optional): Nombre d'octets aléatoires tirés à chaque remplissage
+        """
+        self.generateur = random.Random(graine)
+        self.taille_tampon = taille_tampon
+        self._tampon = b''
+        self._position = 0
+
+    def rouler_dés(self, nombre):
+        """
+        Méthode qui lance plusieurs dés en prenant les prochaines valeurs du tampon.
+        Args:
+            nombre (int): Nombre de dés à lancer
+        Returns:
+            bytes: La valeur (entre 1 et 6) de chaque dé
+        """
+        debut = self._position
+        fin = debut + nombre
+        if fin > len(self._tampon):
+            self._remplir(nombre)
+            debut = 0
+            fin = nombre
+        self._position = fin
+        return self._tampon[debut:fin]
+
+    def _remplir(self, minimum):
+        """
+        Méthode qui remplace le tampon par les valeurs qui n'ont pas encore été utilisées suivies de nouvelles valeurs.
+        Args:
+            minimum (int): Nombre minimal de valeurs que doit contenir le nouveau tampon
+        """
+        morceaux = [self._tampon[self._position:]]
+        longueur = len(morceaux[0])
+        while True:
+            morceau = self.generateur.randbytes(self.taille_tampon).translate(_VALEURS_DÉS, _OCTETS_REJETÉS)
+            morceaux.append(morceau)
+            longueur += len(morceau)
+            if longueur >= minimum:
+                break
+        self._tampon = b''.join(morceaux)
+        self._position = 0
+
+    def entier(self, borne):
+        """
+        Méthode qui tire un entier uniformément entre 0 et borne - 1.
+        Args:
+            borne (int): Nombre de valeurs possibles
+        Returns:
+            int: L'entier tiré
+        """
+        return self.generateur.randrange(borne)
+
+    def aleatoire(self):
+        """
+        Méthode qui tire un réel uniformément dans l'intervalle [0, 1[.
+        Returns:
+            float: Le réel tiré
+        """
+        return self.generateur.random()
+
+
+class SourceCompteur(SourceAleatoire):
+    """
+    Source de hasard à compteur. Le morceau numéro c d'un flux est la sortie de SHAKE-256 pour la graine maîtresse, le
+    numéro de la partie, le flux et c: chaque tirage est donc une fonction pure de (graine maîtresse, numéro de la
+    partie, rang du tirage) et aucun état n'est partagé entre les parties. Les lancers de dés et les autres tirages
+    (entiers et réels) ont chacun leur flux, ce qui permet de calculer les morceaux d'avance, comme SourceTamponnee.
+
+    Attributes:
+        graine_maitresse (int): Graine maîtresse (entre 0 et 2**512 - 1)
+        index_partie (int): Numéro de la partie (entre 0 et 2**64 - 1)
+        taille_morceau (int): Nombre d'octets calculés à chaque remplissage d'un tampon (un multiple de 8)
+        numero_flux (int): Numéro de la paire de flux (0 pour la source d'une partie; un autre numéro donne des
+            tirages indépendants de ceux de la partie)
+    """
+
+    def __init__(self, graine_maitresse, index_partie=0, taille_morceau=TAILLE_MORCEAU_COMPTEUR, numero_flux=0):
+        """
+        Constructeur de la classe SourceCompteur. Créer la source d'une partie coûte la même chose peu importe son
+        numéro: rien n'est rejoué.
+        Args:
+            graine_maitresse (int): Graine maîtresse (entre 0 et 2**512 - 1)
+            index_partie (int, optional): Numéro de la partie (entre 0 et 2**64 - 1)
+            taille_morceau (int, optional): Nombre d'octets calculés à chaque remplissage d'un tampon (un multiple de 8)
+            numero_flux (int, optional): Numéro de la paire de flux (entre 0 et 255)
+        """
+        self.graine_maitresse = graine_maitresse
+        self.index_partie = index_partie
+        self.taille_morceau = taille_morceau
+        self.numero_flux = numero_flux
+        prefixe = graine_maitresse.to_bytes(64, "little") + index_partie.to_bytes(8, "little") + bytes((numero_flux,))
+        self._hacheurs = {flux: shake_256(prefixe + flux) for flux in (_FLUX_DÉS, _FLUX_TIRAGES)}
+        self._compteurs = {_FLUX_DÉS: 0, _FLUX_TIRAGES: 0}
+        self._dés = b''
+        self._position_dés = 0
+        self._mots = []
+
+    def _morceau(self, flux):
+        """
+        Méthode qui calcule le prochain morceau d'un flux.
+        Args:
+            flux (bytes): Le flux (_FLUX_DÉS ou _FLUX_TIRAGES)
+        Returns:
+            bytes: Les octets du morceau
+        """
+        compteur = self._compteurs[flux]
+        self._compteurs[flux] = compteur + 1
+        hacheur = self._hacheurs[flux].copy()
+        hacheur.update(compteur.to_bytes(8, "little"))
+        return hacheur.digest(self.taille_morceau)
+
+    def _remplir_mots(self):
+        """
+        Méthode qui remplit le tampon des mots de 64 bits du flux des tirages (les octets sont lus en petit-boutiste,
+        peu importe la machine). Le tampon est gardé à l'envers pour que le prochain mot soit toujours le dernier.
+        """
+        mots = array("Q", self._morceau(_FLUX_TIRAGES))
+        if sys.byteorder == "big":
+            mots.byteswap()
+        mots.reverse()
+        self._mots = mots.tolist()
+
+    def rouler_dés(self, nombre):
+        """
+        Méthode qui lance plusieurs dés en prenant les prochaines valeurs du flux des dés (les octets de 252 à 255 sont
+        rejetés, comme pour SourceTamponnee).
+        Args:
+            nombre (int): Nombre de dés à lancer
+        Returns:
+            bytes: La valeur (entre 1 et 6) de chaque dé
+        """
+        debut = self._position_dés
+        fin = debut + nombre
+        if fin > len(self._dés):
+            morceaux = [self._dés[debut:]]
+            longueur = len(morceaux[0])
+            while longueur < nombre:
+                morceau = self._morceau(_FLUX_DÉS).translate(_VALEURS_DÉS, _OCTETS_REJETÉS)
+                morceaux.append(morceau)
+                longueur += len(morceau)
+            self._dés = b''.join(morceaux)
+            debut = 0
+            fin = nombre
+        self._position_dés = fin
+        return self._dés[debut:fin]
+
+    def entier(self, borne):
+        """
+        Méthode qui tire un entier uniformément entre 0 et borne - 1 (par rejet, à partir de mots de 64 bits).
+        Args:
+            borne (int): Nombre de valeurs possibles (entre 1 et 2**64)
+        Returns:
+            int: L'entier tiré
+        """
+        decalage = 64 - (borne - 1).bit_length()
+        while True:
+            if not self._mots:
+                self._remplir_mots()
+            valeur = self._mots.pop() >> decalage
+            if valeur < borne:
+                return valeur
+
+    def aleatoire(self):
+        """
+        Méthode qui tire un réel uniformément dans l'intervalle [0, 1[ (53 bits d'un mot de 64 bits).
+        Returns:
+            float: Le réel tiré
+        """
+        if not self._mots:
+            self._remplir_mots()
+        return (self._mots.pop() >> 11) * (1.0 / 9007199254740992.0)
+
+
+_source_par_defaut = SourceTamponnee()
+
+
+def obtenir_source(source=None):
+    """
+    Fonction qui retourne la source à utiliser: la source donnée, ou la source par défaut si aucune n'est donnée.
+    Args:
+        source (SourceAleatoire, optional): Source choisie par l'appelant
+    Returns:
+        SourceAleatoire: La source à utiliser
+    """
+    return _source_par_defaut if source is None else source
+
+
+def definir_source_par_defaut(source):
+    """
+    Fonction qui remplace la source par défaut de tout le programme.
+    Args:
+        source (SourceAleatoire): La nouvelle source par défaut
+    """
+    global _source_par_defaut
+    _source_par_defaut = source
@@ -0,0 +1,118 @@
+"""
+Module de la classe Anneau
+"""
+
+
+class Anneau:
+    """
+    Classe pour l'ordre de jeu des joueurs actifs autour de la table. Chaque joueur connaît son voisin dans chaque
+    sens (liste doublement chaînée circulaire, indexée par identifiant): trouver le joueur suivant dans un sens ou dans
+    l'autre et retirer un joueur se font en temps constant, sans copier de liste.
+
+    Un joueur retiré garde ses liens vers ses anciens voisins. On peut donc encore demander le joueur qui le suit: c'est
+    le premier joueur actif que l'on rencontre à partir de sa place.
+
+    Attributes:
+        tete (Joueur): Joueur actif qui a le plus petit rang autour de la table (None si l'anneau est vide)
+    """
+
+    __slots__ = ('_suivants', '_precedents', '_actifs', 'tete')
+
+    def __init__(self, joueurs=()):
+        """
+        Constructeur de la classe Anneau
+        Args:
+            joueurs (iterable, optional): Joueurs dans l'ordre croissant de leur place autour de la table
+        """
+        joueurs = list(joueurs)
+        self._suivants = {}
+        self._precedents = {}
+        self._actifs = set()
+        for precedent, joueur, suivant in zip(joueurs[-1:] + joueurs[:-1], joueurs, joueurs[1:] + joueurs[:1]):
+            self._suivants[joueur.identifiant] = suivant
+            self._precedents[joueur.identifiant] = precedent
+            self._actifs.add(joueur.identifiant)
+        self.tete = joueurs[0] if joueurs else None
+
+    def suivant(self, joueur, sens=1):
+        """
+        Méthode qui trouve le joueur actif qui suit un joueur dans un sens donné.
+        Args:
+            joueur (Joueur): Le joueur (actif ou déjà retiré)
+            sens (int, optional): Sens de la partie (1, croissant; -1, décroissant)
+        Returns:
+            Joueur: Le joueur suivant (le joueur lui-même s'il est le seul joueur actif)
+        Raises:
+            ValueError: Si l'anneau est vide
+        """
+        if not self._actifs:
+            raise ValueError("L'anneau ne contient aucun joueur actif.")
+        liens = self._suivants if sens == 1 else self._precedents
+        suivant = liens[joueur.identifiant]
+        while suivant.identifiant not in self._actifs:
+            suivant = liens[suivant.identifiant]
+        return suivant
+
+    def retirer(self, joueur):
+        """
+        Méthode qui retire un joueur de l'ordre de jeu. Retirer un joueur déjà retiré n'a aucun effet.
+        Args:
+            joueur (Joueur): Le joueur à retirer
+        """
+        identifiant = joueur.identifiant
+        if identifiant not in self._actifs:
+            return
+        self._actifs.remove(identifiant)
+        precedent = self._precedents[identifiant]
+        suivant = self._suivants[identifiant]
+        self._suivants[precedent.identifiant] = suivant
+        self._precedents[suivant.identifiant] = precedent
+        if self.tete is joueur:
+            self.tete = suivant if self._actifs else None
+
+    def copy(self):
+        """
+        Méthode qui retourne une copie indépendante de l'anneau.
+        Returns:
+            Anneau: La copie
+        """
+        copie = Anneau()
+        copie._suivants = self._suivants.copy()
+        copie._precedents = self._precedents.copy()
+        copie._actifs = self._actifs.copy()
+        copie.tete = self.tete
+        return copie
+
+    def __contains__(self, joueur):
+        """
+        Méthode qui indique si un joueur est encore actif.
+        Args:
+            joueur (Joueur): Le joueur
+        Returns:
+            bool: True si le joueur fait partie de l'ordre de jeu, False autrement
+        """
+        return joueur.identifiant in self._actifs
+
+    def __len__(self):
+        """
+        Méthode qui retourne le nombre de joueurs actifs.
+        Returns:
+            int: Nombre de joueurs actifs
+        """
+        return len(self._actifs)
+
+    def __iter__(self):
+        """
+        Méthode qui parcourt les joueurs actifs dans l'ordre croissant de leur place, à partir de la tête. Le joueur
+        qui vient d'être parcouru peut être retiré pendant le parcours.
+        Returns:
+            iterator: Les joueurs actifs
+        """
+        joueur = self.tete
+        for _ in range(len(self._actifs)):
+            yield joueur
+            if self._actifs:
+                joueur = self.suivant(joueur)
+
+    def __repr__(self):
+        return "Anneau({})".format([joueur.identifiant for joueur in self])
@@ -0,0 +1,371 @@
+"""
+Module du banc d'essai des performances du jeu pymafia.
+
+Chaque scénario répète une opération et mesure le temps de chaque répétition: on en tire le nombre d'opérations par
+seconde et les centiles de latence. Une seconde série de répétitions, plus courte, est faite sous tracemalloc pour
+mesurer le pic de mémoire. Les micro-scénarios mesurent une seule méthode (Dé.rouler, Joueur.retirer_dé, ...), les
+macro-scénarios une partie complète. Les parties mesurées ont un AffichageNul: aucun message n'est assemblé ni
+affiché et chaque question reçoit la même réponse.
+
+Les résultats sont écrits en JSON. En donnant les résultats d'une exécution précédente, les scénarios qui ont ralenti
+de plus d'un certain seuil sont signalés comme des régressions. Par exemple:
+
+    python -m pymafia.banc_essai --sortie avant.json
+    python -m pymafia.banc_essai --sortie apres.json --reference avant.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from pymafia.affichage import AffichageNul
+from pymafia.aleatoire import SourceTamponnee
+from pymafia.anneau import Anneau
+from pymafia.de import Dé
+from pymafia.joueur import Joueur
+from pymafia.partie import Partie
+from pymafia.partie_automatique import PartieAutomatique
+
+# Graine de toutes les sources de hasard du banc d'essai, pour que deux exécutions mesurent les mêmes parties
+GRAINE = 2024
+
+# Nombre de répétitions par défaut des micro-scénarios et des macro-scénarios
+REPETITIONS_MICRO = 100000
+REPETITIONS_MACRO = 500
+
+# Fraction des répétitions refaite sous tracemalloc pour mesurer le pic de mémoire
+FRACTION_MEMOIRE = 0.1
+
+# Centiles de latence rapportés
+CENTILES = (50, 90, 99)
+
+# Variation relative à partir de laquelle un ralentissement est une régression
+SEUIL_REGRESSION = 0.10
+
+
+def preparer_de_rouler():
+    """
+    Fonction qui prépare le scénario Dé.rouler.
+    Returns:
+        tuple: (préparation, opération); la préparation vaut None si l'opération n'en a pas besoin
+    """
+    source = SourceTamponnee(GRAINE)
+    dé = Dé()
+    return None, lambda: dé.rouler(source)
+
+
+def preparer_joueur_retirer_de():
+    """
+    Fonction qui prépare le scénario Joueur.retirer_dé: un joueur avec des dés lancés retire ses dés de valeur 1.
+    Returns:
+        tuple: (préparation, opération)
+    """
+    joueur = Joueur(1)
+    joueur.source = SourceTamponnee(GRAINE)
+
+    def preparation():
+        joueur.reinitialiser_dés()
+        joueur.rouler_dés()
+
+    return preparation, lambda: joueur.retirer_dé(1)
+
+
+def preparer_joueur_compter_1_et_6():
+    """
+    Fonction qui prépare le scénario Joueur.compter_1_et_6.
+    Returns:
+        tuple: (préparation, opération)
+    """
+    joueur = Joueur(1)
+    joueur.source = SourceTamponnee(GRAINE)
+    joueur.reinitialiser_dés()
+    return joueur.rouler_dés, joueur.compter_1_et_6
+
+
+def preparer_partie_determiner_joueur_suivant():
+    """
+    Fonction qui prépare le scénario Partie.determiner_joueur_suivant, à une table de 8 joueurs dont le joueur courant
+    change à chaque répétition.
+    Returns:
+        tuple: (préparation, opération)
+    """
+    partie = PartieAutomatique(8, SourceTamponnee(GRAINE))
+
+    def preparation():
+        partie.joueur_courant = partie.joueur_suivant
+
+    return preparation, partie.determiner_joueur_suivant
+
+
+def preparer_partie_jouer_un_tour():
+    """
+    Fonction qui prépare le scénario Partie.jouer_un_tour, à une table de 5 joueurs. Une nouvelle ronde commence
+    lorsque le joueur courant n'a plus de dé.
+    Returns:
+        tuple: (préparation, opération)
+    """
+    partie = Partie(5, 1, SourceTamponnee(GRAINE), AffichageNul())
+    partie.joueur_courant = partie.joueurs[0]
+    partie.determiner_joueur_suivant()
+    partie.reinitialiser_dés_joueurs()
+
+    def preparation():
+        if not partie.joueur_courant.dés:
+            partie.reinitialiser_dés_joueurs()
+
+    return preparation, partie.jouer_un_tour
+
+
+def preparer_partie_terminer_ronde():
+    """
+    Fonction qui prépare le scénario Partie.terminer_ronde, à une table de 5 joueurs: le joueur courant n'a plus de
+    dé, les autres en ont 5, et les scores sont remis à 100 avant chaque répétition.
+    Returns:
+        tuple: (préparation, opération)
+    """
+    partie = Partie(5, 1, SourceTamponnee(GRAINE), AffichageNul())
+
+    def preparation():
+        for joueur in partie.joueurs:
+            joueur.score = 100
+            joueur.reinitialiser_dés()
+        partie.joueurs_actifs = Anneau(partie.joueurs)
+        partie.joueur_courant = partie.joueurs[0]
+        partie.joueur_courant.retirer_dés()
+        partie.determiner_joueur_suivant()
+
+    return preparation, partie.terminer_ronde
+
+
+def preparer_partie(nombre_joueurs):
+    """
+    Fonction qui retourne la fonction de préparation d'un macro-scénario: une partie complète de Partie (avec un
+    joueur humain, qui reçoit toujours la réponse de l'AffichageNul).
+    Args:
+        nombre_joueurs (int): Nombre de joueurs de la partie
+    Returns:
+        function: La fonction qui prépare le scénario
+    """
+    def preparer():
+        source = SourceTamponnee(GRAINE)
+        parties = []
+
+        def preparation():
+            parties.append(Partie(nombre_joueurs, 1, source, AffichageNul()))
+
+        return preparation, lambda: parties.pop().jouer()
+
+    return preparer
+
+
+def preparer_partie_automatique(nombre_joueurs):
+    """
+    Fonction qui retourne la fonction de préparation d'un macro-scénario: une partie complète de PartieAutomatique.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs de la partie
+    Returns:
+        function: La fonction qui prépare le scénario
+    """
+    def preparer():
+        source = SourceTamponnee(GRAINE)
+        parties = []
+
+        def preparation():
+            parties.append(PartieAutomatique(nombre_joueurs, source))
+
+        return preparation, lambda: parties.pop().jouer()
+
+    return preparer
+
+
+# Scénarios du banc d'essai: nom -> (fonction de préparation, nombre de répétitions par défaut)
+SCENARIOS = {
+    "de_rouler": (preparer_de_rouler, REPETITIONS_MICRO),
+    "joueur_retirer_de": (preparer_joueur_retirer_de, REPETITIONS_MICRO),
+    "joueur_compter_1_et_6": (preparer_joueur_compter_1_et_6, REPETITIONS_MICRO),
+    "partie_determiner_joueur_suivant": (preparer_partie_determiner_joueur_suivant, REPETITIONS_MICRO),
+    "partie_jouer_un_tour": (preparer_partie_jouer_un_tour, REPETITIONS_MICRO),
+    "partie_terminer_ronde": (preparer_partie_terminer_ronde, REPETITIONS_MICRO // 10),
+}
+for _nombre_joueurs in (2, 5, 8):
+    SCENARIOS["partie_{}_joueurs".format(_nombre_joueurs)] = (preparer_partie(_nombre_joueurs), REPETITIONS_MACRO)
+    SCENARIOS["partie_automatique_{}_joueurs".format(_nombre_joueurs)] = (
+        preparer_partie_automatique(_nombre_joueurs), REPETITIONS_MACRO)
+
+
+def mesurer_latences(preparation, operation, repetitions):
+    """
+    Fonction qui répète une opération et mesure la durée de chaque répétition. La préparation n'est pas mesurée.
+    Args:
+        preparation (function): Fonction appelée avant chaque répétition (None si aucune)
+        operation (function): L'opération mesurée
+        repetitions (int): Nombre de répétitions
+    Returns:
+        list: Durée de chaque répétition, en nanosecondes
+    """
+    horloge = time.perf_counter_ns
+    latences = [0] * repetitions
+    for i in range(repetitions):
+        if preparation is not None:
+            preparation()
+        debut = horloge()
+        operation()
+        latences[i] = horloge() - debut
+    return latences
+
+
+def mesurer_memoire(preparation, operation, repetitions):
+    """
+    Fonction qui répète une opération sous tracemalloc et retourne le pic de mémoire allouée.
+    Args:
+        preparation (function): Fonction appelée avant chaque répétition (None si aucune)
+        operation (function): L'opération mesurée
+        repetitions (int): Nombre de répétitions
+    Returns:
+        int: Pic de mémoire, en octets
+    """
+    tracemalloc.start()
+    try:
+        mesurer_latences(preparation, operation, repetitions)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def centile(valeurs_triees, rang):
+    """
+    Fonction qui retourne un centile d'une liste de valeurs triées (méthode du rang le plus proche).
+    Args:
+        valeurs_triees (list): Les valeurs, en ordre croissant
+        rang (int): Le centile voulu, entre 0 et 100
+    Returns:
+        La valeur du centile
+    """
+    index = max(0, -(-rang * len(valeurs_triees) // 100) - 1)
+    return valeurs_triees[index]
+
+
+def executer_scenario(nom, repetitions=None):
+    """
+    Fonction qui exécute un scénario du banc d'essai.
+    Args:
+        nom (str): Nom du scénario (une clé de SCENARIOS)
+        repetitions (int, optional): Nombre de répétitions (celui du scénario par défaut)
+    Returns:
+        dict: Le résultat du scénario (opérations par seconde, centiles de latence et pic de mémoire)
+    """
+    preparer, repetitions_par_defaut = SCENARIOS[nom]
+    if repetitions is None:
+        repetitions = repetitions_par_defaut
+    latences = sorted(mesurer_latences(*preparer(), repetitions))
+    memoire = mesurer_memoire(*preparer(), max(1, int(repetitions * FRACTION_MEMOIRE)))
+    duree_totale = sum(latences)
+    resultat = {
+        "repetitions": repetitions,
+        "operations_par_seconde": repetitions * 1e9 / duree_totale if duree_totale else 0.0,
+        "latence_ns": {"p{}".format(rang): centile(latences, rang) for rang in CENTILES},
+        "memoire_max_octets": memoire,
+    }
+    resultat["latence_ns"]["max"] = latences[-1]
+    return resultat
+
+
+def executer(noms=None, facteur_repetitions=1.0):
+    """
+    Fonction qui exécute plusieurs scénarios.
+    Args:
+        noms (list, optional): Noms des scénarios à exécuter (tous par défaut)
+        facteur_repetitions (float, optional): Facteur appliqué au nombre de répétitions de chaque scénario
+    Returns:
+        dict: Les résultats, prêts à être écrits en JSON
+    """
+    if noms is None:
+        noms = list(SCENARIOS)
+    resultats = {}
+    for nom in noms:
+        repetitions = max(1, int(SCENARIOS[nom][1] * facteur_repetitions))
+        resultats[nom] = executer_scenario(nom, repetitions)
+    return {
+        "python": platform.python_version(),
+        "plateforme": platform.platform(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scenarios": resultats,
+    }
+
+
+def comparer(reference, actuel, seuil=SEUIL_REGRESSION):
+    """
+    Fonction qui compare deux exécutions du banc d'essai. Un scénario est en régression si son nombre d'opérations par
+    seconde a baissé ou si sa latence médiane a augmenté de plus du seuil.
+    Args:
+        reference (dict): Résultats de l'exécution de référence
+        actuel (dict): Résultats de l'exécution à évaluer
+        seuil (float, optional): Variation relative tolérée
+    Returns:
+        list: Pour chaque scénario présent dans les deux exécutions, un tuple (nom, opérations par seconde de
+            référence, opérations par seconde actuelles, variation relative, régression)
+    """
+    comparaisons = []
+    for nom, resultat in actuel["scenarios"].items():
+        if nom not in reference["scenarios"]:
+            continue
+        ancien = reference["scenarios"][nom]
+        variation = resultat["operations_par_seconde"] / ancien["operations_par_seconde"] - 1
+        mediane_avant = ancien["latence_ns"]["p50"]
+        mediane_apres = resultat["latence_ns"]["p50"]
+        regression = variation < -seuil or (mediane_avant > 0 and mediane_apres > mediane_avant * (1 + seuil))
+        comparaisons.append((nom, ancien["operations_par_seconde"], resultat["operations_par_seconde"], variation,
+                             regression))
+    return comparaisons
+
+
+def main(arguments=None):
+    """
+    Fonction principale du banc d'essai.
+    Args:
+        arguments (list, optional): Arguments de la ligne de commande (sys.argv par défaut)
+    Returns:
+        int: 1 si une régression est détectée, 0 autrement
+    """
+    analyseur = argparse.ArgumentParser(prog="python -m pymafia.banc_essai",
+                                        description="Banc d'essai des performances du jeu pymafia.")
+    analyseur.add_argument("scenarios", nargs="*", metavar="scenario",
+                           help="Scénarios à exécuter (tous par défaut): " + ", ".join(SCENARIOS))
+    analyseur.add_argument("--sortie", help="Fichier JSON où écrire les résultats")
+    analyseur.add_argument("--reference", help="Fichier JSON des résultats d'une exécution précédente")
+    analyseur.add_argument("--seuil", type=float, default=SEUIL_REGRESSION,
+                           help="Variation relative tolérée avant de signaler une régression")
+    analyseur.add_argument("--facteur", type=float, default=1.0,
+                           help="Facteur appliqué au nombre de répétitions de chaque scénario")
+    options = analyseur.parse_args(arguments)
+    for nom in options.scenarios:
+        if nom not in SCENARIOS:
+            analyseur.error("scénario inconnu: " + nom)
+
+    resultats = executer(options.scenarios or None, options.facteur)
+    for nom, resultat in resultats["scenarios"].items():
+        latence = resultat["latence_ns"]
+        print("{:34} {:>14,.0f} op/s   p50 {:>10,} ns   p99 {:>10,} ns   mémoire {:>10,} o".format(
+            nom, resultat["operations_par_seconde"], latence["p50"], latence["p99"], resultat["memoire_max_octets"]))
+    if options.sortie:
+        with open(options.sortie, "w", encoding="utf-8") as fichier:
+            json.dump(resultats, fichier, indent=2)
+
+    if not options.reference:
+        return 0
+    with open(options.reference, encoding="utf-8") as fichier:
+        reference = json.load(fichier)
+    regressions = 0
+    print()
+    for nom, avant, apres, variation, regression in comparer(reference, resultats, options.seuil):
+        regressions += regression
+        print("{:34} {:>14,.0f} -> {:>14,.0f} op/s   {:+7.1%}{}".format(
+            nom, avant, apres, variation, "   RÉGRESSION" if regression else ""))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
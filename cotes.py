@@ -0,0 +1,299 @@
+"""
+Module des tables de cotes de ronde du jeu pymafia.
+
+Pendant une ronde, la probabilité que chaque joueur gagne et la loi du nombre de dés qu'il lui restera en fin de ronde
+ne dépendent que du nombre de dés de chaque joueur actif, du joueur courant et du sens (voir SolveurRonde). Ces valeurs
+sont calculées une fois pour toutes, hors partie, pour chaque état canonique d'une table de 2 à nombre_joueurs_max
+joueurs, et écrites dans un fichier binaire compact. Pendant une partie, le fichier est lu par projection en mémoire
+(mmap): l'ouverture est immédiate et chaque consultation ne lit que la ligne de l'état demandé. Le nombre moyen de
+points qu'un joueur perdra (la somme de ses dés restants, au plus son score) est calculé à la consultation, à partir de
+cette loi et de la loi de la somme des dés (distributions.loi_somme_dés): le score n'a pas à faire partie de l'état.
+
+Les états canoniques d'une table de n joueurs (n nombres de dés dont la somme est au plus 5n) sont numérotés dans
+l'ordre lexicographique: le rang d'un état se calcule en n étapes à l'aide de coefficients binomiaux, sans index à
+charger. Chaque ligne contient la probabilité de victoire de chaque position de l'état, puis, pour chaque position, la
+probabilité de finir la ronde avec 0, 1, ..., 5n dés, en entiers non signés de 16 bits petit-boutistes (sur 65535). Le
+fichier commence par un en-tête: la signature, la version et le nombre maximal de joueurs.
+
+Pour construire le fichier (jusqu'à 5 joueurs: au-delà, le début d'une ronde dépasse la borne du solveur, voir
+solveur.ÉTATS_MAX). Les tables de 2 à 5 joueurs prennent environ 40 Mo; leur calcul prend environ 2 minutes et 400 Mo
+de mémoire, presque tout pour la table de 5 joueurs:
+
+    python -m pymafia.cotes --joueurs-max 5 cotes.bin
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from functools import lru_cache
+from math import comb
+
+from pymafia.distributions import loi_somme_dés
+from pymafia.solveur import JOUEURS_MAX, SolveurRonde, etat_canonique
+
+# Signature et version du format des fichiers de cotes
+SIGNATURE = b"PYMCOTES"
+VERSION = 2
+_ENTETE = struct.Struct("<8sHB5x")
+
+# Nombre de dés de chaque joueur au début d'une ronde
+DÉS_DÉPART = 5
+
+# Nombre maximal de joueurs des tables construites par défaut
+NOMBRE_JOUEURS_MAX = 5
+
+# Échelle des probabilités, écrites en entiers de 16 bits
+ÉCHELLE_PROBABILITÉ = 65535
+
+# Emplacement par défaut du fichier de cotes
+FICHIER_COTES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cotes.bin")
+
+# Plus grand nombre de joueurs à une table
+_JOUEURS_TABLE_MAX = 8
+
+# Coefficients binomiaux utilisés pour le rang des états: _BINOMES[a][b] = comb(a, b)
+_BINOMES = [[comb(a, b) for b in range(_JOUEURS_TABLE_MAX + 2)]
+            for a in range((DÉS_DÉPART + 1) * _JOUEURS_TABLE_MAX + 2)]
+
+
+def nombre_etats(nombre_joueurs):
+    """
+    Fonction qui compte les états canoniques d'une table: les suites de nombre_joueurs nombres de dés dont la somme
+    est au plus DÉS_DÉPART * nombre_joueurs.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs actifs
+    Returns:
+        int: Le nombre d'états
+    """
+    return comb((DÉS_DÉPART + 1) * nombre_joueurs, nombre_joueurs)
+
+
+def rang_etat(etat):
+    """
+    Fonction qui calcule le rang d'un état canonique parmi les états de sa table, dans l'ordre lexicographique. Les
+    états qui précèdent celui-ci à la position i sont comptés d'un coup (somme de coefficients binomiaux).
+    Args:
+        etat (tuple): Nombre de dés de chaque joueur actif, dans l'ordre de jeu à partir du joueur courant
+    Returns:
+        int: Le rang de l'état, entre 0 et nombre_etats(len(etat)) - 1
+    """
+    nombre = len(etat)
+    reste = DÉS_DÉPART * nombre
+    rang = 0
+    for position, dés in enumerate(etat):
+        suivants = nombre - position
+        rang += _BINOMES[reste + suivants][suivants] - _BINOMES[reste - dés + suivants][suivants]
+        reste -= dés
+    return rang
+
+
+def _etats(nombre_joueurs, reste):
+    """
+    Fonction génératrice des états d'une table dans l'ordre lexicographique (l'ordre de rang_etat).
+    Args:
+        nombre_joueurs (int): Nombre de positions à remplir
+        reste (int): Nombre de dés qu'on peut encore répartir
+    Returns:
+        generator: Les états (tuples)
+    """
+    if nombre_joueurs == 0:
+        yield ()
+        return
+    for dés in range(reste + 1):
+        for suite in _etats(nombre_joueurs - 1, reste - dés):
+            yield (dés,) + suite
+
+
+def _format_ligne(nombre_joueurs):
+    """
+    Fonction qui donne le format d'une ligne de la table d'un nombre de joueurs: la probabilité de victoire de chaque
+    position, puis la loi du nombre de dés restants de chaque position (de 0 à DÉS_DÉPART * nombre_joueurs dés).
+    Args:
+        nombre_joueurs (int): Nombre de joueurs
+    Returns:
+        struct.Struct: Le format de la ligne
+    """
+    return struct.Struct("<{}H".format(nombre_joueurs * (DÉS_DÉPART * nombre_joueurs + 2)))
+
+
+def _decalage_table(nombre_joueurs):
+    """
+    Fonction qui calcule la position dans le fichier de la première ligne de la table d'un nombre de joueurs.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs
+    Returns:
+        int: Le décalage en octets
+    """
+    return _ENTETE.size + sum(nombre_etats(nombre) * _format_ligne(nombre).size for nombre in range(2, nombre_joueurs))
+
+
+@lru_cache(maxsize=None)
+def points_perdus_moyens(nombre_dés, score):
+    """
+    Fonction qui calcule le nombre moyen de points qu'un perdant donne au gagnant en fin de ronde: la somme de ses dés,
+    au plus son score.
+    Args:
+        nombre_dés (int): Nombre de dés qui restent au perdant
+        score (int): Score du perdant
+    Returns:
+        float: L'espérance de min(somme des dés, score)
+    """
+    return sum(probabilite * min(somme, score) for somme, probabilite in enumerate(loi_somme_dés(nombre_dés)))
+
+
+def construire_tables(chemin, nombre_joueurs_max=NOMBRE_JOUEURS_MAX, solveur=None):
+    """
+    Fonction qui calcule les cotes de tous les états des tables de 2 à nombre_joueurs_max joueurs et qui les écrit dans
+    un fichier. Un état où le joueur courant n'a plus de dé est une fin de ronde: ce joueur gagne.
+    Args:
+        chemin (str): Chemin du fichier à écrire
+        nombre_joueurs_max (int, optional): Plus grand nombre de joueurs des tables (entre 2 et solveur.JOUEURS_MAX)
+        solveur (SolveurRonde, optional): Solveur à utiliser, qui calcule les lois (un nouveau solveur par défaut)
+    """
+    solveur = SolveurRonde(avec_lois=True) if solveur is None else solveur
+    with open(chemin, "wb") as fichier:
+        fichier.write(_ENTETE.pack(SIGNATURE, VERSION, nombre_joueurs_max))
+        for nombre in range(2, nombre_joueurs_max + 1):
+            ligne = _format_ligne(nombre)
+            largeur = DÉS_DÉPART * nombre + 1
+            lignes = []
+            for etat in _etats(nombre, DÉS_DÉPART * nombre):
+                if etat[0]:
+                    probabilites = solveur.resoudre(etat)[0]
+                    lois = solveur.lois_dés_restants(etat)
+                else:
+                    probabilites = (1.0,) + (0.0,) * (nombre - 1)
+                    lois = [(0.0,) * dés + (1.0,) for dés in etat]
+                valeurs = [round(probabilite * ÉCHELLE_PROBABILITÉ) for probabilite in probabilites]
+                for loi in lois:
+                    valeurs.extend(round(probabilite * ÉCHELLE_PROBABILITÉ) for probabilite in loi)
+                    valeurs.extend([0] * (largeur - len(loi)))
+                lignes.append(ligne.pack(*valeurs))
+            fichier.write(b"".join(lignes))
+            solveur.cache.clear()
+            solveur.lois.clear()
+
+
+class TablesCotes:
+    """
+    Classe qui lit un fichier de cotes par projection en mémoire.
+
+    Attributes:
+        chemin (str): Chemin du fichier
+        nombre_joueurs_max (int): Plus grand nombre de joueurs des tables du fichier
+    """
+
+    def __init__(self, chemin=FICHIER_COTES):
+        """
+        Constructeur de la classe TablesCotes. Seul l'en-tête est lu; les lignes le seront au besoin.
+        Args:
+            chemin (str, optional): Chemin du fichier de cotes
+        Raises:
+            ValueError: Si le fichier n'est pas un fichier de cotes valide
+        """
+        self.chemin = chemin
+        with open(chemin, "rb") as fichier:
+            self._projection = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._projection) < _ENTETE.size:
+            self.fermer()
+            raise ValueError("Le fichier {} n'est pas un fichier de cotes.".format(chemin))
+        signature, version, self.nombre_joueurs_max = _ENTETE.unpack_from(self._projection)
+        if signature != SIGNATURE or version != VERSION:
+            self.fermer()
+            raise ValueError("Le fichier {} n'est pas un fichier de cotes (version {}).".format(chemin, VERSION))
+        if len(self._projection) != _decalage_table(self.nombre_joueurs_max + 1):
+            self.fermer()
+            raise ValueError("Le fichier de cotes {} est incomplet.".format(chemin))
+        self._tables = {nombre: (_decalage_table(nombre), _format_ligne(nombre))
+                        for nombre in range(2, self.nombre_joueurs_max + 1)}
+
+    def couvre(self, nombre_joueurs):
+        """
+        Méthode qui indique si le fichier contient la table d'un nombre de joueurs.
+        Args:
+            nombre_joueurs (int): Nombre de joueurs actifs
+        Returns:
+            bool: True si les cotes de cette table sont disponibles, False autrement
+        """
+        return nombre_joueurs in self._tables
+
+    def cotes(self, etat):
+        """
+        Méthode qui lit les cotes d'un état canonique.
+        Args:
+            etat (tuple): Nombre de dés de chaque joueur actif, dans l'ordre de jeu à partir du joueur courant
+        Returns:
+            list, list: Probabilité de victoire et loi du nombre de dés restants en fin de ronde (probabilité de finir
+                avec 0, 1, ..., DÉS_DÉPART * len(etat) dés), par position dans l'état
+        """
+        nombre = len(etat)
+        decalage, ligne = self._tables[nombre]
+        valeurs = ligne.unpack_from(self._projection, decalage + ligne.size * rang_etat(etat))
+        largeur = DÉS_DÉPART * nombre + 1
+        return ([valeur / ÉCHELLE_PROBABILITÉ for valeur in valeurs[:nombre]],
+                [[valeur / ÉCHELLE_PROBABILITÉ for valeur in valeurs[debut:debut + largeur]]
+                 for debut in range(nombre, len(valeurs), largeur)])
+
+    def cotes_partie(self, partie):
+        """
+        Méthode qui lit les cotes de la ronde en cours d'une partie: le joueur courant est celui qui va lancer ses dés.
+        En fin de ronde, chaque perdant joue les dés qui lui restent et donne leur somme au gagnant, au plus son score.
+        Le nombre moyen de points perdus est donc l'espérance de min(somme des dés, score), sur la loi du nombre de dés
+        restants lue dans la table (voir points_perdus_moyens); il est nul pour le gagnant.
+        Args:
+            partie (Partie): La partie
+        Returns:
+            dict: Pour l'identifiant de chaque joueur actif, le tuple (probabilité de gagner la ronde, nombre moyen de
+                points perdus en fin de ronde); None si le fichier ne couvre pas une table de ce nombre de joueurs
+        """
+        joueurs = list(partie.joueurs_actifs)
+        if not self.couvre(len(joueurs)):
+            return None
+        index_courant = [joueur.identifiant for joueur in joueurs].index(partie.joueur_courant.identifiant)
+        etat, ordre = etat_canonique([len(joueur) for joueur in joueurs], index_courant, partie.sens)
+        probabilites, lois = self.cotes(etat)
+        resultat = {}
+        for position, index in enumerate(ordre):
+            joueur = joueurs[index]
+            points = sum(probabilite * points_perdus_moyens(dés, joueur.score)
+                         for dés, probabilite in enumerate(lois[position]) if probabilite)
+            resultat[joueur.identifiant] = (probabilites[position], points)
+        return resultat
+
+    def fermer(self):
+        """
+        Méthode qui ferme la projection du fichier.
+        """
+        self._projection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type_exception, exception, trace):
+        self.fermer()
+
+
+def main(arguments=None):
+    """
+    Fonction principale de la construction d'un fichier de cotes.
+    Args:
+        arguments (list, optional): Arguments de la ligne de commande (sys.argv par défaut)
+    Returns:
+        int: Code de sortie du programme
+    """
+    analyseur = argparse.ArgumentParser(prog="python -m pymafia.cotes",
+                                        description="Construit le fichier des cotes de ronde du jeu pymafia.")
+    analyseur.add_argument("fichier", nargs="?", default=FICHIER_COTES, help="Fichier de cotes à écrire")
+    analyseur.add_argument("--joueurs-max", type=int, default=NOMBRE_JOUEURS_MAX,
+                           help="Plus grand nombre de joueurs des tables (entre 2 et {})".format(JOUEURS_MAX))
+    options = analyseur.parse_args(arguments)
+    if not 2 <= options.joueurs_max <= JOUEURS_MAX:
+        analyseur.error("le nombre de joueurs doit être entre 2 et {}".format(JOUEURS_MAX))
+    construire_tables(options.fichier, options.joueurs_max)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,7 +2,10 @@
 Module de la classe Dé
 """
 
-import random
+from pymafia.aleatoire import obtenir_source
+
+# Caractère représentant chaque valeur de dé (⚀ ⚁ ⚂ ⚃ ⚄ ⚅, codes unicode 9856 à 9861)
+CARACTÈRES = {valeur: chr(9855 + valeur) for valeur in range(1, 7)}
 
 
 class Dé:
@@ -13,6 +16,8 @@ class Dé:
         valeur (int): valeur actuelle du dé
     """
 
+    __slots__ = ('valeur',)
+
     def __init__(self, valeur=1):
         """
         Constructeur de la classe Dé
@@ -21,11 +26,13 @@ class Dé:
         """
         self.valeur = valeur
 
-    def rouler(self):
+    def rouler(self, source=None):
         """
         Méthode qui modifie la valeur actuelle du dé en choisissant aléatoirement une valeur entre 1 et 6.
+        Args:
+            source (SourceAleatoire, optional): Source de hasard à utiliser (la source par défaut si absente)
         """
-        self.valeur = random.randint(1, 6)
+        self.valeur = obtenir_source(source).rouler()
 
     def __str__(self):
         """
@@ -36,18 +43,7 @@ class Dé:
         Returns:
             str: Le caractère représentant l'objet
         """
-        if self.valeur == 1:
-            return str(chr(9856))
-        elif self.valeur == 2:
-            return str(chr(9857))
-        elif self.valeur == 3:
-            return str(chr(9858))
-        elif self.valeur == 4:
-            return str(chr(9859))
-        elif self.valeur == 5:
-            return str(chr(9860))
-        elif self.valeur == 6:
-            return str(chr(9861))
+        return CARACTÈRES[self.valeur]
 
      # code de test unitaire
     def __repr__(self):
@@ -0,0 +1,251 @@
+"""
+Module des lois de probabilité précalculées du jeu pymafia.
+
+Dans une partie sans affichage, la valeur de chaque dé n'est jamais vue: seuls comptent le nombre de 1 et le nombre de
+6 d'un lancer pendant la ronde, et le total des dés qu'un perdant joue en fin de ronde. Ce module calcule d'avance la
+loi exacte de ces grandeurs pour chaque nombre de dés possible et permet d'en tirer une valeur en temps constant avec
+la méthode des alias (Walker, Vose), à partir d'un seul réel de la source de hasard. Les valeurs tirées suivent
+exactement la même loi que si chaque dé était lancé.
+
+Le tirage d'une table d'alias n'utilise qu'une partie du réel tiré: ce qui en reste, une fois la case et la valeur
+choisies, est encore uniforme et indépendant de la valeur. Il sert à tirer le total d'un lancer sachant son nombre de
+1 et de 6 (pour un journal) sans rien prendre de plus à la source: une partie donne le même résultat avec ou sans
+journal.
+"""
+
+from functools import lru_cache
+
+from pymafia.aleatoire import obtenir_source
+from pymafia.solveur import issues_lancer
+
+# Plus grand nombre de dés qu'un joueur peut avoir en main: tous les dés de la table (5 dés pour chacun des 8 joueurs)
+MAX_DÉS = 5 * 8
+
+
+def construire_table_alias(probabilites):
+    """
+    Fonction qui construit la table d'alias de Vose d'une loi discrète. Pour tirer une issue, on choisit une case i
+    uniformément, puis on garde i avec la probabilité seuils[i] ou on prend alias[i] autrement.
+    Args:
+        probabilites (list): Probabilité de chaque issue (la somme doit être 1)
+    Returns:
+        list, list: Les seuils et les alias de chaque case
+    """
+    nombre = len(probabilites)
+    seuils = [p * nombre for p in probabilites]
+    alias = list(range(nombre))
+    petits = [i for i, seuil in enumerate(seuils) if seuil < 1.0]
+    grands = [i for i, seuil in enumerate(seuils) if seuil >= 1.0]
+    while petits and grands:
+        petit = petits.pop()
+        grand = grands.pop()
+        alias[petit] = grand
+        seuils[grand] -= 1.0 - seuils[petit]
+        if seuils[grand] < 1.0:
+            petits.append(grand)
+        else:
+            grands.append(grand)
+    for reste in petits + grands:
+        seuils[reste] = 1.0
+    return seuils, alias
+
+
+class TableAlias:
+    """
+    Classe pour le tirage en temps constant d'une valeur selon une loi discrète (méthode des alias). La loi est répartie
+    en autant de cases que de valeurs; chaque case contient sa propre valeur avec une certaine probabilité et sa valeur
+    alias sinon.
+
+    Attributes:
+        valeurs (tuple): Valeur de chaque case
+        seuils (tuple): Probabilité de garder la valeur de chaque case plutôt que son alias
+        alias (tuple): Valeur alias de chaque case
+    """
+
+    __slots__ = ('valeurs', 'seuils', 'alias')
+
+    def __init__(self, probabilites, valeurs=None):
+        """
+        Constructeur de la classe TableAlias (voir construire_table_alias)
+        Args:
+            probabilites (list): Probabilité de chaque valeur (leur somme doit valoir 1)
+            valeurs (list, optional): Les valeurs possibles (par défaut, 0, 1, 2, ...)
+        """
+        valeurs = tuple(range(len(probabilites))) if valeurs is None else tuple(valeurs)
+        seuils, alias = construire_table_alias(probabilites)
+        self.valeurs = valeurs
+        self.seuils = tuple(seuils)
+        self.alias = tuple(valeurs[case] for case in alias)
+
+    def tirer(self, source=None):
+        """
+        Méthode qui tire une valeur selon la loi de la table: un seul réel choisit à la fois la case et, avec sa
+        partie fractionnaire, la valeur de la case ou son alias.
+        Args:
+            source (SourceAleatoire, optional): Source de hasard à utiliser (la source par défaut si absente)
+        Returns:
+            La valeur tirée
+        """
+        position = obtenir_source(source).aleatoire() * len(self.valeurs)
+        case = int(position)
+        if position - case < self.seuils[case]:
+            return self.valeurs[case]
+        return self.alias[case]
+
+    def tirer_avec_reste(self, source=None):
+        """
+        Méthode qui tire une valeur comme tirer (avec le même réel, donc la même valeur) et qui retourne aussi ce qui
+        reste du réel: la partie fractionnaire ramenée à [0, 1[ sur l'intervalle qui a choisi la valeur. Ce reste est
+        uniforme et indépendant de la valeur tirée.
+        Args:
+            source (SourceAleatoire, optional): Source de hasard à utiliser (la source par défaut si absente)
+        Returns:
+            La valeur tirée et le reste (float)
+        """
+        position = obtenir_source(source).aleatoire() * len(self.valeurs)
+        case = int(position)
+        fraction = position - case
+        seuil = self.seuils[case]
+        if fraction < seuil:
+            return self.valeurs[case], fraction / seuil
+        return self.alias[case], (fraction - seuil) / (1.0 - seuil)
+
+    def choisir(self, reel):
+        """
+        Méthode qui donne la valeur de la table qui correspond à un réel uniforme de [0, 1[ (voir tirer).
+        Args:
+            reel (float): Le réel
+        Returns:
+            La valeur choisie
+        """
+        position = reel * len(self.valeurs)
+        case = int(position)
+        if position - case < self.seuils[case]:
+            return self.valeurs[case]
+        return self.alias[case]
+
+    def __len__(self):
+        """
+        Méthode qui retourne le nombre de valeurs de la table.
+        Returns:
+            int: Nombre de valeurs
+        """
+        return len(self.valeurs)
+
+
+def loi_somme_dés(nombre_dés, faces=range(1, 7)):
+    """
+    Fonction qui calcule la loi exacte de la somme de plusieurs dés dont les faces sont équiprobables (convolutions
+    successives du nombre de façons d'obtenir chaque somme).
+    Args:
+        nombre_dés (int): Nombre de dés
+        faces (range, optional): Valeurs possibles de chaque dé (de 1 à 6 par défaut)
+    Returns:
+        list: Probabilité de chaque somme, de 0 à max(faces) * nombre_dés (les sommes impossibles ont une probabilité
+            nulle)
+    """
+    facons = [1]
+    for _ in range(nombre_dés):
+        suivantes = [0] * (len(facons) + faces[-1])
+        for somme, nombre in enumerate(facons):
+            if nombre:
+                for valeur in faces:
+                    suivantes[somme + valeur] += nombre
+        facons = suivantes
+    total = len(faces) ** nombre_dés
+    return [nombre / total for nombre in facons]
+
+
+def _table_somme_dés(nombre_dés, faces=range(1, 7)):
+    """
+    Fonction qui construit la table d'alias de la somme de plusieurs dés, sans les sommes impossibles.
+    Args:
+        nombre_dés (int): Nombre de dés
+        faces (range, optional): Valeurs possibles de chaque dé (de 1 à 6 par défaut)
+    Returns:
+        TableAlias: La table
+    """
+    loi = loi_somme_dés(nombre_dés, faces)
+    sommes = range(faces[0] * nombre_dés, faces[-1] * nombre_dés + 1)
+    return TableAlias([loi[somme] for somme in sommes], sommes)
+
+
+# Table d'alias de la somme des dés pour chaque nombre de dés, de 0 à MAX_DÉS
+TABLES_SOMME_DÉS = tuple(_table_somme_dés(nombre_dés) for nombre_dés in range(MAX_DÉS + 1))
+
+
+def tirer_somme_dés(nombre_dés, source=None):
+    """
+    Fonction qui tire la somme de plusieurs dés d'un seul coup, avec la même loi que si chaque dé était lancé.
+    Args:
+        nombre_dés (int): Nombre de dés (entre 0 et MAX_DÉS)
+        source (SourceAleatoire, optional): Source de hasard à utiliser (la source par défaut si absente)
+    Returns:
+        int: La somme des dés
+    """
+    if nombre_dés == 0:
+        return 0
+    return TABLES_SOMME_DÉS[nombre_dés].tirer(source)
+
+
+def _table_1_et_6(nombre_dés):
+    """
+    Fonction qui construit la table d'alias de la loi conjointe du nombre de 1 et du nombre de 6 d'un lancer (loi
+    multinomiale, voir solveur.issues_lancer).
+    Args:
+        nombre_dés (int): Nombre de dés lancés
+    Returns:
+        TableAlias: La table, dont les valeurs sont des tuples (nombre de 1, nombre de 6)
+    """
+    issues = issues_lancer(nombre_dés)
+    return TableAlias([probabilite for probabilite, _, _ in issues],
+                      [(nombre_1, nombre_6) for _, nombre_1, nombre_6 in issues])
+
+
+# Table d'alias du nombre de 1 et du nombre de 6 d'un lancer pour chaque nombre de dés, de 0 à MAX_DÉS
+TABLES_1_ET_6 = tuple(_table_1_et_6(nombre_dés) for nombre_dés in range(MAX_DÉS + 1))
+
+
+def tirer_1_et_6(nombre_dés, source=None):
+    """
+    Fonction qui tire d'un seul coup le nombre de 1 et le nombre de 6 d'un lancer de plusieurs dés, avec la même loi
+    que si chaque dé était lancé.
+    Args:
+        nombre_dés (int): Nombre de dés lancés (entre 0 et MAX_DÉS)
+        source (SourceAleatoire, optional): Source de hasard à utiliser (la source par défaut si absente)
+    Returns:
+        int, int: Nombre de dés de valeur 1 et nombre de dés de valeur 6
+    """
+    return TABLES_1_ET_6[nombre_dés].tirer(source)
+
+
+@lru_cache(maxsize=None)
+def _table_somme_autres(nombre_dés):
+    """
+    Fonction qui construit (une seule fois par nombre de dés) la table d'alias de la somme de dés qui ne sont ni des 1
+    ni des 6, c'est-à-dire dont les valeurs sont équiprobables entre 2 et 5.
+    Args:
+        nombre_dés (int): Nombre de dés
+    Returns:
+        TableAlias: La table
+    """
+    return _table_somme_dés(nombre_dés, range(2, 6))
+
+
+def tirer_lancer(nombre_dés, source=None):
+    """
+    Fonction qui tire le nombre de 1, le nombre de 6 et le total d'un lancer de plusieurs dés. Le nombre de 1 et de 6
+    est celui que donnerait tirer_1_et_6 avec la même source (le même réel est tiré); le total des autres dés, entre 2
+    et 5, est tiré du reste de ce réel.
+    Args:
+        nombre_dés (int): Nombre de dés lancés (entre 0 et MAX_DÉS)
+        source (SourceAleatoire, optional): Source de hasard à utiliser (la source par défaut si absente)
+    Returns:
+        int, int, int: Nombre de dés de valeur 1, nombre de dés de valeur 6 et total des dés
+    """
+    (nombre_1, nombre_6), reste = TABLES_1_ET_6[nombre_dés].tirer_avec_reste(source)
+    autres = nombre_dés - nombre_1 - nombre_6
+    total = nombre_1 + 6 * nombre_6
+    if autres:
+        total += _table_somme_autres(autres).choisir(reste)
+    return nombre_1, nombre_6, total
@@ -0,0 +1,206 @@
+"""
+Module de l'instrumentation des parties.
+
+L'instrumentation est facultative: une partie qui n'est pas instrumentée n'exécute aucune instruction de plus. Pour
+instrumenter une partie, la fonction instrumenter remplace, sur l'objet partie seulement, chacune des méthodes de
+PHASES par une version chronométrée (la classe Partie n'est jamais modifiée), et installe l'instrumentation comme
+observateur de la partie pour compter les événements du jeu. Le journal de la partie n'est pas touché, et
+l'instrumentation ne fait qu'observer: une partie instrumentée se déroule exactement comme la même partie sans
+instrumentation.
+
+Une même instrumentation peut être partagée par plusieurs parties: ses compteurs cumulent alors toutes les tables. Le
+temps d'une phase inclut celui des phases qu'elle appelle (par exemple, jouer_un_tour inclut gerer_dés_1_et_6).
+"""
+
+import json
+import time
+from bisect import bisect_left
+
+from pymafia import journal as evenements
+
+# Méthodes de Partie chronométrées par l'instrumentation
+PHASES = ("preparer_une_partie", "trouver_premier_joueur", "jouer_un_tour", "gerer_dés_1_et_6", "terminer_ronde",
+          "retirer_joueurs_sans_points")
+
+# Événements du jeu comptés par l'instrumentation
+COMPTEURS = ("lancers", "dés_retirés", "dés_passés", "eliminations", "bris_egalite", "relances_bris_egalite")
+
+# Bornes supérieures (en secondes) des classes de l'histogramme des durées de chaque phase
+BORNES_HISTOGRAMME = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1)
+_BORNES_NS = tuple(round(borne * 1e9) for borne in BORNES_HISTOGRAMME)
+
+
+class Instrumentation:
+    """
+    Classe qui accumule les mesures d'une ou de plusieurs parties instrumentées.
+
+    Attributes:
+        appels (dict): Nombre d'appels de chaque phase
+        durees (dict): Durée cumulée de chaque phase, en nanosecondes
+        durees_max (dict): Plus longue durée d'un appel de chaque phase, en nanosecondes
+        histogrammes (dict): Pour chaque phase, le nombre d'appels dans chaque classe de BORNES_HISTOGRAMME (plus une
+            dernière classe pour les appels plus longs)
+        compteurs (dict): Nombre d'occurrences de chaque événement de COMPTEURS
+    """
+
+    def __init__(self):
+        """
+        Constructeur de la classe Instrumentation
+        """
+        self.appels = dict.fromkeys(PHASES, 0)
+        self.durees = dict.fromkeys(PHASES, 0)
+        self.durees_max = dict.fromkeys(PHASES, 0)
+        self.histogrammes = {phase: [0] * (len(_BORNES_NS) + 1) for phase in PHASES}
+        self.compteurs = dict.fromkeys(COMPTEURS, 0)
+
+    def chronometrer(self, phase, methode):
+        """
+        Méthode qui retourne une version chronométrée d'une méthode liée à une partie.
+        Args:
+            phase (str): Nom de la phase (un élément de PHASES)
+            methode (method): La méthode à chronométrer
+        Returns:
+            function: La méthode chronométrée
+        """
+        horloge = time.perf_counter_ns
+        appels = self.appels
+        durees = self.durees
+        durees_max = self.durees_max
+        histogramme = self.histogrammes[phase]
+
+        def methode_chronometree(*args, **kwargs):
+            debut = horloge()
+            try:
+                return methode(*args, **kwargs)
+            finally:
+                duree = horloge() - debut
+                appels[phase] += 1
+                durees[phase] += duree
+                if duree > durees_max[phase]:
+                    durees_max[phase] = duree
+                histogramme[bisect_left(_BORNES_NS, duree)] += 1
+
+        return methode_chronometree
+
+    def enregistrer(self, type_evenement, joueur=0, a=0, b=0, valeur=0):
+        """
+        Méthode qui compte un événement du jeu. Elle a la même signature que JournalBinaire.enregistrer, ce qui
+        permet d'installer l'instrumentation comme observateur d'une partie (voir Partie.enregistrer).
+        Args:
+            type_evenement (int): Type de l'événement (une des constantes du module journal)
+            joueur (int, optional): Identifiant du joueur concerné
+            a (int, optional): Premier champ de l'événement
+            b (int, optional): Deuxième champ de l'événement
+            valeur (int, optional): Valeur de l'événement
+        """
+        compteurs = self.compteurs
+        if type_evenement == evenements.LANCER:
+            compteurs["lancers"] += 1
+            compteurs["dés_retirés"] += a
+            compteurs["dés_passés"] += b
+        elif type_evenement == evenements.LANCER_FIN_DE_RONDE or type_evenement == evenements.PREMIER_LANCER:
+            compteurs["lancers"] += 1
+        elif type_evenement == evenements.ELIMINATION:
+            compteurs["eliminations"] += 1
+        elif type_evenement == evenements.BRIS_ÉGALITÉ:
+            compteurs["bris_egalite"] += 1
+            compteurs["relances_bris_egalite"] += a
+
+    def instantane(self):
+        """
+        Méthode qui retourne une copie des mesures accumulées jusqu'à maintenant.
+        Returns:
+            dict: Les mesures, sous la forme {"phases": {phase: {...}}, "compteurs": {...}}
+        """
+        phases = {}
+        for phase in PHASES:
+            phases[phase] = {
+                "appels": self.appels[phase],
+                "duree_ns": self.durees[phase],
+                "duree_max_ns": self.durees_max[phase],
+                "histogramme": list(self.histogrammes[phase]),
+            }
+        return {"phases": phases, "compteurs": dict(self.compteurs)}
+
+    def fusionner(self, autre):
+        """
+        Méthode qui ajoute à cette instrumentation les mesures d'une autre (par exemple, celle d'un autre processus).
+        Args:
+            autre (Instrumentation): L'instrumentation à fusionner
+        """
+        for phase in PHASES:
+            self.appels[phase] += autre.appels[phase]
+            self.durees[phase] += autre.durees[phase]
+            self.durees_max[phase] = max(self.durees_max[phase], autre.durees_max[phase])
+            histogramme = self.histogrammes[phase]
+            for classe, nombre in enumerate(autre.histogrammes[phase]):
+                histogramme[classe] += nombre
+        for compteur in COMPTEURS:
+            self.compteurs[compteur] += autre.compteurs[compteur]
+
+    def exporter_json(self):
+        """
+        Méthode qui exporte un instantané des mesures en JSON.
+        Returns:
+            str: Le document JSON
+        """
+        instantane = self.instantane()
+        instantane["bornes_histogramme_s"] = list(BORNES_HISTOGRAMME)
+        return json.dumps(instantane, ensure_ascii=False)
+
+    def exporter_prometheus(self, prefixe="pymafia"):
+        """
+        Méthode qui exporte un instantané des mesures au format texte de Prometheus: un histogramme des durées de
+        chaque phase (en secondes) et un compteur par événement du jeu.
+        Args:
+            prefixe (str, optional): Préfixe du nom des métriques
+        Returns:
+            str: Les métriques
+        """
+        lignes = ["# HELP {}_phase_duree_secondes Durée des phases de la partie.".format(prefixe),
+                  "# TYPE {}_phase_duree_secondes histogram".format(prefixe)]
+        for phase in PHASES:
+            cumul = 0
+            for borne, nombre in zip(BORNES_HISTOGRAMME, self.histogrammes[phase]):
+                cumul += nombre
+                lignes.append('{}_phase_duree_secondes_bucket{{phase="{}",le="{:g}"}} {}'.format(
+                    prefixe, phase, borne, cumul))
+            lignes.append('{}_phase_duree_secondes_bucket{{phase="{}",le="+Inf"}} {}'.format(
+                prefixe, phase, self.appels[phase]))
+            lignes.append('{}_phase_duree_secondes_sum{{phase="{}"}} {:.9f}'.format(
+                prefixe, phase, self.durees[phase] / 1e9))
+            lignes.append('{}_phase_duree_secondes_count{{phase="{}"}} {}'.format(prefixe, phase, self.appels[phase]))
+        for compteur in COMPTEURS:
+            nom = "{}_{}_total".format(prefixe, compteur.replace("é", "e"))
+            lignes.append("# TYPE {} counter".format(nom))
+            lignes.append("{} {}".format(nom, self.compteurs[compteur]))
+        return "\n".join(lignes) + "\n"
+
+
+def instrumenter(partie, instrumentation=None):
+    """
+    Fonction qui instrumente une partie: ses phases sont chronométrées et ses événements sont comptés.
+    Args:
+        partie (Partie): La partie à instrumenter
+        instrumentation (Instrumentation, optional): Instrumentation où accumuler les mesures (une nouvelle par défaut)
+    Returns:
+        Instrumentation: L'instrumentation de la partie
+    """
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+    for phase in PHASES:
+        setattr(partie, phase, instrumentation.chronometrer(phase, getattr(partie, phase)))
+    partie.observateur = instrumentation
+    return instrumentation
+
+
+def desinstrumenter(partie):
+    """
+    Fonction qui retire l'instrumentation d'une partie: les méthodes de la classe sont remises en place et la partie
+    n'a plus d'observateur.
+    Args:
+        partie (Partie): La partie instrumentée
+    """
+    for phase in PHASES:
+        partie.__dict__.pop(phase, None)
+    partie.observateur = None
@@ -2,7 +2,7 @@
 Module de la classe Joueur
 """
 
-from pymafia.de import Dé
+from pymafia.main_de_des import MainDeDés
 
 
 class Joueur:
@@ -11,27 +11,69 @@ class Joueur:
 
     Attributes:
         identifiant (int): Numéro d'identification du joueur
-        dés (liste): liste contenant les dés du joueur
+        dés (MainDeDés): main contenant les dés du joueur (le nombre de dés de chaque valeur)
         score (int): nombre de points du joueur
+        source (SourceAleatoire): source de hasard des lancers du joueur (None pour la source par défaut)
     """
 
-    def __init__(self, identifiant, dés=[Dé(), Dé()], score=100):
+    __slots__ = ('identifiant', '_main', 'score', 'source')
+
+    def __init__(self, identifiant, dés=None, score=100):
         """
         Constructeur de la classe Joueur.
         Note: Lorsqu'un joueur est créé en début de partie, on lui donne deux dés.
         Args:
             identifiant (int): Identifiant du joueur à être instancié
+            dés (list, optional): Dés (objets Dé) donnés au joueur. Ils sont copiés dans la main du joueur. Par défaut,
+                le joueur reçoit deux dés de valeur 1.
+            score (int, optional): Score de départ du joueur
         """
         self.identifiant = identifiant
-        self.dés = dés
+        if dés is None:
+            self._main = MainDeDés()
+            self._main.reinitialiser(2)
+        else:
+            self.dés = dés
         self.score = score
+        self.source = None
+
+    @property
+    def dés(self):
+        """
+        Main contenant les dés du joueur.
+        Returns:
+            MainDeDés: Les dés du joueur
+        """
+        return self._main
+
+    @dés.setter
+    def dés(self, dés):
+        """
+        Remplace les dés du joueur. Une liste d'objets Dé est convertie en main.
+        Args:
+            dés (MainDeDés ou list): Les nouveaux dés du joueur
+        """
+        self._main = dés if isinstance(dés, MainDeDés) else MainDeDés(dés)
+
+    def cloner(self):
+        """
+        Méthode qui retourne une copie du joueur (de la même classe) dont la main partage ses dés avec celle du joueur
+        jusqu'à la première modification de l'une ou de l'autre (voir MainDeDés.partager).
+        Returns:
+            Joueur: La copie
+        """
+        copie = object.__new__(type(self))
+        copie.identifiant = self.identifiant
+        copie._main = self._main.partager()
+        copie.score = self.score
+        copie.source = self.source
+        return copie
 
     def rouler_dés(self):
         """
         Méthode qui modifie aléatoirement la valeur de tous les dés du joueur.
         """
-        for chaque_dé in self.dés:
-            chaque_dé.rouler()
+        self._main.rouler(self.source)
 
     def compter_1_et_6(self):
         """
@@ -40,14 +82,8 @@ class Joueur:
             nombre_1 (int): Nombre de dés du joueur ayant la valeur 1
             nombre_6 (int): Nombre de dés du joueur ayant la valeur 6
         """
-        nombre_1 = 0
-        nombre_6 = 0
-        for chaque_dé in self.dés:
-            if chaque_dé.valeur == 1:
-                nombre_1 += 1
-            elif chaque_dé.valeur == 6:
-                nombre_6 += 1
-        return nombre_1, nombre_6
+        faces = self._main.faces
+        return faces[1], faces[6]
 
     def retirer_dé(self, valeur):
         """
@@ -55,29 +91,25 @@ class Joueur:
         Args:
             valeur (int): Nombre entre 1 et 6 du ou des dés à retirer
         """
-        copie_self_list = self.dés.copy()
-        self.dés.clear()
-        for chaque_dé in copie_self_list:
-            if chaque_dé.valeur != valeur:
-                self.dés.append(chaque_dé)
+        self._main.retirer(valeur)
 
     def retirer_dés(self):
         """
         Méthode qui retire tous les dés du joueurs
         """
-        self.dés.clear()
+        self._main.vider()
 
     def ajouter_un_dé(self):
         """
         Méthode qui ajoute un dé de valeur 6 aux dés du joueur
         """
-        self.dés.append(Dé(6))
+        self._main.ajouter(6)
 
     def reinitialiser_dés(self):
         """
         Méthode qui réinitialise les dés du joueur en lui remettant 5 dés en main.
         """
-        self.dés = [Dé(), Dé(), Dé(), Dé(), Dé()]
+        self._main.reinitialiser(5)
 
     def calculer_points(self):
         """
@@ -85,10 +117,7 @@ class Joueur:
         Returns:
             int: Total de la valeur des dés
         """
-        total_valeur_dé = 0
-        for element in self.dés:
-            total_valeur_dé += element.valeur
-        return total_valeur_dé
+        return self._main.total
 
     def ajuster_score_en_fin_de_tour(self):
         """
@@ -99,9 +128,10 @@ class Joueur:
         Returns:
             int: Nombre de points perdus par le joueur en fin de tour et donnés au gagnant.
         """
-        if Joueur.calculer_points(self) <= self.score:
-            self.score -= Joueur.calculer_points(self)
-            return Joueur.calculer_points(self)
+        points = self._main.total
+        if points <= self.score:
+            self.score -= points
+            return points
         else:
             nombre_point_donner_gagnant = self.score
             self.score = 0
@@ -109,15 +139,36 @@ class Joueur:
 
     def __eq__(self, other):
         """
-        Méthode qui définit l'opérateur == pour la classe joueur
+        Méthode qui définit l'opérateur == pour la classe joueur. Deux joueurs sont le même joueur s'ils ont le même
+        identifiant, peu importe leurs dés et leur score (voir meme_etat pour comparer l'état complet).
         Args:
             other (Joueur): autre objet joueur pour la comparaison
         Returns:
             bool: True si c'est le même joueur, False autrement
         """
-        if not isinstance(other, type(self)):
-            return False
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, Joueur):
+            return NotImplemented
+        return self.identifiant == other.identifiant
+
+    def __hash__(self):
+        """
+        Méthode qui permet d'utiliser un joueur comme clé de dictionnaire ou dans un ensemble. Le hash ne dépend que de
+        l'identifiant, qui ne doit donc pas changer pendant que le joueur est dans un dictionnaire ou un ensemble.
+        Returns:
+            int: Le hash de l'identifiant
+        """
+        return hash(self.identifiant)
+
+    def meme_etat(self, other):
+        """
+        Méthode qui compare l'état complet de deux joueurs: leur type, leur identifiant, leur score et leurs dés.
+        Args:
+            other (Joueur): autre objet joueur pour la comparaison
+        Returns:
+            bool: True si les deux joueurs sont dans le même état, False autrement
+        """
+        return (type(self) is type(other) and self.identifiant == other.identifiant and self.score == other.score
+                and self._main == other._main)
 
     def __ne__(self, other):
         """
@@ -135,7 +186,7 @@ class Joueur:
         Returns:
             int: Nombre de dés du joueur
         """
-        return len(self.dés)
+        return self._main.nombre
 
     def __str__(self):
         """
@@ -144,7 +195,7 @@ class Joueur:
         Returns:
             str: Représentation des dés du joueur.
         """
-        return ' '.join(str(d) for d in self.dés)
+        return str(self._main)
 
     ## code de test unitaire
     def __repr__(self):
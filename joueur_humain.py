@@ -13,6 +13,8 @@ class JoueurHumain(Joueur):
     joueurs ordinateurs.
     """
 
+    __slots__ = ()
+
     def __init__(self, identifiant):
         """
         Constructeur de la classe JoueurHumain
@@ -2,14 +2,17 @@
 Module de la classe JoueurOrdinateur
 """
 
+from pymafia.aleatoire import obtenir_source
 from pymafia.joueur import Joueur
-from random import randrange
 
 
 class JoueurOrdinateur(Joueur):
     """
     Classe pour un joueur ordinateur au jeu pymafia. Cette classe hérite de la classe Joueur.
     """
+
+    __slots__ = ()
+
     def __init__(self, identifiant):
         """
         Constructeur de la classe JoueurOrdinateur
@@ -18,15 +21,19 @@ class JoueurOrdinateur(Joueur):
         """
         super().__init__(identifiant)
 
-    def demander_sens(self):
+    def demander_sens(self, partie=None):
         """
-        Méthode qui fait un choix aléatoire pour le sens du jeu (ordre croissant ou décroissant).
+        Méthode qui fait un choix aléatoire pour le sens du jeu (ordre croissant ou décroissant). Le sens est choisi au
+        début de la partie, lorsque tous les scores sont égaux: les deux sens se valent alors toujours.
+        Args:
+            partie (Partie, optional): La partie dont le joueur est le premier joueur (ignorée ici; une stratégie qui
+                hérite de cette classe peut s'en servir)
         Returns:
             tuple: contenant un entier (1 pour la gauche (croissant) ou -1 pour la droite (décroissant))
             et un string (message qui indique le choix du joueur ordinateur,
             par exemple: Le joueur X choisit de jouer vers la gauche (en ordre croissant)).
         """
-        orientation = randrange(-1, 2, 2)
+        orientation = obtenir_source(self.source).choisir_sens()
         if orientation == 1:
             message = ("Le joueur " + str(self.identifiant)
                        + " à choisit de jouer vers la gauche (en ordre croissant)")
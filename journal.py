@@ -0,0 +1,239 @@
+"""
+Module du journal des événements d'une partie.
+
+Une partie à laquelle on donne un journal (attribut journal de Partie) y enregistre chacune de ses actions. Le journal
+binaire écrit chaque événement sur 6 octets: le type d'événement, l'identifiant du joueur concerné, deux petits
+entiers a et b et une valeur signée sur 16 bits. Un tour complet (le lancer, les dés de valeur 1 retirés et les dés de
+valeur 6 passés au joueur suivant) tient dans un seul événement LANCER. Le journal JSON écrit un objet JSON par
+ligne, avec le nom des champs. Les deux journaux accumulent les événements dans un tampon et ne les écrivent dans le
+fichier qu'en gros morceaux; le fichier n'est jamais relu ni modifié, seulement allongé.
+
+Dans le journal binaire, l'identifiant du joueur et les champs a et b tiennent sur un octet. Comme un joueur peut avoir
+en main les 5 dés de chaque joueur, le nombre de dés de valeur 1 ou 6 d'un lancer ne tient sur un octet que pour une
+partie d'au plus JOUEURS_MAX_BINAIRE joueurs (51); le journal binaire refuse dès son début une partie plus grande. Un
+journal binaire interrompu au milieu d'une écriture se lit jusqu'au dernier événement complet.
+"""
+
+import json
+import struct
+import warnings
+
+# Types d'événements. Pour chacun, les champs (joueur, a, b, valeur) ont le sens donné dans CHAMPS.
+DEBUT_PARTIE = 1
+PREMIER_LANCER = 2
+BRIS_ÉGALITÉ = 3
+PREMIER_JOUEUR = 4
+SENS = 5
+DEBUT_RONDE = 6
+LANCER = 7
+LANCER_FIN_DE_RONDE = 8
+TRANSFERT_POINTS = 9
+ELIMINATION = 10
+FIN_RONDE = 11
+FIN_PARTIE = 12
+
+# Nom de chaque type d'événement et nom de ses champs a, b et valeur (None pour un champ inutilisé)
+CHAMPS = {
+    DEBUT_PARTIE: ("debut_partie", "nombre_joueurs", "nombre_joueurs_humains", None),
+    PREMIER_LANCER: ("premier_lancer", None, None, "total"),
+    BRIS_ÉGALITÉ: ("bris_egalite", "nombre_joueurs", None, None),
+    PREMIER_JOUEUR: ("premier_joueur", None, None, None),
+    SENS: ("sens", None, None, "sens"),
+    DEBUT_RONDE: ("debut_ronde", None, None, "ronde"),
+    LANCER: ("lancer", "nombre_1", "nombre_6", "total"),
+    LANCER_FIN_DE_RONDE: ("lancer_fin_de_ronde", "nombre_des", None, "total"),
+    TRANSFERT_POINTS: ("transfert_points", None, "gagnant", "points"),
+    ELIMINATION: ("elimination", None, None, None),
+    FIN_RONDE: ("fin_ronde", None, None, "points"),
+    FIN_PARTIE: ("fin_partie", None, None, "nombre_rondes"),
+}
+_TYPES_PAR_NOM = {champs[0]: type_evenement for type_evenement, champs in CHAMPS.items()}
+
+# Format binaire d'un événement: type, joueur, a, b (octets non signés) et valeur (entier signé de 16 bits)
+FORMAT_EVENEMENT = struct.Struct("<BBBBh")
+_ECRIRE_EVENEMENT = FORMAT_EVENEMENT.pack_into
+
+# Plus grand nombre de joueurs d'une partie du journal binaire: le nombre de dés d'un joueur (au plus 5 par joueur de la
+# partie) doit tenir sur un octet
+JOUEURS_MAX_BINAIRE = 255 // 5
+
+# Taille du tampon (en octets pour le journal binaire, en lignes pour le journal JSON) avant une écriture
+TAILLE_TAMPON = 1 << 16
+
+
+class JournalBinaire:
+    """
+    Classe pour un journal d'événements au format binaire de taille fixe (6 octets par événement).
+
+    Attributes:
+        fichier (file): Fichier binaire ouvert en écriture (ou en ajout)
+        taille_tampon (int): Nombre d'octets accumulés avant une écriture dans le fichier
+    """
+
+    def __init__(self, fichier, taille_tampon=TAILLE_TAMPON):
+        """
+        Constructeur de la classe JournalBinaire
+        Args:
+            fichier (file): Fichier binaire ouvert en écriture (ou en ajout)
+            taille_tampon (int, optional): Nombre d'octets accumulés avant une écriture dans le fichier
+        """
+        self.fichier = fichier
+        self.taille_tampon = taille_tampon - taille_tampon % FORMAT_EVENEMENT.size
+        self._tampon = bytearray(self.taille_tampon)
+        self._position = 0
+
+    def enregistrer(self, type_evenement, joueur=0, a=0, b=0, valeur=0):
+        """
+        Méthode qui ajoute un événement au journal. L'événement est écrit directement à sa place dans le tampon.
+        Args:
+            type_evenement (int): Type de l'événement (une des constantes du module)
+            joueur (int, optional): Identifiant du joueur concerné (0 si aucun)
+            a (int, optional): Premier champ de l'événement (entre 0 et 255)
+            b (int, optional): Deuxième champ de l'événement (entre 0 et 255)
+            valeur (int, optional): Valeur de l'événement (entre -32768 et 32767)
+        Raises:
+            ValueError: Si l'événement est le début d'une partie de plus de JOUEURS_MAX_BINAIRE joueurs
+        """
+        if type_evenement == DEBUT_PARTIE and a > JOUEURS_MAX_BINAIRE:
+            raise ValueError("Le journal binaire est limité aux parties de {} joueurs ou moins.".format(
+                JOUEURS_MAX_BINAIRE))
+        _ECRIRE_EVENEMENT(self._tampon, self._position, type_evenement, joueur, a, b, valeur)
+        self._position += 6
+        if self._position == self.taille_tampon:
+            self.vider()
+
+    def vider(self):
+        """
+        Méthode qui écrit dans le fichier les événements accumulés dans le tampon.
+        """
+        if self._position:
+            with memoryview(self._tampon) as vue:
+                self.fichier.write(vue[:self._position])
+            self._position = 0
+
+    def fermer(self):
+        """
+        Méthode qui écrit les derniers événements et vide le tampon du fichier. Le fichier lui-même n'est pas fermé.
+        """
+        self.vider()
+        self.fichier.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+
+class JournalJson:
+    """
+    Classe pour un journal d'événements au format JSON, à raison d'un objet par ligne. Par exemple:
+    {"evenement":"lancer","joueur":2,"nombre_1":1,"nombre_6":2,"total":17}
+
+    Attributes:
+        fichier (file): Fichier texte ouvert en écriture (ou en ajout)
+        taille_tampon (int): Nombre de lignes accumulées avant une écriture dans le fichier
+    """
+
+    def __init__(self, fichier, taille_tampon=TAILLE_TAMPON):
+        """
+        Constructeur de la classe JournalJson
+        Args:
+            fichier (file): Fichier texte ouvert en écriture (ou en ajout)
+            taille_tampon (int, optional): Nombre de lignes accumulées avant une écriture dans le fichier
+        """
+        self.fichier = fichier
+        self.taille_tampon = taille_tampon
+        self._lignes = []
+
+    def enregistrer(self, type_evenement, joueur=0, a=0, b=0, valeur=0):
+        """
+        Méthode qui ajoute un événement au journal.
+        Args:
+            type_evenement (int): Type de l'événement (une des constantes du module)
+            joueur (int, optional): Identifiant du joueur concerné (0 si aucun)
+            a (int, optional): Premier champ de l'événement
+            b (int, optional): Deuxième champ de l'événement
+            valeur (int, optional): Valeur de l'événement
+        """
+        nom, nom_a, nom_b, nom_valeur = CHAMPS[type_evenement]
+        evenement = {"evenement": nom}
+        if joueur:
+            evenement["joueur"] = joueur
+        if nom_a is not None:
+            evenement[nom_a] = a
+        if nom_b is not None:
+            evenement[nom_b] = b
+        if nom_valeur is not None:
+            evenement[nom_valeur] = valeur
+        self._lignes.append(json.dumps(evenement, separators=(",", ":")))
+        if len(self._lignes) >= self.taille_tampon:
+            self.vider()
+
+    def vider(self):
+        """
+        Méthode qui écrit dans le fichier les événements accumulés dans le tampon.
+        """
+        if self._lignes:
+            self._lignes.append("")
+            self.fichier.write("\n".join(self._lignes))
+            self._lignes.clear()
+
+    def fermer(self):
+        """
+        Méthode qui écrit les derniers événements et vide le tampon du fichier. Le fichier lui-même n'est pas fermé.
+        """
+        self.vider()
+        self.fichier.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+
+def lire_journal_binaire(fichier, taille_morceau=TAILLE_TAMPON):
+    """
+    Fonction qui lit les événements d'un journal binaire. Un journal tronqué (par exemple, par un arrêt au milieu
+    d'une écriture) est lu jusqu'à son dernier événement complet; les octets qui restent sont signalés par un
+    avertissement.
+    Args:
+        fichier (file): Fichier binaire ouvert en lecture
+        taille_morceau (int, optional): Nombre d'octets lus à la fois (arrondi à un nombre entier d'événements)
+    Returns:
+        iterator: Les événements, sous forme de tuples (type, joueur, a, b, valeur)
+    """
+    taille = FORMAT_EVENEMENT.size
+    taille_morceau = max(taille_morceau - taille_morceau % taille, taille)
+    reste = b''
+    while True:
+        morceau = fichier.read(taille_morceau)
+        if not morceau:
+            break
+        if reste:
+            morceau = reste + morceau
+        fin = len(morceau) - len(morceau) % taille
+        yield from FORMAT_EVENEMENT.iter_unpack(memoryview(morceau)[:fin])
+        reste = morceau[fin:]
+    if reste:
+        warnings.warn("Le journal binaire est tronqué: les {} derniers octets ne forment pas un événement "
+                      "complet.".format(len(reste)), RuntimeWarning)
+
+
+def lire_journal_json(fichier):
+    """
+    Fonction qui lit les événements d'un journal JSON.
+    Args:
+        fichier (file): Fichier texte ouvert en lecture
+    Returns:
+        iterator: Les événements, sous forme de tuples (type, joueur, a, b, valeur)
+    """
+    for ligne in fichier:
+        if not ligne.strip():
+            continue
+        evenement = json.loads(ligne)
+        type_evenement = _TYPES_PAR_NOM[evenement["evenement"]]
+        _, nom_a, nom_b, nom_valeur = CHAMPS[type_evenement]
+        yield (type_evenement, evenement.get("joueur", 0), evenement.get(nom_a, 0), evenement.get(nom_b, 0),
+               evenement.get(nom_valeur, 0))
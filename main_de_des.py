@@ -0,0 +1,260 @@
+"""
+Module de la classe MainDeDés
+"""
+
+from pymafia.aleatoire import obtenir_source
+from pymafia.de import CARACTÈRES, Dé
+
+# Valeurs possibles d'un dé
+FACES = range(1, 7)
+
+
+class MainDeDés:
+    """
+    Classe pour l'ensemble des dés d'un joueur. Plutôt que de garder un objet Dé par dé, la main garde le nombre de
+    dés de chaque valeur ainsi que le nombre total de dés et la somme de leurs valeurs. Ces deux totaux sont mis à jour
+    à chaque modification, ce qui permet de compter, de retirer et d'ajouter des dés en temps constant.
+
+    La main se souvient aussi de l'ordre des dés (l'ordre du dernier lancer, auquel les dés ajoutés sont mis à la fin,
+    comme dans une liste de dés), pour que son affichage et son parcours suivent l'ordre du lancer. Tant que cet
+    ordre est l'ordre croissant des valeurs (par exemple après reinitialiser, ou lorsque seuls des 6 sont ajoutés), il
+    n'est pas gardé et ne coûte rien.
+
+    Une main obtenue avec la méthode partager utilise la même liste faces que la main d'origine, tant que ni l'une ni
+    l'autre n'est modifiée: la main qui est modifiée en premier copie alors ses faces (copie sur écriture).
+
+    Attributes:
+        faces (list): faces[v] est le nombre de dés de valeur v (l'index 0 n'est pas utilisé)
+        nombre (int): Nombre total de dés
+        total (int): Somme des valeurs des dés
+    """
+
+    __slots__ = ('faces', 'nombre', 'total', '_partagee', '_ordre')
+
+    # Une main est modifiable: elle ne peut pas servir de clé de dictionnaire
+    __hash__ = None
+
+    def __init__(self, dés=()):
+        """
+        Constructeur de la classe MainDeDés
+        Args:
+            dés (iterable, optional): Dés (objets Dé) à mettre dans la main
+        """
+        self.faces = [0] * 7
+        self.nombre = 0
+        self.total = 0
+        self._partagee = False
+        self._ordre = None
+        for dé in dés:
+            self.ajouter(dé.valeur)
+
+    def rouler(self, source=None):
+        """
+        Méthode qui roule tous les dés de la main: chaque dé prend une valeur aléatoire entre 1 et 6. Les valeurs de
+        tous les dés sont obtenues d'un seul coup de la source de hasard.
+        Args:
+            source (SourceAleatoire, optional): Source de hasard à utiliser (la source par défaut si absente)
+        """
+        lancer = obtenir_source(source).rouler_dés(self.nombre)
+        if self._partagee:
+            self._detacher()
+        faces = self.faces
+        faces[1] = lancer.count(1)
+        faces[2] = lancer.count(2)
+        faces[3] = lancer.count(3)
+        faces[4] = lancer.count(4)
+        faces[5] = lancer.count(5)
+        faces[6] = lancer.count(6)
+        self.total = sum(lancer)
+        self._ordre = lancer
+
+    def ajouter(self, valeur, nombre=1):
+        """
+        Méthode qui ajoute des dés d'une certaine valeur à la main.
+        Args:
+            valeur (int): Valeur entre 1 et 6 des dés à ajouter
+            nombre (int, optional): Nombre de dés à ajouter
+        """
+        if self._partagee:
+            self._detacher()
+        if self._ordre is not None:
+            self._ordre += bytes((valeur,)) * nombre
+        elif valeur != 6 and any(self.faces[valeur + 1:]):
+            self._ordre = self._ordre_croissant() + bytes((valeur,)) * nombre
+        self.faces[valeur] += nombre
+        self.nombre += nombre
+        self.total += valeur * nombre
+
+    def retirer(self, valeur):
+        """
+        Méthode qui retire tous les dés ayant une certaine valeur.
+        Args:
+            valeur (int): Valeur entre 1 et 6 des dés à retirer
+        Returns:
+            int: Nombre de dés retirés
+        """
+        if self._partagee:
+            self._detacher()
+        nombre = self.faces[valeur]
+        if nombre and self._ordre is not None:
+            self._ordre = self._ordre.replace(bytes((valeur,)), b'')
+        self.faces[valeur] = 0
+        self.nombre -= nombre
+        self.total -= valeur * nombre
+        return nombre
+
+    def vider(self):
+        """
+        Méthode qui retire tous les dés de la main.
+        """
+        if self._partagee:
+            self.faces = [0] * 7
+            self._partagee = False
+        else:
+            self.faces[:] = (0, 0, 0, 0, 0, 0, 0)
+        self.nombre = 0
+        self.total = 0
+        self._ordre = None
+
+    def reinitialiser(self, nombre, valeur=1):
+        """
+        Méthode qui remplace le contenu de la main par un certain nombre de dés de même valeur.
+        Args:
+            nombre (int): Nombre de dés de la nouvelle main
+            valeur (int, optional): Valeur des dés (1 par défaut, comme un nouveau Dé)
+        """
+        self.vider()
+        self.ajouter(valeur, nombre)
+
+    def copy(self):
+        """
+        Méthode qui retourne une copie indépendante de la main.
+        Returns:
+            MainDeDés: La copie
+        """
+        copie = MainDeDés()
+        copie.faces[:] = self.faces
+        copie.nombre = self.nombre
+        copie.total = self.total
+        copie._ordre = self._ordre
+        return copie
+
+    def partager(self):
+        """
+        Méthode qui retourne une copie de la main qui partage ses faces avec la main d'origine jusqu'à la première
+        modification de l'une ou de l'autre (copie sur écriture).
+        Returns:
+            MainDeDés: La copie
+        """
+        copie = MainDeDés.__new__(MainDeDés)
+        copie.faces = self.faces
+        copie.nombre = self.nombre
+        copie.total = self.total
+        copie._ordre = self._ordre
+        copie._partagee = self._partagee = True
+        return copie
+
+    def _detacher(self):
+        """
+        Méthode qui donne à la main sa propre copie des faces avant une modification.
+        """
+        self.faces = self.faces.copy()
+        self._partagee = False
+
+    def _ordre_croissant(self):
+        """
+        Méthode qui retourne la valeur de chaque dé de la main, en ordre croissant.
+        Returns:
+            bytes: Les valeurs des dés
+        """
+        return b''.join(bytes((valeur,)) * self.faces[valeur] for valeur in FACES)
+
+    def instantane(self):
+        """
+        Méthode qui retourne le nombre de dés de chaque valeur sous une forme compacte et immuable. L'ordre des dés
+        n'en fait pas partie: une main restaurée parcourt ses dés en ordre croissant de valeur.
+        Returns:
+            tuple: Le nombre de dés de chaque valeur (l'index 0 n'est pas utilisé)
+        """
+        return tuple(self.faces)
+
+    def restaurer(self, instantane):
+        """
+        Méthode qui remplace le contenu de la main par celui d'un instantané.
+        Args:
+            instantane (tuple): Instantané retourné par la méthode instantane
+        """
+        self.faces = list(instantane)
+        self.nombre = sum(instantane)
+        self.total = sum(valeur * nombre for valeur, nombre in enumerate(instantane))
+        self._partagee = False
+        self._ordre = None
+
+    def append(self, dé):
+        """
+        Méthode qui ajoute un objet Dé à la main, comme pour une liste de dés.
+        Args:
+            dé (Dé): Le dé à ajouter
+        """
+        self.ajouter(dé.valeur)
+
+    def clear(self):
+        """
+        Méthode qui retire tous les dés, comme pour une liste de dés.
+        """
+        self.vider()
+
+    def __len__(self):
+        """
+        Méthode qui retourne le nombre de dés de la main.
+        Returns:
+            int: Nombre de dés
+        """
+        return self.nombre
+
+    def __bool__(self):
+        """
+        Méthode qui indique si la main contient au moins un dé.
+        Returns:
+            bool: True si la main n'est pas vide, False autrement
+        """
+        return self.nombre > 0
+
+    def __iter__(self):
+        """
+        Méthode qui parcourt les dés de la main dans l'ordre du lancer (voir la classe). Un objet Dé est créé pour
+        chaque dé parcouru.
+        Returns:
+            iterator: Les dés de la main
+        """
+        ordre = self._ordre_croissant() if self._ordre is None else self._ordre
+        for valeur in ordre:
+            yield Dé(valeur)
+
+    def __eq__(self, other):
+        """
+        Méthode qui définit l'opérateur == pour la classe MainDeDés. Deux mains sont égales si elles ont le même
+        nombre de dés de chaque valeur. Une main peut aussi être comparée à une liste d'objets Dé.
+        Args:
+            other (MainDeDés ou list): autre main pour la comparaison
+        Returns:
+            bool: True si les deux mains contiennent les mêmes dés, False autrement
+        """
+        if isinstance(other, MainDeDés):
+            return self.faces == other.faces
+        if isinstance(other, list):
+            return self.faces == MainDeDés(other).faces
+        return NotImplemented
+
+    def __str__(self):
+        """
+        Méthode qui retourne une représentation de la main en chaîne de caractères, dans l'ordre du lancer. Par
+        exemple, '⚃ ⚀ ⚃'.
+        Returns:
+            str: Les caractères représentant les dés de la main
+        """
+        ordre = self._ordre_croissant() if self._ordre is None else self._ordre
+        return ' '.join([CARACTÈRES[valeur] for valeur in ordre])
+
+    def __repr__(self):
+        return str(self)
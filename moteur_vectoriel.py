@@ -0,0 +1,272 @@
+"""
+Module de la classe MoteurVectoriel
+
+Ce module simule plusieurs parties de pymafia en parallèle à l'aide de tableaux NumPy. Chaque partie est une ligne des
+tableaux et chaque colonne correspond à un siège. Ce module nécessite NumPy.
+"""
+
+import numpy as np
+
+from pymafia.distributions import MAX_DÉS, TABLES_1_ET_6
+from pymafia.partie import RONDEMAX
+
+# Nombre de dés donnés à chaque joueur au début d'une ronde (voir Joueur.reinitialiser_dés)
+NOMBRE_DÉS_DÉPART = 5
+# Score de départ de chaque joueur (voir Joueur.__init__)
+SCORE_DÉPART = 100
+
+
+def construire_table_lancers(nombre_dés_max):
+    """
+    Fonction qui rassemble en tableaux NumPy les tables d'alias de TABLES_1_ET_6 (module distributions) pour un lancer
+    de k dés, k entre 0 et nombre_dés_max. Une issue est le couple (nombre de 1, nombre de 6). Les issues de k dés
+    occupent les cases debuts[k] à debuts[k] + tailles[k] - 1 des tables, et l'alias de chaque case est l'index d'une
+    case des mêmes tables.
+    Args:
+        nombre_dés_max (int): Plus grand nombre de dés qu'un joueur peut avoir en main (au plus MAX_DÉS)
+    Returns:
+        dict: Les tables NumPy "debuts", "tailles", "seuils", "alias", "nombre_1" et "nombre_6"
+    Raises:
+        ValueError: Si nombre_dés_max dépasse MAX_DÉS
+    """
+    if nombre_dés_max > MAX_DÉS:
+        raise ValueError("Un joueur ne peut pas avoir plus de {} dés en main.".format(MAX_DÉS))
+    debuts = []
+    tailles = []
+    seuils = []
+    alias = []
+    nombres_1 = []
+    nombres_6 = []
+    for table in TABLES_1_ET_6[:nombre_dés_max + 1]:
+        debut = len(seuils)
+        cases = {issue: debut + case for case, issue in enumerate(table.valeurs)}
+        debuts.append(debut)
+        tailles.append(len(table))
+        seuils.extend(table.seuils)
+        alias.extend(cases[issue] for issue in table.alias)
+        nombres_1.extend(nombre_1 for nombre_1, _ in table.valeurs)
+        nombres_6.extend(nombre_6 for _, nombre_6 in table.valeurs)
+    return {
+        "debuts": np.array(debuts, dtype=np.intp),
+        "tailles": np.array(tailles, dtype=np.float64),
+        "seuils": np.array(seuils),
+        "alias": np.array(alias, dtype=np.intp),
+        "nombre_1": np.array(nombres_1, dtype=np.int16),
+        "nombre_6": np.array(nombres_6, dtype=np.int16),
+    }
+
+
+class ResultatsLot:
+    """
+    Classe qui regroupe les résultats d'un lot de parties simulées par le MoteurVectoriel.
+
+    Attributes:
+        scores (numpy.ndarray): Scores finaux, une ligne par partie et une colonne par siège
+        gagnants (numpy.ndarray): Masque booléen des gagnants (plus d'un par ligne seulement s'il y a égalité)
+        nombre_rondes (numpy.ndarray): Nombre de rondes jouées dans chaque partie
+        premiers_joueurs (numpy.ndarray): Siège du premier joueur de chaque partie
+        sens (numpy.ndarray): Sens de chaque partie (1, croissant; -1, décroissant)
+    """
+
+    def __init__(self, scores, gagnants, nombre_rondes, premiers_joueurs, sens):
+        """
+        Constructeur de la classe ResultatsLot
+        Args:
+            scores (numpy.ndarray): Scores finaux des parties
+            gagnants (numpy.ndarray): Masque des gagnants des parties
+            nombre_rondes (numpy.ndarray): Nombre de rondes jouées par partie
+            premiers_joueurs (numpy.ndarray): Siège du premier joueur de chaque partie
+            sens (numpy.ndarray): Sens de chaque partie
+        """
+        self.scores = scores
+        self.gagnants = gagnants
+        self.nombre_rondes = nombre_rondes
+        self.premiers_joueurs = premiers_joueurs
+        self.sens = sens
+
+    def __len__(self):
+        """
+        Méthode qui retourne le nombre de parties du lot.
+        Returns:
+            int: Nombre de parties
+        """
+        return len(self.nombre_rondes)
+
+
+class MoteurVectoriel:
+    """
+    Classe qui simule un lot de parties de pymafia en même temps. Toutes les parties non terminées avancent d'un tour
+    à chaque étape: les dés du joueur courant de chaque partie sont roulés ensemble, les dés de valeur 1 sont retirés,
+    les dés de valeur 6 sont passés au joueur suivant et les rondes terminées sont pointées ensemble. Les règles sont
+    celles de Partie.jouer_une_ronde et de Partie.terminer_ronde, avec des joueurs ordinateurs à tous les sièges.
+
+    Attributes:
+        nombre_joueurs (int): Nombre de sièges à chaque table
+        nombre_parties (int): Nombre de parties simulées
+        generateur (numpy.random.Generator): Source de hasard des lancers
+        dés (numpy.ndarray): Nombre de dés de chaque siège
+        scores (numpy.ndarray): Score de chaque siège
+        actifs (numpy.ndarray): Masque des sièges qui ont encore des points
+        courant (numpy.ndarray): Siège du joueur courant de chaque partie
+        sens (numpy.ndarray): Sens de chaque partie (1, croissant; -1, décroissant)
+        ronde (numpy.ndarray): Numéro de la ronde actuelle de chaque partie
+        terminees (numpy.ndarray): Masque des parties terminées
+    """
+
+    def __init__(self, nombre_joueurs, nombre_parties, generateur=None):
+        """
+        Constructeur de la classe MoteurVectoriel
+        Args:
+            nombre_joueurs (int): Nombre de joueurs à chaque table (entre 2 et 8)
+            nombre_parties (int): Nombre de parties à simuler
+            generateur (numpy.random.Generator, optional): Générateur à utiliser (un nouveau par défaut)
+        """
+        self.nombre_joueurs = nombre_joueurs
+        self.nombre_parties = nombre_parties
+        self.generateur = generateur if generateur is not None else np.random.default_rng()
+        self.dés = np.full((nombre_parties, nombre_joueurs), NOMBRE_DÉS_DÉPART, dtype=np.int16)
+        self.scores = np.full((nombre_parties, nombre_joueurs), SCORE_DÉPART, dtype=np.int32)
+        self.actifs = np.ones((nombre_parties, nombre_joueurs), dtype=bool)
+        self.courant = np.zeros(nombre_parties, dtype=np.intp)
+        self.sens = np.ones(nombre_parties, dtype=np.intp)
+        self.ronde = np.ones(nombre_parties, dtype=np.int16)
+        self.terminees = np.zeros(nombre_parties, dtype=bool)
+        self._lancers = construire_table_lancers(NOMBRE_DÉS_DÉPART * nombre_joueurs)
+
+    def trouver_premiers_joueurs(self):
+        """
+        Méthode qui détermine le premier joueur de chaque partie: chaque siège lance deux dés et les sièges à égalité
+        au plus haut total relancent jusqu'à ce qu'il n'en reste qu'un.
+        Returns:
+            numpy.ndarray: Siège du premier joueur de chaque partie
+        """
+        candidats = np.ones((self.nombre_parties, self.nombre_joueurs), dtype=bool)
+        a_departager = np.arange(self.nombre_parties)
+        while len(a_departager):
+            lancers = self.generateur.integers(1, 7, size=(len(a_departager), self.nombre_joueurs, 2)).sum(axis=2)
+            lancers[~candidats[a_departager]] = 0
+            candidats[a_departager] = lancers == lancers.max(axis=1, keepdims=True)
+            a_departager = a_departager[candidats[a_departager].sum(axis=1) > 1]
+        self.courant = candidats.argmax(axis=1)
+        return self.courant.copy()
+
+    def determiner_sens(self):
+        """
+        Méthode qui choisit au hasard le sens de chaque partie, comme JoueurOrdinateur.demander_sens.
+        """
+        self.sens = self.generateur.choice(np.array([-1, 1], dtype=np.intp), size=self.nombre_parties)
+
+    def trouver_joueurs_suivants(self, parties):
+        """
+        Méthode qui trouve, pour chacune des parties données, le prochain siège actif dans le sens de la partie. On
+        avance d'un siège à la fois seulement pour les parties où le siège visé n'est plus actif.
+        Args:
+            parties (numpy.ndarray): Index des parties
+        Returns:
+            numpy.ndarray: Siège du joueur suivant de chaque partie
+        """
+        actifs = self.actifs.reshape(-1)
+        sens = self.sens[parties]
+        suivants = (self.courant[parties] + sens) % self.nombre_joueurs
+        a_corriger = np.flatnonzero(~actifs[parties * self.nombre_joueurs + suivants])
+        while len(a_corriger):
+            suivants[a_corriger] = (suivants[a_corriger] + sens[a_corriger]) % self.nombre_joueurs
+            encore = ~actifs[parties[a_corriger] * self.nombre_joueurs + suivants[a_corriger]]
+            a_corriger = a_corriger[encore]
+        return suivants
+
+    def jouer_un_tour(self, parties):
+        """
+        Méthode qui fait jouer un tour au joueur courant de chacune des parties données. Le nombre de 1 et le nombre
+        de 6 du lancer sont tirés ensemble dans la loi multinomiale du nombre de dés lancés, par la méthode d'alias
+        (voir construire_table_lancers), ce qui revient à lancer chaque dé séparément. La partie entière de u * taille
+        choisit la case et sa partie fractionnaire décide entre la case et son alias.
+        Args:
+            parties (numpy.ndarray): Index des parties dont c'est le tour
+        Returns:
+            numpy.ndarray: Index des parties dont la ronde vient de se terminer
+        """
+        dés = self.dés.reshape(-1)
+        suivants = self.trouver_joueurs_suivants(parties)
+        positions = parties * self.nombre_joueurs + self.courant[parties]
+        nombre_dés = dés[positions]
+        lancers = self._lancers
+        tirages = self.generateur.random(len(parties)) * lancers["tailles"][nombre_dés]
+        cases = tirages.astype(np.intp)
+        issues = lancers["debuts"][nombre_dés] + cases
+        alias = (tirages - cases) >= lancers["seuils"][issues]
+        issues[alias] = lancers["alias"][issues[alias]]
+        nombre_6 = lancers["nombre_6"][issues]
+        restants = nombre_dés - lancers["nombre_1"][issues] - nombre_6
+        dés[positions] = restants
+        dés[parties * self.nombre_joueurs + suivants] += nombre_6
+        fin_de_ronde = restants == 0
+        continuent = ~fin_de_ronde
+        self.courant[parties[continuent]] = suivants[continuent]
+        return parties[fin_de_ronde]
+
+    def terminer_rondes(self, parties):
+        """
+        Méthode qui accomplit le pointage de fin de ronde pour les parties données. Les perdants lancent leurs dés
+        restants et donnent la somme (ou ce qui leur reste de points) au gagnant. Les joueurs sans points sont retirés
+        et les parties qui ont atteint le nombre maximal de rondes ou qui n'ont plus qu'un joueur actif se terminent.
+        Args:
+            parties (numpy.ndarray): Index des parties dont la ronde vient de se terminer
+        """
+        if not len(parties):
+            return
+        nombre_dés = self.dés[parties]
+        lancers = self.generateur.integers(1, 7, size=nombre_dés.shape + (int(nombre_dés.max()),), dtype=np.int16)
+        lancers[np.arange(lancers.shape[2]) >= nombre_dés[..., None]] = 0
+        sommes = lancers.sum(axis=2)
+        scores = self.scores[parties]
+        actifs = self.actifs[parties]
+        points_donnés = np.where(actifs, np.minimum(sommes, scores), 0)
+        scores -= points_donnés
+        scores[np.arange(len(parties)), self.courant[parties]] += points_donnés.sum(axis=1)
+        self.scores[parties] = scores
+        self.actifs[parties] = actifs & (scores > 0)
+        self.dés[parties] = NOMBRE_DÉS_DÉPART
+        self.ronde[parties] += 1
+        self.terminees[parties] = (self.ronde[parties] > RONDEMAX) | (self.actifs[parties].sum(axis=1) <= 1)
+
+    def jouer(self):
+        """
+        Méthode principale qui simule toutes les parties jusqu'à la fin.
+        Returns:
+            ResultatsLot: Les résultats des parties
+        """
+        premiers_joueurs = self.trouver_premiers_joueurs()
+        self.determiner_sens()
+        en_cours = np.flatnonzero(~self.terminees)
+        while len(en_cours):
+            self.terminer_rondes(self.jouer_un_tour(en_cours))
+            en_cours = en_cours[~self.terminees[en_cours]]
+        gagnants = self.scores == self.scores.max(axis=1, keepdims=True)
+        nombre_rondes = np.minimum(self.ronde - 1, RONDEMAX)
+        return ResultatsLot(self.scores, gagnants, nombre_rondes, premiers_joueurs, self.sens)
+
+
+def simuler_parties(nombre_joueurs, nombre_parties, generateur=None, taille_lot=20000):
+    """
+    Fonction qui simule un grand nombre de parties par lots successifs de taille_lot parties. Des lots de quelques
+    dizaines de milliers de parties gardent les tableaux dans la mémoire cache et sont plus rapides qu'un seul lot
+    géant.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs à chaque table (entre 2 et 8)
+        nombre_parties (int): Nombre total de parties à simuler
+        generateur (numpy.random.Generator, optional): Générateur à utiliser (un nouveau par défaut)
+        taille_lot (int, optional): Nombre de parties simulées ensemble
+    Returns:
+        ResultatsLot: Les résultats de toutes les parties
+    """
+    generateur = generateur if generateur is not None else np.random.default_rng()
+    lots = []
+    for debut in range(0, nombre_parties, taille_lot):
+        taille = min(taille_lot, nombre_parties - debut)
+        lots.append(MoteurVectoriel(nombre_joueurs, taille, generateur).jouer())
+    return ResultatsLot(np.concatenate([lot.scores for lot in lots]),
+                        np.concatenate([lot.gagnants for lot in lots]),
+                        np.concatenate([lot.nombre_rondes for lot in lots]),
+                        np.concatenate([lot.premiers_joueurs for lot in lots]),
+                        np.concatenate([lot.sens for lot in lots]))
@@ -2,9 +2,12 @@
 Module de la classe Partie
 """
 
+from pymafia import journal as evenements
+from pymafia.affichage import AffichageConsole, AffichageNul
+from pymafia.aleatoire import obtenir_source
+from pymafia.anneau import Anneau
 from pymafia.joueur_humain import JoueurHumain
 from pymafia.joueur_ordinateur import JoueurOrdinateur
-from random import shuffle
 
 # Variable globale spécifiant le nombre maximale de rondes d'une partie du jeu pymafia
 RONDEMAX = 10
@@ -15,32 +18,74 @@ class Partie:
     Documentation de la classe Partie
     Attributes:
         joueurs (list): Liste des joueurs au départ de la partie
-        joueurs_actifs (list): Liste des joueurs qui ont encore des points (score supérieur à 0)
+        joueurs_actifs (Anneau): Ordre de jeu des joueurs qui ont encore des points (score supérieur à 0)
         premier_joueur (Joueur): Premier joueur de la ronde
         joueur_courant (Joueur): Joueur dont c'est le tour
         joueur_suivant (Joueur): Joueur dont ce sera le tour lorsque le joueur_courant aura joué (prochain joueur actif)
         ronde (int): Nombre de la ronde actuelle
         sens (int): Nombre qui indique le sens du tour (1, croissant; -1, décroissant)
         gagnant (Joueur): Joueur qui sera déclaré gagnant de la partie, initialisé à None
+        source (SourceAleatoire): Source de hasard de la partie, partagée par tous ses joueurs
+        journal (JournalBinaire ou JournalJson): Journal où sont enregistrées les actions de la partie (None pour ne
+            rien enregistrer)
+        observateur (Instrumentation): Objet qui reçoit aussi chaque événement de la partie, sans rien en écrire (None
+            s'il n'y en a pas)
+        affichage (Affichage): Affichage par lequel passent tous les messages et toutes les questions de la partie
+        cotes (TablesCotes): Tables des cotes de ronde affichées après chaque lancer et en fin de ronde (None pour ne
+            rien afficher)
     """
-    def __init__(self, nombre_joueurs, nombre_joueurs_humains):
+    def __init__(self, nombre_joueurs, nombre_joueurs_humains, source=None, affichage=None, joueurs=None):
         """
         Constructeur de la classe Partie
         Args:
             nombre_joueurs (int): Nombre de joueurs de la partie
             nombre_joueurs_humains (int): Nombre de joueurs humains de la partie
-        """
-        self.joueurs = Partie.creer_joueurs(nombre_joueurs, nombre_joueurs_humains)
-        self.joueurs_actifs = self.joueurs.copy()
-        self.premier_joueur = self.joueurs_actifs[0]
-        self.joueur_courant = self.joueurs_actifs[0]
-        self.joueur_suivant = self.joueurs_actifs[1]
+            source (SourceAleatoire, optional): Source de hasard de la partie (la source par défaut si absente). Une
+                source avec une graine permet de reproduire la partie exactement.
+            affichage (Affichage, optional): Affichage de la partie (la console par défaut)
+            joueurs (list, optional): Joueurs déjà placés, dans l'ordre des identifiants (par défaut, les joueurs sont
+                créés et mélangés par creer_joueurs)
+        """
+        self.affichage = AffichageConsole() if affichage is None else affichage
+        self.source = obtenir_source(source)
+        if joueurs is None:
+            self.joueurs = Partie.creer_joueurs(nombre_joueurs, nombre_joueurs_humains, self.source)
+        else:
+            self.joueurs = list(joueurs)
+        for joueur in self.joueurs:
+            joueur.source = self.source
+        self.joueurs_actifs = Anneau(self.joueurs)
+        self.premier_joueur = self.joueurs[0]
+        self.joueur_courant = self.joueurs[0]
+        self.joueur_suivant = self.joueurs[1]
         self.ronde = 1
         self.sens = 1
         self.gagnant = None
+        self.journal = None
+        self.observateur = None
+        self.cotes = None
+
+    @property
+    def joueurs_actifs(self):
+        """
+        Propriété qui retourne l'ordre de jeu des joueurs actifs.
+        Returns:
+            Anneau: Les joueurs actifs
+        """
+        return self._joueurs_actifs
+
+    @joueurs_actifs.setter
+    def joueurs_actifs(self, joueurs):
+        """
+        Propriété qui remplace les joueurs actifs. Une liste de joueurs (dans l'ordre de leur place) est convertie en
+        anneau.
+        Args:
+            joueurs (Anneau ou iterable): Les nouveaux joueurs actifs
+        """
+        self._joueurs_actifs = joueurs if isinstance(joueurs, Anneau) else Anneau(joueurs)
 
     @staticmethod
-    def creer_joueurs(nombre_joueurs, nombre_joueurs_humains):
+    def creer_joueurs(nombre_joueurs, nombre_joueurs_humains, source=None):
         """
         Méthode statique qui crée la liste de joueurs de la partie.
         Dans le cas où des joueurs ordinateurs sont permis, les joueurs humains et ordinateurs sont
@@ -48,6 +93,7 @@ class Partie:
         Args:
             nombre_joueurs (int): Nombre de joueurs de la partie
             nombre_joueurs_humains (int): Nombre de joueurs humains de la partie
+            source (SourceAleatoire, optional): Source de hasard du mélange (la source par défaut si absente)
 
         Returns:
             list: Liste des joueurs
@@ -62,29 +108,136 @@ class Partie:
                 liste_des_joueurs.append(JoueurHumain(i))
             for i in range(nombre_joueurs_humains + 1, nombre_joueurs + 1):
                 liste_des_joueurs.append(JoueurOrdinateur(i))
-            shuffle(liste_des_joueurs)
+            obtenir_source(source).melanger(liste_des_joueurs)
             identifiant = 0
             for player in liste_des_joueurs:
                 identifiant += 1
                 player.identifiant = identifiant
         return liste_des_joueurs
 
+    def instantane(self):
+        """
+        Méthode qui retourne l'état de jeu de la partie sous une forme compacte et immuable. Les joueurs y sont désignés
+        par leur place (leur identifiant moins 1).
+        Returns:
+            tuple: (scores, dés de chaque place, places actives, premier joueur, joueur courant, joueur suivant, sens,
+            ronde)
+        """
+        return (tuple(joueur.score for joueur in self.joueurs),
+                tuple(joueur.dés.instantane() for joueur in self.joueurs),
+                tuple(joueur.identifiant - 1 for joueur in self.joueurs_actifs),
+                self.premier_joueur.identifiant - 1, self.joueur_courant.identifiant - 1,
+                self.joueur_suivant.identifiant - 1, self.sens, self.ronde)
+
+    def restaurer(self, instantane):
+        """
+        Méthode qui remet la partie dans l'état d'un instantané pris sur cette partie (ou sur une partie du même
+        nombre de joueurs). Les objets joueurs sont conservés; seuls leurs scores et leurs dés changent.
+        Args:
+            instantane (tuple): Instantané retourné par la méthode instantane
+        """
+        scores, dés, actifs, premier, courant, suivant, sens, ronde = instantane
+        for joueur, score, faces in zip(self.joueurs, scores, dés):
+            joueur.score = score
+            joueur.dés.restaurer(faces)
+        self.joueurs_actifs = self._anneau_des_places(self.joueurs, actifs)
+        self.premier_joueur = self.joueurs[premier]
+        self.joueur_courant = self.joueurs[courant]
+        self.joueur_suivant = self.joueurs[suivant]
+        self.sens = sens
+        self.ronde = ronde
+
+    def cloner(self, source=None, affichage=None):
+        """
+        Méthode qui retourne une copie de la partie, de la même classe, qui peut être jouée jusqu'au bout (avec
+        jouer_une_partie puis terminer_une_partie) sans modifier la partie d'origine. Les joueurs sont copiés avec
+        Joueur.cloner: leurs dés ne sont copiés que lorsqu'ils changent. Le journal, l'observateur et les méthodes
+        remplacées sur l'objet partie (par exemple par l'instrumentation) ne sont pas copiés, et la copie n'affiche pas
+        de cotes.
+        Args:
+            source (SourceAleatoire, optional): Source de hasard de la copie (la source par défaut si absente)
+            affichage (Affichage, optional): Affichage de la copie (un AffichageNul par défaut)
+        Returns:
+            Partie: La copie
+        """
+        copie = object.__new__(type(self))
+        copie.affichage = AffichageNul() if affichage is None else affichage
+        copie.source = obtenir_source(source)
+        copie.joueurs = [joueur.cloner() for joueur in self.joueurs]
+        for joueur in copie.joueurs:
+            joueur.source = copie.source
+        copie.joueurs_actifs = self._anneau_des_places(
+            copie.joueurs, [joueur.identifiant - 1 for joueur in self.joueurs_actifs])
+        copie.premier_joueur = copie.joueurs[self.premier_joueur.identifiant - 1]
+        copie.joueur_courant = copie.joueurs[self.joueur_courant.identifiant - 1]
+        copie.joueur_suivant = copie.joueurs[self.joueur_suivant.identifiant - 1]
+        copie.ronde = self.ronde
+        copie.sens = self.sens
+        copie.gagnant = None if self.gagnant is None else copie.joueurs[self.gagnant.identifiant - 1]
+        copie.journal = None
+        copie.observateur = None
+        copie.cotes = None
+        return copie
+
+    @staticmethod
+    def _anneau_des_places(joueurs, places_actives):
+        """
+        Méthode statique qui construit l'ordre de jeu d'une liste de joueurs dont seules certaines places sont actives.
+        Les joueurs inactifs sont retirés de l'anneau plutôt qu'omis, pour que l'on puisse encore trouver le joueur qui
+        suit chacun d'eux.
+        Args:
+            joueurs (list): Tous les joueurs, dans l'ordre de leur place
+            places_actives (iterable): Places (index dans joueurs) des joueurs actifs
+        Returns:
+            Anneau: L'ordre de jeu
+        """
+        anneau = Anneau(joueurs)
+        if len(places_actives) < len(joueurs):
+            actives = set(places_actives)
+            for place, joueur in enumerate(joueurs):
+                if place not in actives:
+                    anneau.retirer(joueur)
+        return anneau
+
+    def enregistrer(self, type_evenement, joueur=0, a=0, b=0, valeur=0):
+        """
+        Méthode qui transmet un événement au journal et à l'observateur de la partie (voir
+        JournalBinaire.enregistrer). Elle n'est appelée que si l'un des deux est présent.
+        Args:
+            type_evenement (int): Type de l'événement (une des constantes du module journal)
+            joueur (int, optional): Identifiant du joueur concerné
+            a (int, optional): Premier champ de l'événement
+            b (int, optional): Deuxième champ de l'événement
+            valeur (int, optional): Valeur de l'événement
+        """
+        if self.journal is not None:
+            self.journal.enregistrer(type_evenement, joueur, a, b, valeur)
+        if self.observateur is not None:
+            self.observateur.enregistrer(type_evenement, joueur, a, b, valeur)
+
     def preparer_une_partie(self):
         """
         Méthode qui accomplit les actions nécessaires pour débuter une partie.
         """
+        if self.journal is not None or self.observateur is not None:
+            nombre_joueurs_humains = sum(isinstance(joueur, JoueurHumain) for joueur in self.joueurs)
+            self.enregistrer(evenements.DEBUT_PARTIE, 0, len(self.joueurs), nombre_joueurs_humains)
         # Afficher les joueurs.
-        Partie.afficher_joueurs(self)
+        self.afficher_joueurs()
         # Trouver le premier joueur.
-        Partie.trouver_premier_joueur(self)
+        self.trouver_premier_joueur()
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.PREMIER_JOUEUR, self.premier_joueur.identifiant)
         # Déterminer le sens de la partie voulue par le premier joueur.
-        Partie.determiner_sens(self)
+        self.determiner_sens()
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.SENS, self.premier_joueur.identifiant, 0, 0, self.sens)
         # Affecter à l'attribut du joueur_courant le premier joueur.
         self.joueur_courant = self.premier_joueur
         # Déterminer qui est le joueur suivant.
-        Partie.determiner_joueur_suivant(self)
+        self.determiner_joueur_suivant()
         # Réinitialiser les dés des joueurs pour que chaque joueur ait 5 dés.
-        Partie.reinitialiser_dés_joueurs(self)
+        self.reinitialiser_dés_joueurs()
 
     def afficher_joueurs(self):
         """
@@ -92,6 +245,8 @@ class Partie:
         La version simple de cette méthode peut se limiter à lister les joueurs.
         Par exemple, "Le joueur 6 est prêt à jouer!"
         """
+        if not self.affichage.actif:
+            return
         # Lister l'identifiant des joueurs humains
         identifiants_joueurs_humains = []
         for joueur in self.joueurs:
@@ -99,23 +254,26 @@ class Partie:
                 identifiants_joueurs_humains.append(str(joueur.identifiant))
 
         # Afficher les identifiants des joueurs humains (la chaîne est différente selon le nombre)
+        if not identifiants_joueurs_humains:
+            self.affichage.afficher("Tous les joueurs sont des ordinateurs.\n")
+            return
         if len(identifiants_joueurs_humains) == 1:
-            print("Le joueur {} est le joueur humain.".format(identifiants_joueurs_humains[0]))
+            self.affichage.afficher("Le joueur {} est le joueur humain.", identifiants_joueurs_humains[0])
         elif len(identifiants_joueurs_humains) == len(self.joueurs):
-            print('Tous les joueurs sont des joueurs humains!')
+            self.affichage.afficher('Tous les joueurs sont des joueurs humains!')
         elif len(identifiants_joueurs_humains) == 2:
-            print("Les joueurs {} et {} sont des joueurs humains.".format(identifiants_joueurs_humains[0],
-                                                                          identifiants_joueurs_humains[1]))
+            self.affichage.afficher("Les joueurs {} et {} sont des joueurs humains.", identifiants_joueurs_humains[0],
+                                    identifiants_joueurs_humains[1])
         else:
             liste_joueurs_humains = ", ".join(identifiants_joueurs_humains[:-1])
-            print("Les joueurs {} et {} sont des joueurs humains.".format(liste_joueurs_humains,
-                                                                          identifiants_joueurs_humains[-1]))
+            self.affichage.afficher("Les joueurs {} et {} sont des joueurs humains.", liste_joueurs_humains,
+                                    identifiants_joueurs_humains[-1])
         # Si nécessaire, indiquer que l'autre joueur ou les autres joueurs sont des ordinateurs.
         nombre_joueurs_ordinateur = len(self.joueurs) - len(identifiants_joueurs_humains)
         if nombre_joueurs_ordinateur == 1:
-            print("L'autre joueur est un ordinateur.\n")
+            self.affichage.afficher("L'autre joueur est un ordinateur.\n")
         elif nombre_joueurs_ordinateur > 1:
-            print("Les autres joueurs sont des ordinateurs.\n")
+            self.affichage.afficher("Les autres joueurs sont des ordinateurs.\n")
 
     def trouver_premier_joueur(self):
         """
@@ -124,33 +282,42 @@ class Partie:
         leurs dés jusqu'à ce qu'un seul joueurs aient le plus haut résultat.
         """
         list_comparaison = []
-        print("Déterminons quel joueur débutera la partie!\n")
-        for joueur in self.joueurs:
-            input("Joueur " + str(joueur.identifiant) + " : Appuyer sur enter pour rouler les dés")
+        candidats = self.joueurs
+        self.affichage.afficher("Déterminons quel joueur débutera la partie!\n")
+        for joueur in candidats:
+            self.demander_lancer(joueur)
             joueur.rouler_dés()
-            print("Joueur " + str(joueur.identifiant) + " : " + str(joueur) + " Total des dés: " +
-                  str(joueur.calculer_points()) + "\n")
+            self.affichage.afficher("Joueur {} : {} Total des dés: {}\n", joueur.identifiant, joueur,
+                                    joueur.calculer_points())
             list_comparaison.append(joueur.calculer_points())
+            if self.journal is not None or self.observateur is not None:
+                self.enregistrer(evenements.PREMIER_LANCER, joueur.identifiant, 0, 0, joueur.calculer_points())
         matrice_index_plus_haut = Partie.trouver_indices_max(list_comparaison)
         while len(matrice_index_plus_haut) > 1:
-            print("Bris d'égalité!\n")
-            joueur_restant = []
-            for index in matrice_index_plus_haut:
-                joueur_restant.append(self.joueurs_actifs[index])
-            self.joueurs_actifs.clear()
-            self.joueurs_actifs = joueur_restant.copy()
+            self.affichage.afficher("Bris d'égalité!\n")
+            if self.journal is not None or self.observateur is not None:
+                self.enregistrer(evenements.BRIS_ÉGALITÉ, 0, len(matrice_index_plus_haut))
+            candidats = [candidats[index] for index in matrice_index_plus_haut]
             list_comparaison = []
-            for joueur in self.joueurs_actifs:
-                input("Joueur " + str(joueur.identifiant) + " : Appuyer sur enter pour rouler les dés")
+            for joueur in candidats:
+                self.demander_lancer(joueur)
                 joueur.rouler_dés()
-                print("Joueur " + str(joueur.identifiant) + " : " + str(joueur) + " Total des dés: " +
-                      str(joueur.calculer_points()) + "\n")
+                self.affichage.afficher("Joueur {} : {} Total des dés: {}\n", joueur.identifiant, joueur,
+                                        joueur.calculer_points())
                 list_comparaison.append(joueur.calculer_points())
+                if self.journal is not None or self.observateur is not None:
+                    self.enregistrer(evenements.PREMIER_LANCER, joueur.identifiant, 0, 0, joueur.calculer_points())
             matrice_index_plus_haut = Partie.trouver_indices_max(list_comparaison)
-        identifiant_premier = self.joueurs_actifs[matrice_index_plus_haut[0]].identifiant
-        self.premier_joueur = self.joueurs[identifiant_premier - 1]
-        self.joueurs_actifs = self.joueurs.copy()
-        print("Le joueur " + str(self.premier_joueur.identifiant) + ": commencera la partie!" + "\n")
+        self.premier_joueur = candidats[matrice_index_plus_haut[0]]
+        self.affichage.afficher("Le joueur {}: commencera la partie!\n", self.premier_joueur.identifiant)
+
+    def demander_lancer(self, joueur):
+        """
+        Méthode qui attend qu'un joueur humain soit prêt à rouler ses dés pour déterminer le premier joueur.
+        Args:
+            joueur (Joueur): Le joueur qui va rouler ses dés
+        """
+        self.affichage.demander("Joueur {} : Appuyer sur enter pour rouler les dés", joueur.identifiant)
 
     def trouver_joueurs_au_plus_haut_total(self, liste_joueurs):
         """
@@ -195,38 +362,25 @@ class Partie:
         L'attribut sens de la partie est modifié selon la réponse. Dans le cas de l'ordinateur, on affiche son choix.
         """
         if isinstance(self.premier_joueur, JoueurHumain):
-            self.sens = input("Joueur: " + str(self.premier_joueur.identifiant) +
-                              " Dans quel sens voulez vous que la partie tourne? (1 pour un ordre croissant, "
-                              "-1 pour un ordre décroissant)\n")
-            verification = self.sens
-            verification.lstrip("-")
-            while not (verification.isnumeric() and int(verification) == 1):
-                self.sens = input("Erreur, veuillez entrez 1 (ordre croissant) ou -1 (ordre décroissant) seulement.\n")
-                verification = self.sens.lstrip("-")
-            self.sens = int(self.sens)
+            reponse = self.affichage.demander(
+                "Joueur: {} Dans quel sens voulez vous que la partie tourne? (1 pour un ordre croissant, "
+                "-1 pour un ordre décroissant)\n", self.premier_joueur.identifiant)
+            while reponse not in ("1", "-1"):
+                reponse = self.affichage.demander(
+                    "Erreur, veuillez entrez 1 (ordre croissant) ou -1 (ordre décroissant) seulement.\n")
+            self.sens = int(reponse)
         else:
-            sens = self.premier_joueur.demander_sens()
-            print(sens)
+            sens = self.premier_joueur.demander_sens(self)
+            self.affichage.afficher(sens[1])
             self.sens = sens[0]
 
     def determiner_joueur_suivant(self):
         """
-        Méthode qui trouve qui est le joueur suivant et qui modifie l'attribut joueur_suivant de la partie.
-        """
-        plus_gros_index = len(self.joueurs_actifs) - 1
-        if plus_gros_index > 0:
-            index_joueur_courant = self.joueurs_actifs.index(self.joueur_courant)
-            if self.sens == 1:
-                if index_joueur_courant < plus_gros_index:
-                    i = 1
-                elif index_joueur_courant == plus_gros_index:
-                    i = -plus_gros_index
-            elif self.sens == -1:
-                if index_joueur_courant > 0:
-                    i = -1
-                else:
-                    i = plus_gros_index
-            self.joueur_suivant = self.joueurs_actifs[index_joueur_courant + i]
+        Méthode qui trouve qui est le joueur suivant et qui modifie l'attribut joueur_suivant de la partie. S'il ne
+        reste qu'un joueur actif, le joueur suivant ne change pas.
+        """
+        if len(self.joueurs_actifs) > 1:
+            self.joueur_suivant = self.joueurs_actifs.suivant(self.joueur_courant, self.sens)
 
     def reinitialiser_dés_joueurs(self):
         """
@@ -245,27 +399,30 @@ class Partie:
         # 1. Jouer une ronde.
         global RONDEMAX
         while RONDEMAX >= self.ronde:
-            Partie.jouer_une_ronde(self)
+            self.jouer_une_ronde()
             # 2. Terminer la ronde
-            Partie.terminer_ronde(self)
+            self.terminer_ronde()
             # 3. Afficher un message donnant les points en fin de ronde.
-            print(Partie.message_points_des_joueurs(self))
+            if self.affichage.actif:
+                self.affichage.afficher(self.message_points_des_joueurs())
             # 4. Réinitialiser les dés des joueurs.
-            Partie.reinitialiser_dés_joueurs(self)
+            self.reinitialiser_dés_joueurs()
             # 5. Passer à la prochaine ronde.
             if len(self.joueurs_actifs) > 1:
-                Partie.passer_a_la_ronde_suivante(self)
+                self.passer_a_la_ronde_suivante()
             else:
-                self.ronde = 100
+                break
 
     def jouer_une_ronde(self):
         """
         Méthode qui permet de jouer une ronde. Un message de début de ronde est affiché. Ensuite faire une boucle pour
         jouer une succession de tour. On sort de la boucle lorsqu'un joueur gagne le tour.
         """
-        print("début de ronde: " + str(self.ronde) + "\n")
-        while not Partie.verifier_si_fin_de_ronde(self):
-            Partie.jouer_un_tour(self)
+        self.affichage.afficher("début de ronde: {}\n", self.ronde)
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.DEBUT_RONDE, 0, 0, 0, self.ronde)
+        while not self.verifier_si_fin_de_ronde():
+            self.jouer_un_tour()
 
     def jouer_un_tour(self):
         """
@@ -275,24 +432,53 @@ class Partie:
         """
         # Les étapes pour jouer un tour sont:
         # 1) Le joueur courant roule ses dés.
-        print("C'est a votre tour joueur ", self.joueur_courant.identifiant)
-        input("Appuyer sur une touche pour rouler les dés")
+        self.affichage.afficher("C'est a votre tour joueur  {}", self.joueur_courant.identifiant)
+        self.affichage.demander("Appuyer sur une touche pour rouler les dés")
         self.joueur_courant.rouler_dés()
         # 2) Le résultat du lancer est affiché.
-        print("Joueur ", str(self.joueur_courant.identifiant), ": ", self.joueur_courant, " Total des dés: ",
-              self.joueur_courant.calculer_points())
+        self.affichage.afficher("Joueur  {} :  {}  Total des dés:  {}", self.joueur_courant.identifiant,
+                                self.joueur_courant, self.joueur_courant.calculer_points())
         # 3) On gère les dés de valeur 1 et 6.
-        Partie.gerer_dés_1_et_6(self)
+        self.gerer_dés_1_et_6()
         # 4) On vérifie si le joueur courant a gagné la ronde en n'ayant plus de dé. S'il gagne, on affiche un message
-        # qui indique qu'il n'a plus de dé. Sinon, on passe au joueur suivant.
-        # qui indique qu'il n'a plus de dé. Sinon, on passe au joueur suivant.
-        if Partie.verifier_si_fin_de_ronde(self):
-            print("Félicitation joueur", self.joueur_courant.identifiant, " vous avez plus aucun dés!")
+        # qui indique qu'il n'a plus de dé. Sinon, on passe au joueur suivant et on affiche les cotes, si demandé.
+        if self.verifier_si_fin_de_ronde():
+            self.affichage.afficher("Félicitation joueur {}  vous avez plus aucun dés!",
+                                    self.joueur_courant.identifiant)
             return self.joueur_courant
         else:
-            Partie.passer_au_prochain_joueur(self)
+            self.passer_au_prochain_joueur()
+            self.afficher_cotes()
             return None
 
+    def afficher_cotes(self):
+        """
+        Méthode qui affiche, si la partie a des tables de cotes, la probabilité que chaque joueur actif gagne la ronde
+        et le nombre moyen de points qu'il perdra en fin de ronde (voir TablesCotes.cotes_partie), à partir des dés et
+        du score de chacun et du joueur qui va lancer.
+        """
+        if self.cotes is None or not self.affichage.actif:
+            return
+        message = self.message_cotes()
+        if message:
+            self.affichage.afficher(message)
+
+    def message_cotes(self):
+        """
+        Méthode qui assemble le message des cotes de la ronde. Par exemple: "Cotes de la ronde: Joueur 1: 23.6% de
+        chances de gagner, points perdus en moyenne en fin de ronde: 6.8. ..." (une ligne par joueur actif).
+        Returns:
+            str: Le message, ou une chaîne vide si les tables ne couvrent pas ce nombre de joueurs
+        """
+        cotes = self.cotes.cotes_partie(self)
+        if cotes is None:
+            return ""
+        lignes = ["Cotes de la ronde:"]
+        for identifiant, (probabilite, points) in sorted(cotes.items()):
+            lignes.append("  Joueur {}: {:.1%} de chances de gagner, points perdus en moyenne en fin de ronde: "
+                          "{:.1f}.".format(identifiant, probabilite, points))
+        return "\n".join(lignes) + "\n"
+
     def gerer_dés_1_et_6(self):
         """
         Méthode qui gère le contenu des dés du joueur courant suite à un lancer pour traiter la présence de 1 et de 6
@@ -300,11 +486,11 @@ class Partie:
         """
         # Les étapes de cette méthode sont:
         # 1. Vérifier si les dés du joueur courant contiennent des 1 et des 6 et obtenir le nombre de 1 et de 6.
-        resultat_1_6 = Partie.verifier_dés_joueur_courant_pour_1_et_6(self)
+        resultat_1_6 = self.verifier_dés_joueur_courant_pour_1_et_6()
         # 2. Afficher les messages pour ces dés.
-        Partie.afficher_messages_dés_1_et_6(self, resultat_1_6[0], resultat_1_6[1])
+        self.afficher_messages_dés_1_et_6(resultat_1_6[0], resultat_1_6[1])
         # 3. Déplacer les dés 1 et 6.
-        Partie.deplacer_les_dés_1_et_6(self, resultat_1_6[0], resultat_1_6[1])
+        self.deplacer_les_dés_1_et_6(resultat_1_6[0], resultat_1_6[1])
 
     def verifier_dés_joueur_courant_pour_1_et_6(self):
         """
@@ -322,12 +508,14 @@ class Partie:
             nombre_1 (int): Nombre de dé(s) de valeur 1
             nombre_6 (int): Nombre de dé(s) de valeur 6
         """
+        if not self.affichage.actif:
+            return
         if nombre_1:
-            print(self.message_pour_dé_1(nombre_1))
+            self.affichage.afficher(self.message_pour_dé_1(nombre_1))
         if nombre_6:
-            print(self.message_pour_dé_6(nombre_6))
+            self.affichage.afficher(self.message_pour_dé_6(nombre_6))
         if nombre_1 or nombre_6:
-            print()  # Affiche un ligne vide si le joueur a des 1 ou des 6
+            self.affichage.afficher()  # Affiche un ligne vide si le joueur a des 1 ou des 6
 
     def message_pour_dé_1(self, nombre_1):
         """
@@ -361,10 +549,13 @@ class Partie:
             nombre_1 (int): Nombre de dé(s) de valeur 1
             nombre_6 (int): Nombre de dé(s) de valeur 6
         """
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.LANCER, self.joueur_courant.identifiant, nombre_1, nombre_6,
+                             self.joueur_courant.dés.total)
         self.joueur_courant.retirer_dé(1)
         if nombre_6 > 0:
             for i in range(0, nombre_6):
-                Partie.passer_dé_joueur_suivant(self)
+                self.passer_dé_joueur_suivant()
 
     def passer_dé_joueur_suivant(self):
         """
@@ -385,11 +576,13 @@ class Partie:
 
     def passer_au_prochain_joueur(self):
         """
-        Méthode qui change la valeur de l'attribut du joueur_courant et qui détermine le joueur suivant.
+        Méthode qui change la valeur de l'attribut du joueur_courant et qui détermine le joueur suivant. Si le joueur
+        suivant n'est plus actif, c'est le prochain joueur actif qui joue.
         """
-        if self.joueur_suivant.score > 0:
-            self.joueur_courant = self.joueur_suivant
-            Partie.determiner_joueur_suivant(self)
+        if self.joueur_suivant not in self.joueurs_actifs:
+            self.determiner_joueur_suivant()
+        self.joueur_courant = self.joueur_suivant
+        self.determiner_joueur_suivant()
 
     def passer_a_la_ronde_suivante(self):
         """
@@ -401,18 +594,21 @@ class Partie:
         """
         Méthode qui accomplit les actions de jeu en fin de ronde à l'aide d'autres méthodes de la classe.
         """
-        # 1. Tous les joueurs qui n'ont pas gagné la ronde jouent les dés qui leur restent.
-        Partie.jouer_dés_en_fin_de_ronde(self)
+        # 1. Afficher les points que chaque perdant donnera en moyenne (si demandé). Ensuite, tous les joueurs qui
+        # n'ont pas gagné la ronde jouent les dés qui leur restent.
+        self.afficher_cotes()
+        self.jouer_dés_en_fin_de_ronde()
         # 2. Afficher les messages des points donnés par les joueurs.
-        Partie.messages_pour_points_fin_de_ronde(self)
+        self.messages_pour_points_fin_de_ronde()
         # 3. Ajuster les points de perdants de la ronde et compter la somme des points destinés au gagnant.
-        point_gagnant = Partie.ajuster_points_des_perdants_en_fin_de_ronde(self)
+        point_gagnant = self.ajuster_points_des_perdants_en_fin_de_ronde()
         # 4. Ajuster les points du gagnant avec les points des perdants.
-        Partie.ajuster_points_du_gagnant(self, point_gagnant)
+        self.ajuster_points_du_gagnant(point_gagnant)
         # 5. Afficher le message qui annonce le nouveau score du gagnant.
-        Partie.message_pour_points_du_gagnant(self, point_gagnant)
-        Partie.reinitialiser_dés_joueurs(self)
-        Partie.retirer_joueurs_sans_points(self)
+        if self.affichage.actif:
+            self.affichage.afficher(self.message_pour_points_du_gagnant(point_gagnant))
+        self.reinitialiser_dés_joueurs()
+        self.retirer_joueurs_sans_points()
 
     def jouer_dés_en_fin_de_ronde(self):
         """
@@ -422,6 +618,9 @@ class Partie:
         for joueur in self.joueurs_actifs:
             if joueur != self.gagnant:
                 joueur.rouler_dés()
+                if self.journal is not None or self.observateur is not None:
+                    self.enregistrer(evenements.LANCER_FIN_DE_RONDE, joueur.identifiant, joueur.dés.nombre, 0,
+                                     joueur.dés.total)
 
     def messages_pour_points_fin_de_ronde(self):
         """
@@ -435,15 +634,18 @@ class Partie:
         Returns:
             str: Le message qui indique le nombre de points par chaque joueur perdant de la ronde.
         """
+        if not self.affichage.actif:
+            return
         for joueur in self.joueurs_actifs:
             if joueur != self.gagnant:
                 if joueur.score > joueur.calculer_points():
-                    print("Le joueur " + str(joueur.identifiant) + " joue les dés suivants: " + str(joueur) +
-                          ". Il donne " + str(joueur.calculer_points()) + " points au gagnant de la ronde.")
+                    self.affichage.afficher("Le joueur {} joue les dés suivants: {}. Il donne {} points au gagnant "
+                                            "de la ronde.", joueur.identifiant, joueur, joueur.calculer_points())
                 else:
-                    print("Le joueur " + str(joueur.identifiant) + " joue les dés suivants: " + str(joueur) +
-                          ". La somme des dés est égale ou supérieure à son nombre de points. Il donne " + str(
-                        joueur.score) + " points au gagnant de la ronde et se retire de la partie.")
+                    self.affichage.afficher("Le joueur {} joue les dés suivants: {}. La somme des dés est égale ou "
+                                            "supérieure à son nombre de points. Il donne {} points au gagnant de la "
+                                            "ronde et se retire de la partie.", joueur.identifiant, joueur,
+                                            joueur.score)
 
     def ajuster_points_des_perdants_en_fin_de_ronde(self):
         """
@@ -459,8 +661,12 @@ class Partie:
                 joueur.ajuster_score_en_fin_de_tour()
                 point_gagnant += point
             else:
+                point = joueur.score
                 point_gagnant += joueur.score
                 joueur.ajuster_score_en_fin_de_tour()
+            if (self.journal is not None or self.observateur is not None) and joueur is not self.gagnant:
+                self.enregistrer(evenements.TRANSFERT_POINTS, joueur.identifiant, 0,
+                                 self.joueur_courant.identifiant, point)
         return point_gagnant
 
     def ajuster_points_du_gagnant(self, score):
@@ -470,6 +676,8 @@ class Partie:
             score (int): Le nombre de points à ajouter au score du joueur courant.
         """
         self.joueur_courant.score += score
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.FIN_RONDE, self.joueur_courant.identifiant, 0, 0, score)
 
     def message_pour_points_du_gagnant(self, points_au_gagnant):
         """
@@ -491,28 +699,32 @@ class Partie:
         returns: (list): list des joueur qui n'ont plus de points.
         """
         list_joueur_enlever = []
-        list_joueur_fin_ronde = self.joueurs_actifs.copy()
-        self.joueurs_actifs.clear()
-        for joueur in list_joueur_fin_ronde:
-            if joueur.score > 0:
-                self.joueurs_actifs.append(joueur)
-            else:
+        for joueur in self.joueurs_actifs:
+            if joueur.score <= 0:
+                self.joueurs_actifs.retirer(joueur)
                 list_joueur_enlever.append(joueur)
-        Partie.determiner_joueur_suivant(self)
+                if self.journal is not None or self.observateur is not None:
+                    self.enregistrer(evenements.ELIMINATION, joueur.identifiant)
+        self.determiner_joueur_suivant()
         return list_joueur_enlever
 
     def terminer_une_partie(self):
         """
         Méthode qui fait les affichages de fin de partie en déterminant le gagnant.
         """
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.FIN_PARTIE, 0, 0, 0, min(self.ronde, RONDEMAX))
+        if not self.affichage.actif:
+            return
         # On informe les joueurs que le nombre maximal de rondes est atteint.
-        print("le nombre de ronde maximal a été atteinte... voyons voir qui est l'heureux gagnant...")
+        self.affichage.afficher("le nombre de ronde maximal a été atteinte... voyons voir qui est l'heureux gagnant...")
         # Ensuite, on affiche le bilan des points des joueurs de la partie.
-        print(Partie.message_points_en_fin_de_partie(self))
+        self.affichage.afficher(self.message_points_en_fin_de_partie())
         # On détermine le gagnant et on en informe les utilisateurs
-        list_gagnant = Partie.determiner_liste_gagnants(self)
-        print(Partie.message_gagnants(self, list_gagnant))
-        print("Merci d'avoir joué à pymafia!")
+        list_gagnant = self.determiner_liste_gagnants()
+        self.affichage.afficher(self.message_gagnants(list_gagnant))
+        self.affichage.afficher("Merci d'avoir joué à pymafia!")
+        self.affichage.vider()
 
     def message_points_en_fin_de_partie(self):
         """
@@ -533,11 +745,9 @@ class Partie:
         Returns:
             str: Les message donnant les points des joueurs.
         """
-        message = ""
-        for joueur in self.joueurs:
-            message += "Le joueur {} a {} point{}.\n".format(
-                joueur.identifiant, joueur.score, 's' if joueur.score > 0 else '')
-        return message
+        return "".join(["Le joueur {} a {} point{}.\n".format(joueur.identifiant, joueur.score,
+                                                              's' if joueur.score > 0 else '')
+                        for joueur in self.joueurs])
 
     def determiner_liste_gagnants(self):
         """
@@ -563,8 +773,8 @@ class Partie:
         if len(liste_index_gagnants) == 1:
             message = "Le joueur {} a gagné à la partie!\n".format(self.joueurs[liste_index_gagnants[0]].identifiant)
         else:
-            message = "Il y a égalité entre les joueurs {}.\n".format(" et ").join(
-                str(self.joueurs[gagnant].identifiant) for gagnant in liste_index_gagnants)
+            message = "Il y a égalité entre les joueurs {}.\n".format(" et ".join(
+                str(self.joueurs[gagnant].identifiant) for gagnant in liste_index_gagnants))
         return message
 
     def jouer(self):
@@ -573,10 +783,10 @@ class Partie:
         """
         # Les étapes sont:
         # 1) préparer une partie;
-        Partie.preparer_une_partie(self)
+        self.preparer_une_partie()
         # 2) jouer une partie et
-        Partie.jouer_une_partie(self)
+        self.jouer_une_partie()
         # 3) terminer une partie.
-        Partie.terminer_une_partie(self)
+        self.terminer_une_partie()
 
 
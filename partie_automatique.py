@@ -0,0 +1,285 @@
+"""
+Module de la classe PartieAutomatique
+"""
+
+from pymafia import journal as evenements
+from pymafia.affichage import AffichageNul
+from pymafia.distributions import tirer_1_et_6, tirer_lancer, tirer_somme_dés
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.partie import Partie, RONDEMAX
+
+
+class ResultatPartie:
+    """
+    Classe qui regroupe le résultat d'une partie jouée sans affichage.
+
+    Attributes:
+        scores (list): Score final de chaque joueur, dans l'ordre des identifiants (le joueur 1 est à l'index 0)
+        gagnants (list): Identifiants du ou des joueurs gagnants (plus d'un seulement s'il y a égalité)
+        nombre_rondes (int): Nombre de rondes jouées
+        humains (tuple): Pour chaque joueur, True si c'est un joueur humain, False si c'est un joueur ordinateur
+        tours_par_ronde (list): Nombre de tours joués dans chaque ronde
+        points_par_ronde (list): Nombre de points donnés au gagnant de chaque ronde
+        relances_bris_egalite (int): Nombre de lancers refaits pour briser les égalités lors de la recherche du premier
+            joueur
+        premier_joueur (int): Identifiant du premier joueur de la partie (None s'il n'est pas connu)
+        sens (int): Sens de la partie (1, croissant; -1, décroissant)
+    """
+
+    def __init__(self, scores, gagnants, nombre_rondes, humains=(), tours_par_ronde=(), points_par_ronde=(),
+                 relances_bris_egalite=0, premier_joueur=None, sens=1):
+        """
+        Constructeur de la classe ResultatPartie
+        Args:
+            scores (list): Score final de chaque joueur
+            gagnants (list): Identifiants des joueurs gagnants
+            nombre_rondes (int): Nombre de rondes jouées
+            humains (tuple, optional): Type de chaque joueur (True pour un joueur humain). Par défaut, tous les
+                joueurs sont des joueurs ordinateurs.
+            tours_par_ronde (list, optional): Nombre de tours joués dans chaque ronde
+            points_par_ronde (list, optional): Nombre de points donnés au gagnant de chaque ronde
+            relances_bris_egalite (int, optional): Nombre de lancers refaits pour briser les égalités
+            premier_joueur (int, optional): Identifiant du premier joueur de la partie
+            sens (int, optional): Sens de la partie
+        """
+        self.scores = scores
+        self.gagnants = gagnants
+        self.nombre_rondes = nombre_rondes
+        self.humains = tuple(humains) if humains else (False,) * len(scores)
+        self.tours_par_ronde = list(tours_par_ronde)
+        self.points_par_ronde = list(points_par_ronde)
+        self.relances_bris_egalite = relances_bris_egalite
+        self.premier_joueur = premier_joueur
+        self.sens = sens
+
+    def __repr__(self):
+        return "ResultatPartie(scores={}, gagnants={}, nombre_rondes={})".format(
+            self.scores, self.gagnants, self.nombre_rondes)
+
+
+class PartieAutomatique(Partie):
+    """
+    Classe pour une partie de pymafia jouée sans aucune interaction avec la console. Cette classe hérite de la classe
+    Partie et en conserve les règles (bris d'égalité pour le premier joueur, dés 6 passés, dés 1 retirés, pointage de
+    fin de ronde et nombre maximal de rondes). La partie utilise un AffichageNul: aucun message n'est affiché ni
+    assemblé. Les méthodes redéfinies ici suivent les mêmes étapes que celles de Partie, sans les appels à l'affichage.
+    Les joueurs humains, s'il y en a, ne sont jamais consultés: leur sens est tiré au hasard de la source de la partie,
+    comme celui d'un joueur ordinateur (et comme le fait le serveur pour un joueur qui ne répond pas).
+
+    Pendant les rondes, les dés ne sont pas lancés un par un: seules les grandeurs qui comptent (le nombre de 1 et de 6
+    d'un lancer, le total des dés d'un perdant en fin de ronde) sont tirées de leur loi exacte (module distributions).
+
+    La partie compte aussi, pour son résultat, les tours et les points donnés au gagnant de chaque ronde ainsi que les
+    lancers refaits pour briser les égalités.
+
+    Attributes:
+        tours_par_ronde (list): Nombre de tours joués dans chaque ronde
+        points_par_ronde (list): Nombre de points donnés au gagnant de chaque ronde
+        relances_bris_egalite (int): Nombre de lancers refaits pour briser les égalités
+        sommes_fin_de_ronde (dict): Somme des dés joués en fin de ronde par chaque perdant (clé: son identifiant)
+    """
+
+    def __init__(self, nombre_joueurs, source=None, nombre_joueurs_humains=0, types_joueurs=None):
+        """
+        Constructeur de la classe PartieAutomatique
+        Args:
+            nombre_joueurs (int): Nombre de joueurs de la partie
+            source (SourceAleatoire, optional): Source de hasard de la partie (la source par défaut si absente)
+            nombre_joueurs_humains (int, optional): Nombre de joueurs humains (tous des joueurs ordinateurs par défaut)
+            types_joueurs (list, optional): Classe du joueur de chaque siège, dans l'ordre des identifiants (par
+                exemple des variantes de JoueurOrdinateur). Les joueurs ne sont alors pas mélangés.
+        """
+        joueurs = None
+        if types_joueurs is not None:
+            joueurs = [type_joueur(identifiant) for identifiant, type_joueur in enumerate(types_joueurs, 1)]
+        super().__init__(nombre_joueurs, nombre_joueurs_humains, source, AffichageNul(), joueurs)
+        self.tours_par_ronde = []
+        self.points_par_ronde = []
+        self.relances_bris_egalite = 0
+        self.sommes_fin_de_ronde = {}
+
+    def cloner(self, source=None, affichage=None):
+        """
+        Méthode qui retourne une copie de la partie (voir Partie.cloner), avec les tours, les points et les relances
+        déjà comptés.
+        Args:
+            source (SourceAleatoire, optional): Source de hasard de la copie (la source par défaut si absente)
+            affichage (Affichage, optional): Affichage de la copie (un AffichageNul par défaut)
+        Returns:
+            PartieAutomatique: La copie
+        """
+        copie = super().cloner(source, affichage)
+        copie.tours_par_ronde = self.tours_par_ronde.copy()
+        copie.points_par_ronde = self.points_par_ronde.copy()
+        copie.relances_bris_egalite = self.relances_bris_egalite
+        copie.sommes_fin_de_ronde = self.sommes_fin_de_ronde.copy()
+        return copie
+
+    def trouver_premier_joueur(self):
+        """
+        Méthode qui détermine le premier joueur de la même façon que la classe Partie (le plus haut total de deux dés,
+        les joueurs à égalité relancent), sans afficher les lancers ni attendre l'utilisateur.
+        """
+        candidats = self.joueurs
+        while len(candidats) > 1:
+            totaux = []
+            for joueur in candidats:
+                joueur.rouler_dés()
+                totaux.append(joueur.calculer_points())
+                if self.journal is not None or self.observateur is not None:
+                    self.enregistrer(evenements.PREMIER_LANCER, joueur.identifiant, 0, 0, totaux[-1])
+            candidats = [candidats[index] for index in Partie.trouver_indices_max(totaux)]
+            if len(candidats) > 1:
+                self.relances_bris_egalite += len(candidats)
+                if self.journal is not None or self.observateur is not None:
+                    self.enregistrer(evenements.BRIS_ÉGALITÉ, 0, len(candidats))
+        self.premier_joueur = candidats[0]
+
+    def determiner_sens(self):
+        """
+        Méthode qui détermine le sens de la partie comme la classe Partie, sans afficher le choix. Un premier joueur
+        humain n'est pas consulté: le sens est tiré de la source de la partie, avec la même loi que pour un joueur
+        ordinateur.
+        """
+        if isinstance(self.premier_joueur, JoueurHumain):
+            self.sens = self.source.choisir_sens()
+        else:
+            self.sens = self.premier_joueur.demander_sens(self)[0]
+
+    def jouer_une_partie(self):
+        """
+        Méthode qui joue les rondes de la partie jusqu'au nombre maximal de rondes ou jusqu'à ce qu'il ne reste qu'un
+        seul joueur actif.
+        """
+        while self.ronde <= RONDEMAX:
+            self.jouer_une_ronde()
+            self.terminer_ronde()
+            if len(self.joueurs_actifs) <= 1:
+                break
+            self.passer_a_la_ronde_suivante()
+
+    def jouer_une_ronde(self):
+        """
+        Méthode qui joue une succession de tours jusqu'à ce qu'un joueur n'ait plus de dé.
+        """
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.DEBUT_RONDE, 0, 0, 0, self.ronde)
+        tours = 0
+        while self.joueur_courant.dés:
+            self.jouer_un_tour()
+            tours += 1
+        self.tours_par_ronde.append(tours)
+
+    def jouer_un_tour(self):
+        """
+        Méthode qui permet au joueur courant de jouer un tour sans affichage.
+        Returns:
+            Joueur: Le joueur gagnant, si le joueur courant gagne le tour, None autrement.
+        """
+        self.gerer_dés_1_et_6()
+        if not self.joueur_courant.dés:
+            return self.joueur_courant
+        self.passer_au_prochain_joueur()
+        return None
+
+    def gerer_dés_1_et_6(self):
+        """
+        Méthode qui lance les dés du joueur courant, retire ceux de valeur 1 et passe ceux de valeur 6, sans message.
+        Comme la valeur des autres dés n'est jamais vue, le lancer se résume au nombre de 1 et au nombre de 6, tirés
+        d'un seul coup de leur loi conjointe (voir distributions.tirer_1_et_6): le coût d'un tour ne dépend pas du
+        nombre de dés. Si la partie a un journal ou un observateur, le total du lancer est tiré du même réel (voir
+        distributions.tirer_lancer) et enregistré avec l'événement LANCER: la suite de la partie ne change pas.
+        """
+        nombre_dés = self.joueur_courant.dés.nombre
+        if self.journal is None and self.observateur is None:
+            nombre_1, nombre_6 = tirer_1_et_6(nombre_dés, self.source)
+        else:
+            nombre_1, nombre_6, total = tirer_lancer(nombre_dés, self.source)
+            self.enregistrer(evenements.LANCER, self.joueur_courant.identifiant, nombre_1, nombre_6, total)
+        self.deplacer_les_dés_1_et_6(nombre_1, nombre_6)
+
+    def deplacer_les_dés_1_et_6(self, nombre_1, nombre_6):
+        """
+        Méthode qui retire les dés de valeur 1 du joueur courant et passe ses dés de valeur 6 au joueur suivant, en
+        modifiant directement le nombre de dés de chacun. Les dés qui restent au joueur courant seront relancés avant
+        d'être comptés: leur valeur n'est pas gardée (ils valent 1, comme après Joueur.reinitialiser_dés).
+        L'événement LANCER est enregistré par gerer_dés_1_et_6, qui connaît le total du lancer.
+        Args:
+            nombre_1 (int): Nombre de dé(s) de valeur 1
+            nombre_6 (int): Nombre de dé(s) de valeur 6
+        """
+        dés = self.joueur_courant.dés
+        if nombre_1 or nombre_6:
+            dés.reinitialiser(dés.nombre - nombre_1 - nombre_6)
+        if nombre_6:
+            self.joueur_suivant.dés.ajouter(6, nombre_6)
+
+    def terminer_ronde(self):
+        """
+        Méthode qui accomplit le pointage de fin de ronde (mêmes étapes que la classe Partie, sans les messages).
+        """
+        self.jouer_dés_en_fin_de_ronde()
+        point_gagnant = self.ajuster_points_des_perdants_en_fin_de_ronde()
+        self.ajuster_points_du_gagnant(point_gagnant)
+        self.points_par_ronde.append(point_gagnant)
+        self.reinitialiser_dés_joueurs()
+        self.retirer_joueurs_sans_points()
+
+    def jouer_dés_en_fin_de_ronde(self):
+        """
+        Méthode qui fait jouer leurs dés aux joueurs actifs, sauf au gagnant de la ronde. Comme la valeur de chaque dé
+        n'est jamais vue, seule la somme des dés de chaque joueur est tirée, en un seul coup, de la loi de la somme
+        (voir distributions.tirer_somme_dés). Le gagnant est reconnu par identité plutôt qu'en comparant l'état
+        complet des joueurs.
+        """
+        self.gagnant = self.joueur_courant
+        self.sommes_fin_de_ronde = {}
+        for joueur in self.joueurs_actifs:
+            if joueur is not self.gagnant:
+                somme = tirer_somme_dés(joueur.dés.nombre, self.source)
+                self.sommes_fin_de_ronde[joueur.identifiant] = somme
+                if self.journal is not None or self.observateur is not None:
+                    self.enregistrer(evenements.LANCER_FIN_DE_RONDE, joueur.identifiant, joueur.dés.nombre, 0, somme)
+
+    def ajuster_points_des_perdants_en_fin_de_ronde(self):
+        """
+        Méthode qui retire à chaque perdant la somme de ses dés tirée en fin de ronde (ou tous ses points, s'il en a
+        moins) et qui fait la somme des points ainsi retirés.
+        Returns:
+            int: Somme des points retirés aux joueurs.
+        """
+        point_gagnant = 0
+        for joueur in self.joueurs_actifs:
+            if joueur is self.gagnant:
+                continue
+            point = min(self.sommes_fin_de_ronde[joueur.identifiant], joueur.score)
+            joueur.score -= point
+            point_gagnant += point
+            if self.journal is not None or self.observateur is not None:
+                self.enregistrer(evenements.TRANSFERT_POINTS, joueur.identifiant, 0, self.gagnant.identifiant, point)
+        return point_gagnant
+
+    def terminer_une_partie(self):
+        """
+        Méthode qui détermine les gagnants de la partie.
+        Returns:
+            ResultatPartie: Le résultat de la partie.
+        """
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.FIN_PARTIE, 0, 0, 0, min(self.ronde, RONDEMAX))
+        scores = [joueur.score for joueur in self.joueurs]
+        gagnants = [self.joueurs[index].identifiant for index in self.determiner_liste_gagnants()]
+        humains = tuple(isinstance(joueur, JoueurHumain) for joueur in self.joueurs)
+        return ResultatPartie(scores, gagnants, min(self.ronde, RONDEMAX), humains, self.tours_par_ronde,
+                              self.points_par_ronde, self.relances_bris_egalite, self.premier_joueur.identifiant,
+                              self.sens)
+
+    def jouer(self):
+        """
+        Méthode principale qui joue une partie complète sans affichage.
+        Returns:
+            ResultatPartie: Le résultat de la partie (scores finaux, gagnants et nombre de rondes jouées).
+        """
+        self.preparer_une_partie()
+        self.jouer_une_partie()
+        return self.terminer_une_partie()
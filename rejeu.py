@@ -0,0 +1,294 @@
+"""
+Module du rejeu des parties enregistrées dans un journal (voir le module journal).
+
+Le rejeu reconstruit l'état d'une partie (scores, nombre de dés de chaque joueur, joueurs actifs, joueur courant, sens
+et ronde) à partir de ses événements, sans relancer de dés. Pendant un premier passage, des instantanés de l'état sont
+gardés au début de chaque ronde et à intervalle régulier de tours: atteindre n'importe quel tour revient ensuite à
+restaurer un instantané et à rejouer au plus quelques dizaines d'événements.
+"""
+
+from bisect import bisect_right
+
+from pymafia import journal as evenements
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.partie_automatique import PartieAutomatique
+
+# Nombre de tours entre deux instantanés d'une même ronde
+INTERVALLE_INSTANTANES = 16
+
+
+class EtatRejeu:
+    """
+    Classe pour l'état d'une partie reconstruit à partir de ses événements. Les joueurs sont repérés par leur index
+    (identifiant - 1).
+
+    Attributes:
+        scores (list): Score de chaque joueur
+        dés (list): Nombre de dés de chaque joueur
+        actifs (list): True pour chaque joueur qui a encore des points
+        courant (int): Index du joueur courant
+        sens (int): Sens de la partie (1, croissant; -1, décroissant)
+        ronde (int): Numéro de la ronde actuelle (0 avant la première ronde)
+        tour (int): Nombre de tours joués dans la ronde actuelle
+        lancers_fin_de_ronde (dict): Total des dés lancés en fin de ronde par chaque perdant de la ronde actuelle
+        terminee (bool): True lorsque l'événement de fin de partie a été rejoué
+    """
+
+    def __init__(self, nombre_joueurs):
+        """
+        Constructeur de la classe EtatRejeu
+        Args:
+            nombre_joueurs (int): Nombre de joueurs de la partie
+        """
+        self.scores = [100] * nombre_joueurs
+        self.dés = [0] * nombre_joueurs
+        self.actifs = [True] * nombre_joueurs
+        self.courant = 0
+        self.sens = 1
+        self.ronde = 0
+        self.tour = 0
+        self.lancers_fin_de_ronde = {}
+        self.terminee = False
+
+    def joueur_suivant(self):
+        """
+        Méthode qui trouve le prochain joueur actif dans le sens de la partie (voir Partie.determiner_joueur_suivant).
+        Returns:
+            int: Index du joueur suivant
+        """
+        nombre = len(self.actifs)
+        index = (self.courant + self.sens) % nombre
+        while not self.actifs[index]:
+            index = (index + self.sens) % nombre
+        return index
+
+    def appliquer(self, evenement):
+        """
+        Méthode qui met à jour l'état avec un événement du journal.
+        Args:
+            evenement (tuple): L'événement (type, joueur, a, b, valeur)
+        """
+        type_evenement, joueur, a, b, valeur = evenement
+        if type_evenement == evenements.LANCER:
+            index = joueur - 1
+            self.courant = index
+            suivant = self.joueur_suivant()
+            self.dés[index] -= a + b
+            self.dés[suivant] += b
+            self.tour += 1
+            if self.dés[index]:
+                self.courant = suivant
+        elif type_evenement == evenements.DEBUT_RONDE:
+            self.ronde = valeur
+            self.tour = 0
+            self.dés = [5] * len(self.dés)
+            self.lancers_fin_de_ronde = {}
+        elif type_evenement == evenements.LANCER_FIN_DE_RONDE:
+            self.lancers_fin_de_ronde[joueur - 1] = valeur
+        elif type_evenement == evenements.TRANSFERT_POINTS:
+            self.scores[joueur - 1] -= valeur
+            self.scores[b - 1] += valeur
+        elif type_evenement == evenements.ELIMINATION:
+            self.actifs[joueur - 1] = False
+        elif type_evenement in (evenements.PREMIER_JOUEUR, evenements.SENS):
+            self.courant = joueur - 1
+            if type_evenement == evenements.SENS:
+                self.sens = valeur
+        elif type_evenement == evenements.FIN_PARTIE:
+            self.terminee = True
+
+    def instantane(self):
+        """
+        Méthode qui retourne une copie compacte et immuable de l'état.
+        Returns:
+            tuple: L'instantané de l'état
+        """
+        return (tuple(self.scores), tuple(self.dés), tuple(self.actifs), self.courant, self.sens, self.ronde,
+                self.tour, tuple(self.lancers_fin_de_ronde.items()), self.terminee)
+
+    @staticmethod
+    def restaurer(instantane):
+        """
+        Méthode statique qui recrée un état à partir d'un instantané.
+        Args:
+            instantane (tuple): Instantané retourné par la méthode instantane
+        Returns:
+            EtatRejeu: L'état restauré
+        """
+        scores, dés, actifs, courant, sens, ronde, tour, lancers, terminee = instantane
+        etat = EtatRejeu(len(scores))
+        etat.scores = list(scores)
+        etat.dés = list(dés)
+        etat.actifs = list(actifs)
+        etat.courant = courant
+        etat.sens = sens
+        etat.ronde = ronde
+        etat.tour = tour
+        etat.lancers_fin_de_ronde = dict(lancers)
+        etat.terminee = terminee
+        return etat
+
+    def vers_partie(self, source=None, types_joueurs=None):
+        """
+        Méthode qui construit une partie automatique dans le même état. Pour la continuer, il suffit d'appeler
+        jouer_une_partie puis terminer_une_partie (et non jouer, qui recommencerait la partie). Les dés des joueurs
+        n'ont pas encore été lancés (ils valent 1, comme après Joueur.reinitialiser_dés). Les joueurs gardent leur
+        place et ne sont pas mélangés: avec la même source de hasard (dans le même état), la partie se poursuit
+        exactement comme la partie enregistrée.
+        Args:
+            source (SourceAleatoire, optional): Source de hasard de la nouvelle partie
+            types_joueurs (list, optional): Classe du joueur de chaque siège, dans l'ordre des identifiants. Le journal
+                ne donne que le nombre de joueurs humains, et non leur place: il faut donc passer les types de la
+                partie enregistrée pour les garder. Par défaut, tous les joueurs sont des joueurs ordinateurs.
+        Returns:
+            PartieAutomatique: La partie
+        Raises:
+            ValueError: Si le nombre de types de joueurs n'est pas le nombre de joueurs de la partie
+        """
+        if types_joueurs is None:
+            types_joueurs = [JoueurOrdinateur] * len(self.scores)
+        elif len(types_joueurs) != len(self.scores):
+            raise ValueError("Il faut un type de joueur pour chacun des {} joueurs.".format(len(self.scores)))
+        partie = PartieAutomatique(len(self.scores), source, types_joueurs=types_joueurs)
+        for index, joueur in enumerate(partie.joueurs):
+            joueur.score = self.scores[index]
+            joueur.dés.reinitialiser(self.dés[index])
+        partie.joueurs_actifs = partie._anneau_des_places(
+            partie.joueurs, [index for index, actif in enumerate(self.actifs) if actif])
+        partie.joueur_courant = partie.joueurs[self.courant]
+        partie.premier_joueur = partie.joueur_courant
+        partie.sens = self.sens
+        partie.ronde = max(self.ronde, 1)
+        partie.determiner_joueur_suivant()
+        return partie
+
+
+class Rejeu:
+    """
+    Classe qui permet de se déplacer rapidement dans une partie enregistrée.
+
+    Attributes:
+        evenements (list): Événements de la partie
+        nombre_joueurs (int): Nombre de joueurs de la partie
+        intervalle (int): Nombre de tours entre deux instantanés d'une même ronde
+        instantanes (list): Instantanés (position dans la liste d'événements, état) triés par (ronde, tour)
+    """
+
+    def __init__(self, evenements_partie, intervalle=INTERVALLE_INSTANTANES):
+        """
+        Constructeur de la classe Rejeu. Les événements sont rejoués une première fois pour prendre les instantanés.
+        Args:
+            evenements_partie (iterable): Événements d'une seule partie, en commençant par l'événement DEBUT_PARTIE
+            intervalle (int, optional): Nombre de tours entre deux instantanés d'une même ronde
+        """
+        self.evenements = list(evenements_partie)
+        if not self.evenements or self.evenements[0][0] != evenements.DEBUT_PARTIE:
+            raise ValueError("Le journal doit commencer par l'événement de début de partie.")
+        self.nombre_joueurs = self.evenements[0][2]
+        self.intervalle = intervalle
+        self.instantanes = []
+        self._cles = []
+        etat = EtatRejeu(self.nombre_joueurs)
+        for position, evenement in enumerate(self.evenements):
+            etat.appliquer(evenement)
+            debut_ronde = evenement[0] == evenements.DEBUT_RONDE
+            if debut_ronde or (evenement[0] == evenements.LANCER and etat.tour % intervalle == 0):
+                self._cles.append((etat.ronde, etat.tour))
+                self.instantanes.append((position + 1, etat.instantane()))
+        self._etat_final = etat.instantane()
+
+    def aller_a(self, ronde, tour=0):
+        """
+        Méthode qui retourne l'état de la partie après un certain nombre de tours d'une ronde.
+        Args:
+            ronde (int): Numéro de la ronde
+            tour (int, optional): Nombre de tours joués dans la ronde (0 pour le début de la ronde)
+        Returns:
+            EtatRejeu: L'état de la partie
+        Raises:
+            ValueError: Si la ronde n'a pas été jouée ou si elle a moins de tours que demandé
+        """
+        index = bisect_right(self._cles, (ronde, tour)) - 1
+        if index < 0 or self._cles[index][0] != ronde:
+            raise ValueError("La ronde {} n'a pas été jouée.".format(ronde))
+        position, instantane = self.instantanes[index]
+        etat = EtatRejeu.restaurer(instantane)
+        while etat.tour < tour:
+            if position == len(self.evenements) or self.evenements[position][0] == evenements.DEBUT_RONDE:
+                raise ValueError("La ronde {} compte moins de {} tours.".format(ronde, tour))
+            etat.appliquer(self.evenements[position])
+            position += 1
+        return etat
+
+    def etat_final(self):
+        """
+        Méthode qui retourne l'état de la partie après le dernier événement.
+        Returns:
+            EtatRejeu: L'état final
+        """
+        return EtatRejeu.restaurer(self._etat_final)
+
+
+def decouper_parties(flux_evenements):
+    """
+    Fonction qui sépare un flux d'événements contenant plusieurs parties à la suite.
+    Args:
+        flux_evenements (iterable): Événements de une ou plusieurs parties
+    Returns:
+        iterator: La liste des événements de chaque partie
+    """
+    partie = []
+    for evenement in flux_evenements:
+        if evenement[0] == evenements.DEBUT_PARTIE and partie:
+            yield partie
+            partie = []
+        partie.append(evenement)
+    if partie:
+        yield partie
+
+
+def pointage_standard(somme_dés, score):
+    """
+    Fonction qui donne les points qu'un perdant donne au gagnant en fin de ronde selon les règles du jeu (voir
+    Joueur.ajuster_score_en_fin_de_tour).
+    Args:
+        somme_dés (int): Total des dés lancés par le perdant en fin de ronde
+        score (int): Score du perdant avant le pointage
+    Returns:
+        int: Points donnés au gagnant
+    """
+    return min(somme_dés, score)
+
+
+def rejouer_parties(flux_evenements, pointage=pointage_standard):
+    """
+    Fonction qui rejoue à la suite toutes les parties d'un flux d'événements et qui recalcule leur pointage de fin de
+    ronde avec une règle donnée. Les lancers enregistrés sont réutilisés tels quels: seuls les points échangés en fin
+    de ronde (et donc les éliminations et les scores) sont recalculés. Un joueur éliminé par la nouvelle règle ne
+    reçoit plus de points, même si la partie enregistrée le faisait encore jouer.
+    Args:
+        flux_evenements (iterable): Événements de une ou plusieurs parties
+        pointage (function, optional): Fonction (somme des dés, score du perdant) -> points donnés au gagnant
+    Returns:
+        iterator: L'état final (EtatRejeu) de chaque partie, avec les scores recalculés
+    """
+    for evenements_partie in decouper_parties(flux_evenements):
+        etat = EtatRejeu(evenements_partie[0][2])
+        for evenement in evenements_partie:
+            type_evenement = evenement[0]
+            if type_evenement == evenements.TRANSFERT_POINTS or type_evenement == evenements.ELIMINATION:
+                continue
+            etat.appliquer(evenement)
+            if type_evenement == evenements.LANCER_FIN_DE_RONDE:
+                continue
+            if type_evenement == evenements.FIN_RONDE:
+                for index, somme_dés in etat.lancers_fin_de_ronde.items():
+                    if not etat.actifs[index]:
+                        continue
+                    points = pointage(somme_dés, etat.scores[index])
+                    etat.scores[index] -= points
+                    etat.scores[evenement[1] - 1] += points
+                    if etat.scores[index] <= 0:
+                        etat.actifs[index] = False
+        yield etat
+
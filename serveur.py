@@ -0,0 +1,569 @@
+"""
+Module du serveur de parties en ligne du jeu pymafia.
+
+Le serveur héberge plusieurs tables dans un seul processus, avec asyncio. Chaque table est une partie dont la boucle
+de jeu est une coroutine: un siège humain attend son message (lancer ou sens) sans bloquer les autres tables, un siège
+ordinateur (ou un siège humain dont le joueur s'est déconnecté) joue immédiatement. Après chaque tour, la table cède
+la main aux autres tables, ce qui borne le délai de réponse même lorsque des milliers de tables sont actives.
+
+Le protocole est fait de lignes de texte UTF-8, sur TCP ou sur un socket Unix. Commandes du client:
+    CREER <nombre de joueurs> <nombre de joueurs humains>   crée une table et y prend le premier siège humain
+    REJOINDRE <table>                                       prend le prochain siège humain libre d'une table
+    LANCER                                                  roule les dés (lorsque le serveur le demande)
+    SENS <1 ou -1>                                          choisit le sens de la partie (lorsque le serveur le demande)
+    QUITTER                                                 ferme la connexion
+Réponses du serveur:
+    TABLE <table>                   la table a été créée
+    SIEGE <table> <identifiant>     le client joue le joueur <identifiant> de la table
+    MESSAGE <texte>                 une ligne de l'affichage de la partie (envoyée à tous les joueurs de la table)
+    DEMANDE LANCER | DEMANDE SENS   c'est au client de jouer
+    FIN <table>                     la partie est terminée
+    ERREUR <texte>                  la commande est invalide
+
+La partie commence lorsque tous les sièges humains sont occupés: une table qui attend ses joueurs n'a pas encore de
+boucle de jeu et n'occupe que la mémoire de sa partie. Une table sans aucun joueur connecté n'assemble aucun
+message. Une connexion qui ne lit pas ses messages assez vite (plus de LIMITE_SORTIE octets en attente) est fermée, ce
+qui borne la mémoire utilisée par connexion.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from pymafia import journal as evenements
+from pymafia.affichage import Affichage
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.partie import Partie, RONDEMAX
+
+# Adresse par défaut du serveur
+HOTE = "127.0.0.1"
+PORT = 7777
+
+# Longueur maximale d'une ligne reçue, en octets
+LIMITE_LIGNE = 1024
+
+# Nombre de connexions qui peuvent attendre d'être acceptées
+FILE_CONNEXIONS = 1024
+
+# Nombre maximal d'octets en attente d'envoi vers une connexion avant qu'elle soit fermée
+LIMITE_SORTIE = 1 << 16
+
+# Journal (module logging) des erreurs du serveur
+_journal_erreurs = logging.getLogger(__name__)
+
+
+class AffichageTable(Affichage):
+    """
+    Affichage d'une table en ligne: chaque ligne des messages est envoyée à toutes les connexions de la table. Les
+    réponses aux questions de la partie sont attendues par la table avant que la partie ne les demande; demander
+    retourne donc simplement la réponse reçue.
+
+    Attributes:
+        connexions (list): Connexions des joueurs assis à la table
+        reponse (str): Réponse à donner à la prochaine question de la partie
+    """
+
+    def __init__(self):
+        """
+        Constructeur de la classe AffichageTable
+        """
+        self.connexions = []
+        self.reponse = "1"
+
+    @property
+    def actif(self):
+        """
+        Propriété qui indique si au moins un joueur est connecté à la table.
+        Returns:
+            bool: True si les messages seront lus, False autrement
+        """
+        return bool(self.connexions)
+
+    def afficher(self, gabarit="", *arguments):
+        """
+        Méthode qui envoie un message à tous les joueurs connectés de la table.
+        Args:
+            gabarit (str, optional): Le message, ou son gabarit s'il y a des arguments (voir str.format)
+            *arguments: Valeurs à insérer dans le gabarit
+        """
+        if not self.connexions:
+            return
+        message = gabarit.format(*arguments) if arguments else gabarit
+        lignes = "".join(["MESSAGE " + ligne + "\n" for ligne in message.split("\n")])
+        for connexion in self.connexions:
+            connexion.envoyer(lignes)
+
+    def demander(self, invite, *arguments):
+        """
+        Méthode qui retourne la réponse déjà reçue par la table.
+        Args:
+            invite (str): La question (ignorée)
+            *arguments: Valeurs à insérer dans la question (ignorées)
+        Returns:
+            str: La réponse
+        """
+        return self.reponse
+
+
+class Siege:
+    """
+    Classe pour un siège humain d'une table en ligne.
+
+    Attributes:
+        joueur (JoueurHumain): Le joueur de la partie assis à ce siège
+        connexion (Connexion): La connexion du client qui joue ce joueur (None si le siège est libre)
+        demande (str): Ce qui est attendu du client ("LANCER" ou "SENS"), None si rien n'est attendu
+        attente (asyncio.Future): Futur qui recevra la réponse du client
+    """
+
+    def __init__(self, joueur):
+        """
+        Constructeur de la classe Siege
+        Args:
+            joueur (JoueurHumain): Le joueur de la partie assis à ce siège
+        """
+        self.joueur = joueur
+        self.connexion = None
+        self.demande = None
+        self.attente = None
+
+    def repondre(self, reponse):
+        """
+        Méthode qui transmet la réponse du client à la table qui l'attend.
+        Args:
+            reponse (str): La réponse (None si le client s'est déconnecté)
+        """
+        if self.attente is not None and not self.attente.done():
+            self.attente.set_result(reponse)
+
+
+class TableEnLigne(Partie):
+    """
+    Classe pour une partie jouée par des clients du serveur. Cette classe hérite de la classe Partie et en réutilise
+    toutes les étapes; seule la boucle principale (jouer_en_ligne) est une coroutine, qui attend les messages des
+    joueurs humains avant d'appeler les étapes de Partie.
+
+    Attributes:
+        numero (int): Numéro de la table sur le serveur
+        sieges (dict): Siège de chaque joueur humain, par identifiant
+        commencee (bool): True lorsque la partie a commencé
+    """
+
+    def __init__(self, numero, nombre_joueurs, nombre_joueurs_humains, source=None):
+        """
+        Constructeur de la classe TableEnLigne
+        Args:
+            numero (int): Numéro de la table sur le serveur
+            nombre_joueurs (int): Nombre de joueurs de la partie
+            nombre_joueurs_humains (int): Nombre de sièges pour des clients
+            source (SourceAleatoire, optional): Source de hasard de la partie (la source par défaut si absente)
+        """
+        super().__init__(nombre_joueurs, nombre_joueurs_humains, source, AffichageTable())
+        self.numero = numero
+        self.sieges = {joueur.identifiant: Siege(joueur) for joueur in self.joueurs
+                       if isinstance(joueur, JoueurHumain)}
+        self.commencee = False
+
+    def complete(self):
+        """
+        Méthode qui vérifie si tous les sièges humains sont occupés.
+        Returns:
+            bool: True si la partie peut commencer, False autrement
+        """
+        return all(siege.connexion is not None for siege in self.sieges.values())
+
+    def asseoir(self, connexion):
+        """
+        Méthode qui assoit un client au prochain siège humain libre.
+        Args:
+            connexion (Connexion): La connexion du client
+        Returns:
+            Siege: Le siège du client, None si la table est pleine ou commencée
+        """
+        if self.commencee:
+            return None
+        for siege in self.sieges.values():
+            if siege.connexion is None:
+                siege.connexion = connexion
+                self.affichage.connexions.append(connexion)
+                return siege
+        return None
+
+    def liberer(self, siege):
+        """
+        Méthode qui libère le siège d'un client déconnecté. Si la partie est commencée, le joueur de ce siège joue
+        ensuite comme un ordinateur.
+        Args:
+            siege (Siege): Le siège à libérer
+        """
+        self.affichage.connexions.remove(siege.connexion)
+        siege.connexion = None
+        siege.repondre(None)
+
+    async def attendre(self, joueur, demande):
+        """
+        Coroutine qui attend la réponse d'un joueur humain. Elle retourne immédiatement pour un ordinateur ou pour un
+        siège libre.
+        Args:
+            joueur (Joueur): Le joueur dont c'est le tour
+            demande (str): Ce qui est attendu ("LANCER" ou "SENS")
+        Returns:
+            str: La réponse du client (None pour un ordinateur ou un siège libre)
+        """
+        siege = self.sieges.get(joueur.identifiant)
+        if siege is None or siege.connexion is None:
+            return None
+        siege.demande = demande
+        siege.attente = asyncio.get_running_loop().create_future()
+        siege.connexion.envoyer("DEMANDE " + demande + "\n")
+        try:
+            return await siege.attente
+        finally:
+            siege.demande = None
+            siege.attente = None
+
+    async def trouver_premier_joueur_en_ligne(self):
+        """
+        Coroutine qui détermine le premier joueur comme Partie.trouver_premier_joueur, en attendant que chaque joueur
+        humain lance ses dés.
+        """
+        self.affichage.afficher("Déterminons quel joueur débutera la partie!\n")
+        candidats = self.joueurs
+        while True:
+            totaux = []
+            for joueur in candidats:
+                await self.attendre(joueur, "LANCER")
+                joueur.rouler_dés()
+                totaux.append(joueur.calculer_points())
+                self.affichage.afficher("Joueur {} : {} Total des dés: {}\n", joueur.identifiant, joueur, totaux[-1])
+                if self.journal is not None or self.observateur is not None:
+                    self.enregistrer(evenements.PREMIER_LANCER, joueur.identifiant, 0, 0, totaux[-1])
+            candidats = [candidats[index] for index in Partie.trouver_indices_max(totaux)]
+            if len(candidats) == 1:
+                break
+            self.affichage.afficher("Bris d'égalité!\n")
+            if self.journal is not None or self.observateur is not None:
+                self.enregistrer(evenements.BRIS_ÉGALITÉ, 0, len(candidats))
+        self.premier_joueur = candidats[0]
+        self.affichage.afficher("Le joueur {}: commencera la partie!\n", self.premier_joueur.identifiant)
+
+    async def jouer_en_ligne(self):
+        """
+        Coroutine qui joue la partie (mêmes étapes que Partie.jouer). Elle est démarrée par le serveur lorsque tous les
+        sièges humains sont occupés.
+        """
+        self.commencee = True
+        # Préparer la partie
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.DEBUT_PARTIE, 0, len(self.joueurs), len(self.sieges))
+        self.afficher_joueurs()
+        await self.trouver_premier_joueur_en_ligne()
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.PREMIER_JOUEUR, self.premier_joueur.identifiant)
+        if isinstance(self.premier_joueur, JoueurHumain):
+            sens = await self.attendre(self.premier_joueur, "SENS")
+            self.affichage.reponse = sens if sens is not None else str(self.source.choisir_sens())
+        self.determiner_sens()
+        self.affichage.reponse = ""
+        if self.journal is not None or self.observateur is not None:
+            self.enregistrer(evenements.SENS, self.premier_joueur.identifiant, 0, 0, self.sens)
+        self.joueur_courant = self.premier_joueur
+        self.determiner_joueur_suivant()
+        self.reinitialiser_dés_joueurs()
+        # Jouer les rondes
+        while self.ronde <= RONDEMAX:
+            self.affichage.afficher("début de ronde: {}\n", self.ronde)
+            if self.journal is not None or self.observateur is not None:
+                self.enregistrer(evenements.DEBUT_RONDE, 0, 0, 0, self.ronde)
+            while not self.verifier_si_fin_de_ronde():
+                await self.attendre(self.joueur_courant, "LANCER")
+                self.jouer_un_tour()
+                # Laisser jouer les autres tables entre deux tours
+                await asyncio.sleep(0)
+            self.terminer_ronde()
+            if self.affichage.actif:
+                self.affichage.afficher(self.message_points_des_joueurs())
+            self.reinitialiser_dés_joueurs()
+            if len(self.joueurs_actifs) <= 1:
+                break
+            self.passer_a_la_ronde_suivante()
+        self.terminer_une_partie()
+        for connexion in self.affichage.connexions:
+            connexion.envoyer("FIN {}\n".format(self.numero))
+
+
+class Connexion:
+    """
+    Classe pour la connexion d'un client au serveur.
+
+    Attributes:
+        lecteur (asyncio.StreamReader): Flux des lignes reçues
+        ecrivain (asyncio.StreamWriter): Flux des lignes envoyées
+        table (TableEnLigne): Table où le client est assis (None s'il n'est assis nulle part)
+        siege (Siege): Siège du client à sa table
+    """
+
+    def __init__(self, lecteur, ecrivain):
+        """
+        Constructeur de la classe Connexion
+        Args:
+            lecteur (asyncio.StreamReader): Flux des lignes reçues
+            ecrivain (asyncio.StreamWriter): Flux des lignes envoyées
+        """
+        self.lecteur = lecteur
+        self.ecrivain = ecrivain
+        self.table = None
+        self.siege = None
+
+    def envoyer(self, texte):
+        """
+        Méthode qui envoie du texte au client sans attendre. Si le client a déjà trop de texte en attente, la
+        connexion est fermée.
+        Args:
+            texte (str): Une ou plusieurs lignes terminées par un saut de ligne
+        """
+        transport = self.ecrivain.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > LIMITE_SORTIE:
+            transport.abort()
+            return
+        self.ecrivain.write(texte.encode())
+
+
+class ServeurPymafia:
+    """
+    Classe du serveur qui héberge les tables en ligne.
+
+    Attributes:
+        tables (dict): Tables en cours, par numéro
+        source (SourceAleatoire): Source de hasard de toutes les tables (la source par défaut si None)
+    """
+
+    def __init__(self, source=None):
+        """
+        Constructeur de la classe ServeurPymafia
+        Args:
+            source (SourceAleatoire, optional): Source de hasard de toutes les tables (la source par défaut si absente)
+        """
+        self.tables = {}
+        self.source = source
+        self._prochain_numero = 1
+        self._taches = {}
+        self._connexions = set()
+
+    def creer_table(self, nombre_joueurs, nombre_joueurs_humains):
+        """
+        Méthode qui crée une table. Une table sans siège humain commence immédiatement; les autres commencent lorsque
+        leur dernier siège humain est occupé.
+        Args:
+            nombre_joueurs (int): Nombre de joueurs de la partie (entre 2 et 8)
+            nombre_joueurs_humains (int): Nombre de sièges pour des clients
+        Returns:
+            TableEnLigne: La table
+        """
+        numero = self._prochain_numero
+        self._prochain_numero += 1
+        table = TableEnLigne(numero, nombre_joueurs, nombre_joueurs_humains, self.source)
+        self.tables[numero] = table
+        if table.complete():
+            self.commencer_table(table)
+        return table
+
+    def commencer_table(self, table):
+        """
+        Méthode qui démarre la boucle de jeu d'une table. La table est retirée du serveur lorsque sa partie se termine.
+        Args:
+            table (TableEnLigne): La table
+        """
+        tache = asyncio.get_running_loop().create_task(table.jouer_en_ligne())
+        self._taches[table.numero] = tache
+        tache.add_done_callback(lambda _: self._terminer_table(table.numero, tache))
+
+    def _terminer_table(self, numero, tache):
+        """
+        Méthode appelée à la fin de la boucle de jeu d'une table: l'erreur qui l'a arrêtée, s'il y en a une, est
+        journalisée, puis la table est fermée.
+        Args:
+            numero (int): Numéro de la table
+            tache (asyncio.Task): La boucle de jeu terminée
+        """
+        if not tache.cancelled() and tache.exception() is not None:
+            _journal_erreurs.error("La table %d s'est arrêtée sur une erreur.", numero, exc_info=tache.exception())
+        self.fermer_table(numero)
+
+    def fermer_table(self, numero):
+        """
+        Méthode qui retire une table du serveur et arrête sa boucle de jeu si elle n'est pas terminée.
+        Args:
+            numero (int): Numéro de la table
+        """
+        table = self.tables.pop(numero, None)
+        if table is not None:
+            for siege in table.sieges.values():
+                if siege.connexion is not None:
+                    siege.connexion.table = None
+                    siege.connexion.siege = None
+        tache = self._taches.pop(numero, None)
+        if tache is not None and not tache.done():
+            tache.cancel()
+
+    def traiter_commande(self, connexion, ligne):
+        """
+        Méthode qui exécute une commande d'un client.
+        Args:
+            connexion (Connexion): La connexion du client
+            ligne (str): La commande reçue
+        Returns:
+            bool: False si le client a demandé à quitter, True autrement
+        """
+        mots = ligne.split()
+        if not mots:
+            return True
+        commande = mots[0].upper()
+        if commande == "QUITTER":
+            return False
+        if commande == "CREER":
+            if connexion.table is not None:
+                connexion.envoyer("ERREUR vous êtes déjà assis à une table\n")
+            elif (len(mots) != 3 or not mots[1].isdigit() or not mots[2].isdigit()
+                  or not 2 <= int(mots[1]) <= 8 or not 1 <= int(mots[2]) <= int(mots[1])):
+                connexion.envoyer("ERREUR usage: CREER <joueurs entre 2 et 8> <humains entre 1 et joueurs>\n")
+            else:
+                table = self.creer_table(int(mots[1]), int(mots[2]))
+                connexion.envoyer("TABLE {}\n".format(table.numero))
+                self.asseoir(connexion, table)
+        elif commande == "REJOINDRE":
+            table = self.tables.get(int(mots[1])) if len(mots) == 2 and mots[1].isdigit() else None
+            if connexion.table is not None:
+                connexion.envoyer("ERREUR vous êtes déjà assis à une table\n")
+            elif table is None:
+                connexion.envoyer("ERREUR table inconnue\n")
+            else:
+                self.asseoir(connexion, table)
+        elif commande in ("LANCER", "SENS"):
+            siege = connexion.siege
+            if siege is None or siege.demande != commande:
+                connexion.envoyer("ERREUR ce n'est pas à vous de jouer\n")
+            elif commande == "SENS" and (len(mots) != 2 or mots[1] not in ("1", "-1")):
+                connexion.envoyer("ERREUR usage: SENS <1 ou -1>\n")
+            else:
+                siege.repondre(mots[1] if commande == "SENS" else "")
+        else:
+            connexion.envoyer("ERREUR commande inconnue\n")
+        return True
+
+    def asseoir(self, connexion, table):
+        """
+        Méthode qui assoit un client à une table.
+        Args:
+            connexion (Connexion): La connexion du client
+            table (TableEnLigne): La table
+        """
+        siege = table.asseoir(connexion)
+        if siege is None:
+            connexion.envoyer("ERREUR la table est pleine\n")
+            return
+        connexion.table = table
+        connexion.siege = siege
+        connexion.envoyer("SIEGE {} {}\n".format(table.numero, siege.joueur.identifiant))
+        if table.complete():
+            self.commencer_table(table)
+
+    def quitter(self, connexion):
+        """
+        Méthode qui retire un client de sa table. Une table qui n'a pas commencé et qui n'a plus aucun client est
+        fermée.
+        Args:
+            connexion (Connexion): La connexion du client
+        """
+        table = connexion.table
+        if table is None:
+            return
+        table.liberer(connexion.siege)
+        connexion.table = None
+        connexion.siege = None
+        if table.numero not in self._taches and not table.affichage.connexions:
+            self.fermer_table(table.numero)
+
+    def accepter(self, lecteur, ecrivain):
+        """
+        Méthode appelée pour chaque nouveau client: elle lance la coroutine gerer_connexion dans une tâche gardée par
+        le serveur. Une tâche annulée (à l'arrêt du serveur) se termine sans message; une autre erreur est journalisée.
+        Args:
+            lecteur (asyncio.StreamReader): Flux des lignes reçues
+            ecrivain (asyncio.StreamWriter): Flux des lignes envoyées
+        """
+        tache = asyncio.get_running_loop().create_task(self.gerer_connexion(lecteur, ecrivain))
+        self._connexions.add(tache)
+        tache.add_done_callback(self._terminer_connexion)
+
+    def _terminer_connexion(self, tache):
+        """
+        Méthode appelée à la fin de la tâche d'une connexion.
+        Args:
+            tache (asyncio.Task): La tâche terminée
+        """
+        self._connexions.discard(tache)
+        if not tache.cancelled() and tache.exception() is not None:
+            _journal_erreurs.error("Une connexion s'est arrêtée sur une erreur.", exc_info=tache.exception())
+
+    async def gerer_connexion(self, lecteur, ecrivain):
+        """
+        Coroutine qui lit et exécute les commandes d'un client jusqu'à sa déconnexion.
+        Args:
+            lecteur (asyncio.StreamReader): Flux des lignes reçues
+            ecrivain (asyncio.StreamWriter): Flux des lignes envoyées
+        """
+        connexion = Connexion(lecteur, ecrivain)
+        try:
+            while True:
+                try:
+                    ligne = await lecteur.readline()
+                except (ValueError, ConnectionError):
+                    break
+                if not ligne or not self.traiter_commande(connexion, ligne.decode(errors="replace")):
+                    break
+        finally:
+            # Le client quitte sa table et sa connexion est fermée dans tous les cas, y compris lorsque la tâche est
+            # annulée à l'arrêt du serveur: l'annulation continue ensuite jusqu'à _terminer_connexion.
+            self.quitter(connexion)
+            ecrivain.close()
+
+    async def demarrer(self, hote=HOTE, port=PORT, chemin=None):
+        """
+        Coroutine qui ouvre le serveur.
+        Args:
+            hote (str, optional): Adresse TCP d'écoute
+            port (int, optional): Port TCP d'écoute
+            chemin (str, optional): Chemin d'un socket Unix (s'il est donné, le serveur n'écoute pas sur TCP)
+        Returns:
+            asyncio.Server: Le serveur ouvert
+        """
+        if chemin is not None:
+            return await asyncio.start_unix_server(self.accepter, chemin, limit=LIMITE_LIGNE,
+                                                   backlog=FILE_CONNEXIONS)
+        return await asyncio.start_server(self.accepter, hote, port, limit=LIMITE_LIGNE, backlog=FILE_CONNEXIONS)
+
+
+async def servir(hote=HOTE, port=PORT, chemin=None):
+    """
+    Coroutine qui ouvre un serveur et le garde ouvert indéfiniment.
+    Args:
+        hote (str, optional): Adresse TCP d'écoute
+        port (int, optional): Port TCP d'écoute
+        chemin (str, optional): Chemin d'un socket Unix
+    """
+    serveur = await ServeurPymafia().demarrer(hote, port, chemin)
+    async with serveur:
+        await serveur.serve_forever()
+
+
+if __name__ == '__main__':
+    analyseur = argparse.ArgumentParser(prog="python -m pymafia.serveur",
+                                        description="Serveur de parties en ligne du jeu pymafia.")
+    analyseur.add_argument("--hote", default=HOTE, help="Adresse TCP d'écoute")
+    analyseur.add_argument("--port", type=int, default=PORT, help="Port TCP d'écoute")
+    analyseur.add_argument("--unix", help="Chemin d'un socket Unix où écouter plutôt que sur TCP")
+    options = analyseur.parse_args()
+    asyncio.run(servir(options.hote, options.port, options.unix))
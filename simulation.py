@@ -0,0 +1,253 @@
+"""
+Module de simulation de parties automatiques sur plusieurs processus.
+
+Les parties sont regroupées en blocs de taille fixe, distribués aux processus. Chaque partie reçoit sa propre source
+de hasard à compteur (SourceCompteur), fonction pure de la graine maîtresse et du numéro de la partie: le résultat
+d'une partie ne dépend donc ni du processus qui la joue, ni du nombre de processus, ni de la machine, et n'importe
+quelle partie peut être rejouée seule avec reproduire_partie. Les rapports des blocs sont ensuite fusionnés en
+additionnant leurs compteurs.
+"""
+
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from pymafia.aleatoire import SourceCompteur
+from pymafia.partie_automatique import PartieAutomatique
+
+# Nombre de parties jouées par un processus avant de retourner son rapport
+TAILLE_BLOC = 1000
+
+
+def source_de_partie(graine_maitresse, index_partie):
+    """
+    Fonction qui crée la source de hasard d'une partie à partir de la graine maîtresse et du numéro de la partie. La
+    création se fait en temps constant, peu importe le numéro. Deux parties différentes (ou deux graines maîtresses
+    différentes) reçoivent toujours deux sources indépendantes.
+    Args:
+        graine_maitresse (int): Graine maîtresse de la simulation (entier positif ou nul)
+        index_partie (int): Numéro de la partie dans la simulation
+    Returns:
+        SourceCompteur: La source de la partie
+    """
+    return SourceCompteur(graine_maitresse, index_partie)
+
+
+def reproduire_partie(nombre_joueurs, graine_maitresse, index_partie, journal=None):
+    """
+    Fonction qui rejoue une seule partie d'une simulation, sans jouer les parties qui la précèdent. Le résultat est
+    identique à celui obtenu pendant la simulation, peu importe le nombre de processus et la taille des blocs.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs à chaque table
+        graine_maitresse (int): Graine maîtresse de la simulation
+        index_partie (int): Numéro de la partie dans la simulation
+        journal (JournalBinaire ou JournalJson, optional): Journal où enregistrer les actions de la partie
+    Returns:
+        ResultatPartie: Le résultat de la partie
+    """
+    partie = PartieAutomatique(nombre_joueurs, source_de_partie(graine_maitresse, index_partie))
+    partie.journal = journal
+    return partie.jouer()
+
+
+class RapportSimulation:
+    """
+    Classe qui regroupe les statistiques d'un ensemble de parties automatiques. Deux rapports peuvent être fusionnés;
+    le résultat ne dépend pas de l'ordre des fusions.
+
+    Attributes:
+        nombre_joueurs (int): Nombre de joueurs à chaque table
+        nombre_parties (int): Nombre de parties comptées
+        victoires (list): Nombre de victoires de chaque siège (un siège à égalité au premier rang gagne aussi)
+        scores (list): Pour chaque siège, un Counter du nombre de parties terminées avec chaque score
+        rondes (Counter): Nombre de parties terminées après chaque nombre de rondes
+    """
+
+    def __init__(self, nombre_joueurs):
+        """
+        Constructeur de la classe RapportSimulation
+        Args:
+            nombre_joueurs (int): Nombre de joueurs à chaque table
+        """
+        self.nombre_joueurs = nombre_joueurs
+        self.nombre_parties = 0
+        self.victoires = [0] * nombre_joueurs
+        self.scores = [Counter() for _ in range(nombre_joueurs)]
+        self.rondes = Counter()
+
+    def ajouter(self, resultat):
+        """
+        Méthode qui ajoute le résultat d'une partie au rapport.
+        Args:
+            resultat (ResultatPartie): Le résultat de la partie
+        """
+        self.nombre_parties += 1
+        for identifiant in resultat.gagnants:
+            self.victoires[identifiant - 1] += 1
+        for siege, score in enumerate(resultat.scores):
+            self.scores[siege][score] += 1
+        self.rondes[resultat.nombre_rondes] += 1
+
+    def fusionner(self, autre):
+        """
+        Méthode qui ajoute à ce rapport les statistiques d'un autre rapport.
+        Args:
+            autre (RapportSimulation): Le rapport à fusionner (même nombre de joueurs)
+        """
+        self.nombre_parties += autre.nombre_parties
+        for siege in range(self.nombre_joueurs):
+            self.victoires[siege] += autre.victoires[siege]
+            self.scores[siege].update(autre.scores[siege])
+        self.rondes.update(autre.rondes)
+
+    def taux_de_victoire(self):
+        """
+        Méthode qui calcule la proportion des parties gagnées par chaque siège.
+        Returns:
+            list: Taux de victoire de chaque siège
+        """
+        return [victoires / self.nombre_parties if self.nombre_parties else 0.0 for victoires in self.victoires]
+
+    def score_moyen(self):
+        """
+        Méthode qui calcule le score final moyen de chaque siège.
+        Returns:
+            list: Score moyen de chaque siège
+        """
+        return [sum(score * nombre for score, nombre in scores.items()) / self.nombre_parties
+                if self.nombre_parties else 0.0 for scores in self.scores]
+
+    def nombre_rondes_moyen(self):
+        """
+        Méthode qui calcule le nombre moyen de rondes jouées par partie.
+        Returns:
+            float: Nombre moyen de rondes
+        """
+        if not self.nombre_parties:
+            return 0.0
+        return sum(rondes * nombre for rondes, nombre in self.rondes.items()) / self.nombre_parties
+
+    def __eq__(self, other):
+        """
+        Méthode qui définit l'opérateur == pour la classe RapportSimulation
+        Args:
+            other (RapportSimulation): autre rapport pour la comparaison
+        Returns:
+            bool: True si les deux rapports contiennent les mêmes statistiques, False autrement
+        """
+        if not isinstance(other, type(self)):
+            return False
+        return self.__dict__ == other.__dict__
+
+
+def simuler_bloc(nombre_joueurs, graine_maitresse, debut, fin, type_rapport=RapportSimulation):
+    """
+    Fonction qui joue les parties debut à fin - 1 d'une simulation. Chaque partie a sa propre source de hasard.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs à chaque table
+        graine_maitresse (int): Graine maîtresse de la simulation
+        debut (int): Numéro de la première partie du bloc
+        fin (int): Numéro suivant la dernière partie du bloc
+        type_rapport (type, optional): Classe du rapport (RapportSimulation ou StatistiquesParties)
+    Returns:
+        RapportSimulation: Le rapport des parties du bloc (de la classe type_rapport)
+    """
+    rapport = type_rapport(nombre_joueurs)
+    for index_partie in range(debut, fin):
+        source = source_de_partie(graine_maitresse, index_partie)
+        rapport.ajouter(PartieAutomatique(nombre_joueurs, source).jouer())
+    return rapport
+
+
+def simuler_bloc_detaille(nombre_joueurs, graine_maitresse, debut, fin, type_rapport=RapportSimulation):
+    """
+    Fonction qui joue les parties debut à fin - 1 d'une simulation, comme simuler_bloc, et qui garde aussi le résultat
+    de chaque partie.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs à chaque table
+        graine_maitresse (int): Graine maîtresse de la simulation
+        debut (int): Numéro de la première partie du bloc
+        fin (int): Numéro suivant la dernière partie du bloc
+        type_rapport (type, optional): Classe du rapport (RapportSimulation ou StatistiquesParties)
+    Returns:
+        RapportSimulation, list: Le rapport des parties du bloc et le ResultatPartie de chacune
+    """
+    rapport = type_rapport(nombre_joueurs)
+    resultats = []
+    for index_partie in range(debut, fin):
+        source = source_de_partie(graine_maitresse, index_partie)
+        resultats.append(PartieAutomatique(nombre_joueurs, source).jouer())
+        rapport.ajouter(resultats[-1])
+    return rapport, resultats
+
+
+def simuler_par_blocs(nombre_joueurs, nombre_parties, graine_maitresse, nombre_processus=None,
+                      taille_bloc=TAILLE_BLOC, type_rapport=RapportSimulation, garder_resultats=False):
+    """
+    Fonction génératrice qui joue les parties d'une simulation bloc par bloc et qui donne le rapport de chaque bloc
+    dès qu'il est prêt, dans l'ordre des blocs (ce qui permet par exemple de suivre la progression). Quelques blocs
+    d'avance sont confiés aux processus; ceux qui restent sont annulés lorsque l'appelant cesse de lire.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs à chaque table (entre 2 et 8)
+        nombre_parties (int): Nombre de parties à jouer
+        graine_maitresse (int): Graine maîtresse de la simulation (entier positif ou nul)
+        nombre_processus (int, optional): Nombre de processus (par défaut, le nombre de coeurs). Avec 1, les parties
+            sont jouées dans le processus courant.
+        taille_bloc (int, optional): Nombre de parties par bloc
+        type_rapport (type, optional): Classe des rapports (voir simuler)
+        garder_resultats (bool, optional): True pour obtenir aussi le ResultatPartie de chaque partie
+    Returns:
+        generator: Pour chaque bloc, un tuple (numéro de la première partie, numéro suivant la dernière partie,
+            rapport du bloc, liste des résultats du bloc ou None)
+    """
+    debuts = iter(range(0, nombre_parties, taille_bloc))
+    fonction = simuler_bloc_detaille if garder_resultats else simuler_bloc
+    if nombre_processus == 1:
+        for debut in debuts:
+            fin = min(debut + taille_bloc, nombre_parties)
+            bloc = fonction(nombre_joueurs, graine_maitresse, debut, fin, type_rapport)
+            yield (debut, fin) + (bloc if garder_resultats else (bloc, None))
+        return
+    with ProcessPoolExecutor(max_workers=nombre_processus) as executeur:
+        en_cours = deque()
+        try:
+            while True:
+                while len(en_cours) < 2 * (nombre_processus or os.cpu_count() or 1):
+                    debut = next(debuts, None)
+                    if debut is None:
+                        break
+                    fin = min(debut + taille_bloc, nombre_parties)
+                    en_cours.append((debut, fin, executeur.submit(fonction, nombre_joueurs, graine_maitresse, debut,
+                                                                  fin, type_rapport)))
+                if not en_cours:
+                    return
+                debut, fin, travail = en_cours.popleft()
+                bloc = travail.result()
+                yield (debut, fin) + (bloc if garder_resultats else (bloc, None))
+        finally:
+            for _, _, travail in en_cours:
+                travail.cancel()
+
+
+def simuler(nombre_joueurs, nombre_parties, graine_maitresse, nombre_processus=None, taille_bloc=TAILLE_BLOC,
+            type_rapport=RapportSimulation):
+    """
+    Fonction qui joue un nombre de parties automatiques réparties sur plusieurs processus et qui fusionne leurs
+    rapports. Pour une graine maîtresse donnée, le rapport est identique peu importe le nombre de processus.
+    Args:
+        nombre_joueurs (int): Nombre de joueurs à chaque table (entre 2 et 8)
+        nombre_parties (int): Nombre de parties à jouer
+        graine_maitresse (int): Graine maîtresse de la simulation (entier positif ou nul)
+        nombre_processus (int, optional): Nombre de processus (par défaut, le nombre de coeurs). Avec 1, les parties
+            sont jouées dans le processus courant.
+        taille_bloc (int, optional): Nombre de parties par bloc
+        type_rapport (type, optional): Classe du rapport: RapportSimulation, ou StatistiquesParties (module
+            statistiques) pour les distributions complètes. Elle doit offrir les méthodes ajouter et fusionner.
+    Returns:
+        RapportSimulation: Le rapport fusionné de toutes les parties (de la classe type_rapport)
+    """
+    rapport = type_rapport(nombre_joueurs)
+    for _, _, rapport_bloc, _ in simuler_par_blocs(nombre_joueurs, nombre_parties, graine_maitresse,
+                                                   nombre_processus, taille_bloc, type_rapport):
+        rapport.fusionner(rapport_bloc)
+    return rapport
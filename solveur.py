@@ -0,0 +1,301 @@
+"""
+Module de la classe SolveurRonde
+
+Pendant une ronde, seuls comptent le nombre de dés de chaque joueur actif, le joueur courant et le sens de la partie.
+Ce module calcule exactement, à partir de cet état, la probabilité que chaque joueur gagne la ronde ainsi que le nombre
+de dés qu'il lui restera en moyenne à la fin de la ronde.
+
+Un état est représenté sous forme canonique: le tuple des nombres de dés des joueurs actifs dans l'ordre où ils vont
+jouer, en commençant par le joueur courant. Ainsi, le sens et la position du joueur courant n'ont pas à faire partie de
+l'état.
+
+Un état de n joueurs qui comptent T dés en tout ne peut mener qu'à des états de n joueurs d'au plus T dés: il y en a
+comb(T + n, n). C'est ce nombre, et non le nombre de joueurs, qui borne le travail d'une résolution: le solveur refuse
+les états qui peuvent en atteindre plus de ÉTATS_MAX. Au début d'une ronde (5 dés par joueur), tous ces états sont
+atteignables: résoudre le début d'une ronde prend quelques millisecondes à 2 et 3 joueurs, environ 0,3 s à 4 joueurs et
+environ 6 s à 5 joueurs, la borne par défaut. Chaque joueur de plus multiplie le temps par plus de dix (environ 2
+minutes à 6 joueurs); une fin de ronde à 8 joueurs qui n'ont plus que quelques dés reste toutefois sous la borne.
+"""
+
+from array import array
+from functools import lru_cache
+from math import comb
+
+# Tolérance de la résolution itérative des états d'un même niveau (même nombre total de dés)
+TOLERANCE = 1e-14
+
+# Plus grand nombre d'états qu'une résolution peut atteindre: autant qu'au début d'une ronde de 5 joueurs (environ 6 s)
+ÉTATS_MAX = comb(6 * 5, 5)
+
+# Plus grand nombre de joueurs dont le début de ronde (5 dés chacun) reste sous ÉTATS_MAX
+JOUEURS_MAX = max(nombre for nombre in range(2, 9) if comb(6 * nombre, nombre) <= ÉTATS_MAX)
+
+
+@lru_cache(maxsize=None)
+def issues_lancer(nombre_dés):
+    """
+    Fonction qui donne la loi du nombre de 1 et du nombre de 6 lorsqu'on lance un certain nombre de dés (loi
+    multinomiale de probabilités 1/6, 1/6 et 4/6).
+    Args:
+        nombre_dés (int): Nombre de dés lancés
+    Returns:
+        tuple: Tuple de triplets (probabilité, nombre de 1, nombre de 6)
+    """
+    issues = []
+    for nombre_1 in range(nombre_dés + 1):
+        for nombre_6 in range(nombre_dés - nombre_1 + 1):
+            autres = nombre_dés - nombre_1 - nombre_6
+            probabilite = (comb(nombre_dés, nombre_1) * comb(nombre_dés - nombre_1, nombre_6)
+                           * 4 ** autres / 6 ** nombre_dés)
+            issues.append((probabilite, nombre_1, nombre_6))
+    return tuple(issues)
+
+
+def nombre_etats_atteignables(etat):
+    """
+    Fonction qui borne le nombre d'états qu'on peut atteindre à partir d'un état: les répartitions d'au plus autant de
+    dés entre autant de joueurs.
+    Args:
+        etat (tuple): État canonique
+    Returns:
+        int: Le nombre de répartitions
+    """
+    return comb(sum(etat) + len(etat), len(etat))
+
+
+def etat_canonique(dés_par_joueur, index_courant, sens):
+    """
+    Fonction qui met un état de ronde sous forme canonique.
+    Args:
+        dés_par_joueur (list): Nombre de dés de chaque joueur actif, dans l'ordre des sièges
+        index_courant (int): Index du joueur courant dans dés_par_joueur
+        sens (int): Sens de la partie (1, croissant; -1, décroissant)
+    Returns:
+        tuple, list: L'état canonique et l'ordre des index de dés_par_joueur correspondant à chaque position de l'état
+    """
+    nombre = len(dés_par_joueur)
+    ordre = [(index_courant + sens * decalage) % nombre for decalage in range(nombre)]
+    return tuple(dés_par_joueur[index] for index in ordre), ordre
+
+
+def _apres_lancer(etat, nombre_1, nombre_6):
+    """
+    Fonction qui donne l'état canonique après le lancer du joueur courant, lorsque celui-ci a encore des dés: les 6
+    sont passés au joueur suivant, qui devient le joueur courant.
+    Args:
+        etat (tuple): État canonique avant le lancer
+        nombre_1 (int): Nombre de dés de valeur 1 obtenus
+        nombre_6 (int): Nombre de dés de valeur 6 obtenus
+    Returns:
+        tuple: Le nouvel état canonique
+    """
+    return (etat[1] + nombre_6,) + etat[2:] + (etat[0] - nombre_1 - nombre_6,)
+
+
+def _ajouter_lois_suivant(lois, probabilite, lois_suivant, nombre):
+    """
+    Fonction qui ajoute aux lois d'un état (voir SolveurRonde._resoudre_niveau) les lois d'un état suivant, pondérées
+    par la probabilité d'y arriver: la position p + 1 de l'état actuel reçoit la loi de la position p de l'état
+    suivant. L'état suivant peut compter moins de dés: ses lois sont alors plus courtes.
+    Args:
+        lois (list): Lois de l'état actuel, modifiées sur place
+        probabilite (float): Probabilité d'arriver à l'état suivant
+        lois_suivant (list): Lois de l'état suivant
+        nombre (int): Nombre de positions des états
+    """
+    largeur = len(lois) // nombre
+    largeur_suivant = len(lois_suivant) // nombre
+    for position in range(nombre):
+        debut = position * largeur
+        debut_suivant = (position - 1) % nombre * largeur_suivant
+        lois[debut:debut + largeur_suivant] = [
+            valeur + probabilite * suivante for valeur, suivante in
+            zip(lois[debut:debut + largeur_suivant], lois_suivant[debut_suivant:debut_suivant + largeur_suivant])]
+
+
+class SolveurRonde:
+    """
+    Classe qui calcule la probabilité de victoire de chaque joueur d'une ronde, à partir du nombre de dés de chaque
+    joueur actif. Les transitions entre états suivent la loi des 1 et des 6 d'un lancer (voir
+    Partie.gerer_dés_1_et_6). Un lancer sans 1 garde le même nombre total de dés: les états d'un même total forment
+    donc des cycles et sont résolus ensemble, par itérations de Gauss-Seidel, une fois que les états de total inférieur
+    (atteints par les lancers avec des 1) sont connus. Tous les résultats sont conservés en mémoire.
+
+    Sur demande, le solveur calcule aussi la loi complète du nombre de dés qui resteront à chaque joueur en fin de ronde
+    (les dés qu'un perdant joue pour donner des points au gagnant), au prix de plus de temps et de mémoire.
+
+    Attributes:
+        cache (dict): Pour chaque état canonique résolu, le tuple des probabilités de victoire et le tuple du nombre
+        moyen de dés restants en fin de ronde, par position dans l'état
+        lois (dict): Pour chaque état canonique résolu, la loi du nombre de dés restants en fin de ronde de chaque
+        position (vide si avec_lois est False)
+        etats_max (int): Plus grand nombre d'états atteignables d'un état à résoudre (voir nombre_etats_atteignables)
+        avec_lois (bool): True pour calculer aussi les lois du nombre de dés restants
+    """
+
+    def __init__(self, etats_max=ÉTATS_MAX, avec_lois=False):
+        """
+        Constructeur de la classe SolveurRonde
+        Args:
+            etats_max (int, optional): Plus grand nombre d'états atteignables d'un état à résoudre
+            avec_lois (bool, optional): True pour calculer aussi les lois du nombre de dés restants
+        """
+        self.cache = {}
+        self.lois = {}
+        self.etats_max = etats_max
+        self.avec_lois = avec_lois
+
+    def probabilites_victoire(self, dés_par_joueur, index_courant, sens):
+        """
+        Méthode qui calcule la probabilité que chaque joueur actif gagne la ronde.
+        Args:
+            dés_par_joueur (list): Nombre de dés de chaque joueur actif, dans l'ordre des sièges
+            index_courant (int): Index du joueur courant dans dés_par_joueur
+            sens (int): Sens de la partie (1, croissant; -1, décroissant)
+        Returns:
+            list: Probabilité de victoire de chaque joueur, dans l'ordre de dés_par_joueur
+        """
+        return self.resoudre_siege(dés_par_joueur, index_courant, sens)[0]
+
+    def resoudre_siege(self, dés_par_joueur, index_courant, sens):
+        """
+        Méthode qui calcule la probabilité de victoire et le nombre moyen de dés restants en fin de ronde de chaque
+        joueur actif.
+        Args:
+            dés_par_joueur (list): Nombre de dés de chaque joueur actif, dans l'ordre des sièges
+            index_courant (int): Index du joueur courant dans dés_par_joueur
+            sens (int): Sens de la partie (1, croissant; -1, décroissant)
+        Returns:
+            list, list: Probabilité de victoire et nombre moyen de dés restants de chaque joueur, dans l'ordre de
+            dés_par_joueur
+        """
+        etat, ordre = etat_canonique(dés_par_joueur, index_courant, sens)
+        probabilites, esperances = self.resoudre(etat)
+        par_siege_probabilites = [0.0] * len(ordre)
+        par_siege_esperances = [0.0] * len(ordre)
+        for position, index in enumerate(ordre):
+            par_siege_probabilites[index] = probabilites[position]
+            par_siege_esperances[index] = esperances[position]
+        return par_siege_probabilites, par_siege_esperances
+
+    def probabilites_victoire_partie(self, partie):
+        """
+        Méthode qui calcule la probabilité que chaque joueur actif d'une partie en cours gagne la ronde.
+        Args:
+            partie (Partie): La partie
+        Returns:
+            dict: Probabilité de victoire associée à l'identifiant de chaque joueur actif
+        """
+        joueurs = list(partie.joueurs_actifs)
+        index_courant = [joueur.identifiant for joueur in joueurs].index(partie.joueur_courant.identifiant)
+        probabilites = self.probabilites_victoire([len(joueur) for joueur in joueurs], index_courant, partie.sens)
+        return {joueur.identifiant: probabilite for joueur, probabilite in zip(joueurs, probabilites)}
+
+    def resoudre(self, etat):
+        """
+        Méthode qui résout un état canonique (et tous les états de même total qu'il peut atteindre).
+        Args:
+            etat (tuple): État canonique (le joueur courant doit avoir au moins un dé)
+        Returns:
+            tuple, tuple: Probabilités de victoire et nombre moyen de dés restants, par position dans l'état
+        Raises:
+            ValueError: Si l'état peut atteindre plus de etats_max états
+        """
+        if etat not in self.cache:
+            if nombre_etats_atteignables(etat) > self.etats_max:
+                raise ValueError("L'état {} peut atteindre plus de {} états.".format(etat, self.etats_max))
+            self._resoudre_niveau(etat)
+        return self.cache[etat]
+
+    def lois_dés_restants(self, etat):
+        """
+        Méthode qui donne la loi du nombre de dés qui resteront à chaque joueur en fin de ronde (le gagnant n'en a
+        plus).
+        Args:
+            etat (tuple): État canonique (le joueur courant doit avoir au moins un dé)
+        Returns:
+            tuple: Pour chaque position dans l'état, la probabilité de finir la ronde avec 0, 1, ..., sum(etat) dés
+        Raises:
+            ValueError: Si le solveur ne calcule pas les lois, ou si l'état peut atteindre plus de etats_max états
+        """
+        if not self.avec_lois:
+            raise ValueError("Le solveur ne calcule pas les lois du nombre de dés restants (avec_lois=False).")
+        self.resoudre(etat)
+        largeur = sum(etat) + 1
+        lois = self.lois[etat]
+        return tuple(tuple(lois[debut:debut + largeur]) for debut in range(0, len(lois), largeur))
+
+    def _resoudre_niveau(self, depart):
+        """
+        Méthode qui résout tous les états non résolus de même total de dés atteignables à partir d'un état.
+        Args:
+            depart (tuple): État canonique de départ
+        """
+        nombre = len(depart)
+        # 1. Trouver les états du niveau atteignables par des lancers sans 1 qui ne terminent pas la ronde.
+        niveau = [depart]
+        connus = {depart}
+        for etat in niveau:
+            for nombre_6 in range(etat[0]):
+                suivant = _apres_lancer(etat, 0, nombre_6)
+                if suivant not in connus and suivant not in self.cache:
+                    connus.add(suivant)
+                    niveau.append(suivant)
+        # 2. Pour chaque état, séparer la partie connue (fins de ronde et états de total inférieur) des transitions
+        # vers les états du niveau. Après un lancer, le joueur suivant devient le joueur courant: la position p du
+        # résultat de l'état suivant correspond donc à la position p + 1 de l'état actuel. Les lois sont rangées à
+        # plat: la probabilité que la position p finisse avec d dés est à l'index p * (total + 1) + d.
+        largeur = sum(depart) + 1
+        taille_lois = largeur * nombre if self.avec_lois else 0
+        constantes = {}
+        transitions = {}
+        for etat in niveau:
+            probabilites = [0.0] * nombre
+            esperances = [0.0] * nombre
+            lois = [0.0] * taille_lois
+            internes = []
+            for probabilite, nombre_1, nombre_6 in issues_lancer(etat[0]):
+                restants = etat[0] - nombre_1 - nombre_6
+                if restants == 0:
+                    probabilites[0] += probabilite
+                    esperances[1] += probabilite * (etat[1] + nombre_6)
+                    for position in range(2, nombre):
+                        esperances[position] += probabilite * etat[position]
+                    if taille_lois:
+                        lois[0] += probabilite
+                        lois[largeur + etat[1] + nombre_6] += probabilite
+                        for position in range(2, nombre):
+                            lois[position * largeur + etat[position]] += probabilite
+                    continue
+                suivant = _apres_lancer(etat, nombre_1, nombre_6)
+                if suivant in connus:
+                    internes.append((probabilite, suivant))
+                    continue
+                probabilites_suivant, esperances_suivant = self.resoudre(suivant)
+                for position in range(nombre):
+                    probabilites[position] += probabilite * probabilites_suivant[position - 1]
+                    esperances[position] += probabilite * esperances_suivant[position - 1]
+                if taille_lois:
+                    _ajouter_lois_suivant(lois, probabilite, self.lois[suivant], nombre)
+            constantes[etat] = (probabilites, esperances, lois)
+            transitions[etat] = internes
+        # 3. Résoudre les états du niveau par itérations de Gauss-Seidel.
+        valeurs = {etat: constantes[etat] for etat in niveau}
+        ecart = 1.0
+        while ecart > TOLERANCE:
+            ecart = 0.0
+            for etat in niveau:
+                probabilites, esperances, lois = (list(valeur) for valeur in constantes[etat])
+                for probabilite, suivant in transitions[etat]:
+                    probabilites_suivant, esperances_suivant, lois_suivant = valeurs[suivant]
+                    for position in range(nombre):
+                        probabilites[position] += probabilite * probabilites_suivant[position - 1]
+                        esperances[position] += probabilite * esperances_suivant[position - 1]
+                    if taille_lois:
+                        _ajouter_lois_suivant(lois, probabilite, lois_suivant, nombre)
+                ecart = max(ecart, max(abs(a - b) for a, b in zip(probabilites, valeurs[etat][0])))
+                valeurs[etat] = (probabilites, esperances, lois)
+        for etat in niveau:
+            self.cache[etat] = (tuple(valeurs[etat][0]), tuple(valeurs[etat][1]))
+            if taille_lois:
+                self.lois[etat] = array("d", valeurs[etat][2])
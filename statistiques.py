@@ -0,0 +1,351 @@
+"""
+Module des statistiques cumulées sur un grand nombre de parties.
+
+Les statistiques sont mises à jour partie par partie, à partir du ResultatPartie de chaque partie automatique, et
+n'occupent qu'une quantité fixe de mémoire: chaque grandeur est résumée par un histogramme à classes fixes (avec une
+classe pour les valeurs trop petites et une pour les valeurs trop grandes) et par ses sommes exactes (nombre de
+valeurs, somme, somme des carrés, minimum et maximum). Mille parties ou dix milliards de parties occupent donc la même
+place.
+
+Deux objets StatistiquesParties peuvent être fusionnés, par exemple ceux de plusieurs processus ou de plusieurs
+machines. Toutes les grandeurs sont des entiers et leurs sommes sont gardées exactes: le résultat est exactement le
+même que si toutes les parties avaient été ajoutées au même objet, peu importe comment le travail a été partagé. La
+moyenne et la variance ne sont calculées qu'au moment du résumé. La méthode vers_dict et la méthode statique
+depuis_dict permettent de les transmettre en JSON.
+"""
+
+from pymafia.partie import RONDEMAX
+
+# Bornes et largeur des classes des histogrammes de chaque grandeur: (borne inférieure, borne supérieure, largeur)
+CLASSES_RONDES = (1, RONDEMAX + 1, 1)
+CLASSES_TOURS_PAR_RONDE = (1, 201, 1)
+CLASSES_POINTS_PAR_RONDE = (0, 800, 5)
+CLASSES_RELANCES = (0, 64, 1)
+CLASSES_SCORES = (0, 800, 10)
+
+# Types de joueurs pour les taux de victoire par type
+TYPES_JOUEURS = ("ordinateur", "humain")
+
+
+class Histogramme:
+    """
+    Classe pour la distribution d'une grandeur entière: un histogramme à classes de largeur fixe entre deux bornes, et
+    la somme et la somme des carrés des valeurs, en entiers exacts. La mémoire utilisée ne dépend pas du nombre de
+    valeurs ajoutées (à la taille des deux sommes près, qui grandissent comme le logarithme du nombre de valeurs).
+
+    Attributes:
+        borne_inferieure (int): Borne inférieure de la première classe
+        borne_superieure (int): Borne supérieure (exclue) de la dernière classe
+        largeur (int): Largeur de chaque classe
+        classes (list): Nombre de valeurs dans chaque classe; classes[0] compte les valeurs sous la borne inférieure
+            et classes[-1] les valeurs égales ou supérieures à la borne supérieure
+        nombre (int): Nombre de valeurs ajoutées
+        somme (int): Somme des valeurs
+        somme_carres (int): Somme des carrés des valeurs
+        minimum (int): Plus petite valeur (None s'il n'y a aucune valeur)
+        maximum (int): Plus grande valeur (None s'il n'y a aucune valeur)
+    """
+
+    def __init__(self, borne_inferieure, borne_superieure, largeur=1):
+        """
+        Constructeur de la classe Histogramme
+        Args:
+            borne_inferieure (int): Borne inférieure de la première classe
+            borne_superieure (int): Borne supérieure (exclue) de la dernière classe
+            largeur (int, optional): Largeur de chaque classe
+        """
+        self.borne_inferieure = borne_inferieure
+        self.borne_superieure = borne_superieure
+        self.largeur = largeur
+        self.classes = [0] * (-(-(borne_superieure - borne_inferieure) // largeur) + 2)
+        self.nombre = 0
+        self.somme = 0
+        self.somme_carres = 0
+        self.minimum = None
+        self.maximum = None
+
+    def ajouter(self, valeur):
+        """
+        Méthode qui ajoute une valeur à la distribution.
+        Args:
+            valeur (int): La valeur
+        """
+        if valeur < self.borne_inferieure:
+            self.classes[0] += 1
+        elif valeur >= self.borne_superieure:
+            self.classes[-1] += 1
+        else:
+            self.classes[(valeur - self.borne_inferieure) // self.largeur + 1] += 1
+        self.nombre += 1
+        self.somme += valeur
+        self.somme_carres += valeur * valeur
+        if self.minimum is None or valeur < self.minimum:
+            self.minimum = valeur
+        if self.maximum is None or valeur > self.maximum:
+            self.maximum = valeur
+
+    def fusionner(self, autre):
+        """
+        Méthode qui ajoute à cette distribution les valeurs d'une autre (mêmes classes). Les sommes sont additionnées:
+        la fusion est exacte.
+        Args:
+            autre (Histogramme): La distribution à fusionner
+        Raises:
+            ValueError: Si les deux histogrammes n'ont pas les mêmes classes
+        """
+        if (self.borne_inferieure, self.borne_superieure, self.largeur) != \
+                (autre.borne_inferieure, autre.borne_superieure, autre.largeur):
+            raise ValueError("Les deux histogrammes n'ont pas les mêmes classes.")
+        if not autre.nombre:
+            return
+        for classe, nombre in enumerate(autre.classes):
+            self.classes[classe] += nombre
+        self.nombre += autre.nombre
+        self.somme += autre.somme
+        self.somme_carres += autre.somme_carres
+        self.minimum = autre.minimum if self.minimum is None else min(self.minimum, autre.minimum)
+        self.maximum = autre.maximum if self.maximum is None else max(self.maximum, autre.maximum)
+
+    def moyenne(self):
+        """
+        Méthode qui calcule la moyenne de la distribution.
+        Returns:
+            float: La moyenne (0 s'il n'y a aucune valeur)
+        """
+        return self.somme / self.nombre if self.nombre else 0.0
+
+    def variance(self):
+        """
+        Méthode qui calcule la variance (échantillonnale) de la distribution. Le numérateur est calculé en entiers, sans
+        perte de précision.
+        Returns:
+            float: La variance (0 s'il y a moins de deux valeurs)
+        """
+        if self.nombre < 2:
+            return 0.0
+        return (self.nombre * self.somme_carres - self.somme * self.somme) / (self.nombre * (self.nombre - 1))
+
+    def ecart_type(self):
+        """
+        Méthode qui calcule l'écart type de la distribution.
+        Returns:
+            float: L'écart type
+        """
+        return self.variance() ** 0.5
+
+    def centile(self, rang):
+        """
+        Méthode qui estime un centile de la distribution à partir de l'histogramme: la borne supérieure de la classe
+        qui contient le centile (le maximum si c'est la dernière classe).
+        Args:
+            rang (float): Rang du centile, entre 0 et 100
+        Returns:
+            int: Le centile estimé (None s'il n'y a aucune valeur)
+        """
+        if not self.nombre:
+            return None
+        cible = rang / 100 * self.nombre
+        cumul = 0
+        for classe, nombre in enumerate(self.classes):
+            cumul += nombre
+            if cumul >= cible and nombre:
+                if classe == 0:
+                    return self.minimum
+                if classe == len(self.classes) - 1:
+                    return self.maximum
+                return min(self.borne_inferieure + classe * self.largeur - 1, self.maximum)
+        return self.maximum
+
+    def resume(self):
+        """
+        Méthode qui résume la distribution.
+        Returns:
+            dict: Nombre de valeurs, moyenne, écart type, minimum, médiane, 90e et 99e centiles et maximum
+        """
+        return {"nombre": self.nombre, "moyenne": self.moyenne(), "ecart_type": self.ecart_type(),
+                "minimum": self.minimum, "p50": self.centile(50), "p90": self.centile(90), "p99": self.centile(99),
+                "maximum": self.maximum}
+
+    def vers_dict(self):
+        """
+        Méthode qui retourne l'état complet de la distribution sous une forme qui peut être écrite en JSON.
+        Returns:
+            dict: L'état de la distribution
+        """
+        return {"classes": [self.borne_inferieure, self.borne_superieure, self.largeur], "effectifs": self.classes,
+                "nombre": self.nombre, "somme": self.somme, "somme_carres": self.somme_carres, "minimum": self.minimum,
+                "maximum": self.maximum}
+
+    @staticmethod
+    def depuis_dict(etat):
+        """
+        Méthode statique qui recrée une distribution à partir de son état.
+        Args:
+            etat (dict): État retourné par la méthode vers_dict
+        Returns:
+            Histogramme: La distribution
+        """
+        histogramme = Histogramme(*etat["classes"])
+        histogramme.classes = list(etat["effectifs"])
+        histogramme.nombre = etat["nombre"]
+        histogramme.somme = etat["somme"]
+        histogramme.somme_carres = etat["somme_carres"]
+        histogramme.minimum = etat["minimum"]
+        histogramme.maximum = etat["maximum"]
+        return histogramme
+
+
+class StatistiquesParties:
+    """
+    Classe qui cumule les statistiques d'un ensemble de parties à un même nombre de joueurs. Elle a la même interface
+    que RapportSimulation (ajouter et fusionner) et peut donc la remplacer dans la fonction simuler.
+
+    Attributes:
+        nombre_joueurs (int): Nombre de joueurs à chaque table
+        nombre_parties (int): Nombre de parties ajoutées
+        rondes (Histogramme): Nombre de rondes jouées par partie
+        tours_par_ronde (Histogramme): Nombre de tours joués dans chaque ronde
+        points_par_ronde (Histogramme): Nombre de points donnés au gagnant de chaque ronde
+        relances_bris_egalite (Histogramme): Nombre de lancers refaits par partie pour trouver le premier joueur
+        scores (list): Score final de chaque siège (un Histogramme par siège)
+        victoires_par_siege (list): Nombre de victoires de chaque siège (un siège à égalité au premier rang gagne
+            aussi)
+        joueurs_par_type (dict): Nombre de joueurs de chaque type (un par siège et par partie)
+        victoires_par_type (dict): Nombre de victoires des joueurs de chaque type
+    """
+
+    def __init__(self, nombre_joueurs):
+        """
+        Constructeur de la classe StatistiquesParties
+        Args:
+            nombre_joueurs (int): Nombre de joueurs à chaque table
+        """
+        self.nombre_joueurs = nombre_joueurs
+        self.nombre_parties = 0
+        self.rondes = Histogramme(*CLASSES_RONDES)
+        self.tours_par_ronde = Histogramme(*CLASSES_TOURS_PAR_RONDE)
+        self.points_par_ronde = Histogramme(*CLASSES_POINTS_PAR_RONDE)
+        self.relances_bris_egalite = Histogramme(*CLASSES_RELANCES)
+        self.scores = [Histogramme(*CLASSES_SCORES) for _ in range(nombre_joueurs)]
+        self.victoires_par_siege = [0] * nombre_joueurs
+        self.joueurs_par_type = dict.fromkeys(TYPES_JOUEURS, 0)
+        self.victoires_par_type = dict.fromkeys(TYPES_JOUEURS, 0)
+
+    def ajouter(self, resultat):
+        """
+        Méthode qui ajoute le résultat d'une partie aux statistiques.
+        Args:
+            resultat (ResultatPartie): Le résultat de la partie
+        """
+        self.nombre_parties += 1
+        self.rondes.ajouter(resultat.nombre_rondes)
+        for tours in resultat.tours_par_ronde:
+            self.tours_par_ronde.ajouter(tours)
+        for points in resultat.points_par_ronde:
+            self.points_par_ronde.ajouter(points)
+        self.relances_bris_egalite.ajouter(resultat.relances_bris_egalite)
+        for siege, score in enumerate(resultat.scores):
+            self.scores[siege].ajouter(score)
+        for humain in resultat.humains:
+            self.joueurs_par_type[TYPES_JOUEURS[humain]] += 1
+        for identifiant in resultat.gagnants:
+            self.victoires_par_siege[identifiant - 1] += 1
+            self.victoires_par_type[TYPES_JOUEURS[resultat.humains[identifiant - 1]]] += 1
+
+    def fusionner(self, autre):
+        """
+        Méthode qui ajoute à ces statistiques celles d'un autre ensemble de parties.
+        Args:
+            autre (StatistiquesParties): Les statistiques à fusionner (même nombre de joueurs)
+        Raises:
+            ValueError: Si les deux ensembles de parties n'ont pas le même nombre de joueurs
+        """
+        if autre.nombre_joueurs != self.nombre_joueurs:
+            raise ValueError("Les statistiques à fusionner n'ont pas le même nombre de joueurs.")
+        self.nombre_parties += autre.nombre_parties
+        self.rondes.fusionner(autre.rondes)
+        self.tours_par_ronde.fusionner(autre.tours_par_ronde)
+        self.points_par_ronde.fusionner(autre.points_par_ronde)
+        self.relances_bris_egalite.fusionner(autre.relances_bris_egalite)
+        for siege in range(self.nombre_joueurs):
+            self.scores[siege].fusionner(autre.scores[siege])
+            self.victoires_par_siege[siege] += autre.victoires_par_siege[siege]
+        for type_joueur in TYPES_JOUEURS:
+            self.joueurs_par_type[type_joueur] += autre.joueurs_par_type[type_joueur]
+            self.victoires_par_type[type_joueur] += autre.victoires_par_type[type_joueur]
+
+    def taux_de_victoire_par_siege(self):
+        """
+        Méthode qui calcule la proportion des parties gagnées par chaque siège.
+        Returns:
+            list: Taux de victoire de chaque siège
+        """
+        return [victoires / self.nombre_parties if self.nombre_parties else 0.0
+                for victoires in self.victoires_par_siege]
+
+    def taux_de_victoire_par_type(self):
+        """
+        Méthode qui calcule la proportion des joueurs de chaque type qui ont gagné leur partie.
+        Returns:
+            dict: Taux de victoire de chaque type de joueur (None s'il n'y a eu aucun joueur de ce type)
+        """
+        return {type_joueur: self.victoires_par_type[type_joueur] / self.joueurs_par_type[type_joueur]
+                if self.joueurs_par_type[type_joueur] else None for type_joueur in TYPES_JOUEURS}
+
+    def resume(self):
+        """
+        Méthode qui résume les statistiques.
+        Returns:
+            dict: Le résumé, qui peut être écrit en JSON
+        """
+        return {
+            "nombre_joueurs": self.nombre_joueurs,
+            "nombre_parties": self.nombre_parties,
+            "rondes": self.rondes.resume(),
+            "tours_par_ronde": self.tours_par_ronde.resume(),
+            "points_par_ronde": self.points_par_ronde.resume(),
+            "relances_bris_egalite": self.relances_bris_egalite.resume(),
+            "scores": [scores.resume() for scores in self.scores],
+            "taux_de_victoire_par_siege": self.taux_de_victoire_par_siege(),
+            "taux_de_victoire_par_type": self.taux_de_victoire_par_type(),
+        }
+
+    def vers_dict(self):
+        """
+        Méthode qui retourne l'état complet des statistiques sous une forme qui peut être écrite en JSON.
+        Returns:
+            dict: L'état des statistiques
+        """
+        return {
+            "nombre_joueurs": self.nombre_joueurs,
+            "nombre_parties": self.nombre_parties,
+            "rondes": self.rondes.vers_dict(),
+            "tours_par_ronde": self.tours_par_ronde.vers_dict(),
+            "points_par_ronde": self.points_par_ronde.vers_dict(),
+            "relances_bris_egalite": self.relances_bris_egalite.vers_dict(),
+            "scores": [scores.vers_dict() for scores in self.scores],
+            "victoires_par_siege": self.victoires_par_siege,
+            "joueurs_par_type": self.joueurs_par_type,
+            "victoires_par_type": self.victoires_par_type,
+        }
+
+    @staticmethod
+    def depuis_dict(etat):
+        """
+        Méthode statique qui recrée des statistiques à partir de leur état.
+        Args:
+            etat (dict): État retourné par la méthode vers_dict
+        Returns:
+            StatistiquesParties: Les statistiques
+        """
+        statistiques = StatistiquesParties(etat["nombre_joueurs"])
+        statistiques.nombre_parties = etat["nombre_parties"]
+        statistiques.rondes = Histogramme.depuis_dict(etat["rondes"])
+        statistiques.tours_par_ronde = Histogramme.depuis_dict(etat["tours_par_ronde"])
+        statistiques.points_par_ronde = Histogramme.depuis_dict(etat["points_par_ronde"])
+        statistiques.relances_bris_egalite = Histogramme.depuis_dict(etat["relances_bris_egalite"])
+        statistiques.scores = [Histogramme.depuis_dict(scores) for scores in etat["scores"]]
+        statistiques.victoires_par_siege = list(etat["victoires_par_siege"])
+        statistiques.joueurs_par_type = dict(etat["joueurs_par_type"])
+        statistiques.victoires_par_type = dict(etat["victoires_par_type"])
+        return statistiques
@@ -0,0 +1,359 @@
+"""
+Module du stockage en colonnes des résultats de parties.
+
+Un stockage est un dossier qui contient un fichier binaire par champ (une colonne) et un fichier schema.json qui
+décrit les colonnes. Chaque partie occupe une ligne de largeur fixe dans chaque colonne: la graine maîtresse et le
+numéro de la partie (qui donnent sa source de hasard, voir simulation.source_de_partie), le nombre de joueurs et de
+joueurs humains, la place du premier joueur, le sens, le nombre de rondes jouées, le score final de chacun des
+MAX_JOUEURS sièges (0 pour un siège vide) et le masque des gagnants (le bit i pour le siège i + 1).
+
+Les colonnes ne sont jamais réécrites, seulement allongées, par morceaux de plusieurs parties. La lecture passe par
+des projections en mémoire (numpy.memmap): on peut parcourir ou filtrer des milliards de parties sans les charger ni
+les copier, bloc par bloc. Ce module nécessite NumPy.
+"""
+
+import json
+import os
+
+import numpy as np
+
+# Nombre maximal de joueurs à une table (largeur de la colonne des scores)
+MAX_JOUEURS = 8
+
+# Colonnes du stockage: nom, type NumPy et nombre de valeurs par partie
+COLONNES = (
+    ("graine_maitresse", "<u8", 1),
+    ("partie", "<u8", 1),
+    ("nombre_joueurs", "u1", 1),
+    ("nombre_humains", "u1", 1),
+    ("premier_joueur", "u1", 1),
+    ("sens", "i1", 1),
+    ("nombre_rondes", "u1", 1),
+    ("scores", "<u2", MAX_JOUEURS),
+    ("gagnants", "u1", 1),
+)
+
+# Version du format, écrite dans schema.json
+VERSION = 1
+
+# Nombre de parties accumulées en mémoire avant une écriture dans les colonnes
+TAILLE_MORCEAU = 1 << 16
+
+# Nombre de parties lues à la fois par les requêtes
+TAILLE_BLOC_LECTURE = 1 << 22
+
+
+def _chemin_colonne(dossier, nom):
+    """
+    Fonction qui donne le chemin du fichier d'une colonne.
+    Args:
+        dossier (str): Dossier du stockage
+        nom (str): Nom de la colonne
+    Returns:
+        str: Le chemin du fichier
+    """
+    return os.path.join(dossier, nom + ".bin")
+
+
+def _schema():
+    """
+    Fonction qui décrit le format du stockage.
+    Returns:
+        dict: Le schéma, tel qu'il est écrit dans schema.json
+    """
+    return {"version": VERSION, "colonnes": [[nom, type_numpy, largeur] for nom, type_numpy, largeur in COLONNES]}
+
+
+def _verifier_schema(dossier):
+    """
+    Fonction qui vérifie que le schéma d'un stockage existant est celui de ce module.
+    Args:
+        dossier (str): Dossier du stockage
+    Raises:
+        ValueError: Si le schéma est différent
+    """
+    with open(os.path.join(dossier, "schema.json"), encoding="utf-8") as fichier:
+        schema = json.load(fichier)
+    if schema != _schema():
+        raise ValueError("Le stockage {} n'a pas le format attendu (version {}).".format(dossier, VERSION))
+
+
+def _nombre_parties_completes(dossier):
+    """
+    Fonction qui compte les parties écrites au complet, c'est-à-dire présentes dans toutes les colonnes (une écriture
+    interrompue peut avoir allongé certaines colonnes seulement).
+    Args:
+        dossier (str): Dossier du stockage
+    Returns:
+        int: Nombre de parties
+    """
+    nombres = []
+    for nom, type_numpy, largeur in COLONNES:
+        chemin = _chemin_colonne(dossier, nom)
+        taille = os.path.getsize(chemin) if os.path.exists(chemin) else 0
+        nombres.append(taille // (np.dtype(type_numpy).itemsize * largeur))
+    return min(nombres)
+
+
+class EcrivainResultats:
+    """
+    Classe qui ajoute des résultats de parties à la fin d'un stockage. Les parties sont accumulées dans des tableaux
+    d'un morceau, puis chaque colonne reçoit le morceau entier en une seule écriture. Un écrivain s'utilise de
+    préférence avec with, pour que le dernier morceau soit écrit.
+
+    Attributes:
+        dossier (str): Dossier du stockage
+        taille_morceau (int): Nombre de parties accumulées avant une écriture
+    """
+
+    def __init__(self, dossier, taille_morceau=TAILLE_MORCEAU):
+        """
+        Constructeur de la classe EcrivainResultats. Le dossier est créé s'il n'existe pas; s'il contient déjà un
+        stockage, les nouvelles parties sont ajoutées à la suite (et une écriture interrompue est d'abord effacée).
+        Args:
+            dossier (str): Dossier du stockage
+            taille_morceau (int, optional): Nombre de parties accumulées avant une écriture
+        Raises:
+            ValueError: Si le dossier contient un stockage d'un autre format
+        """
+        self.dossier = dossier
+        self.taille_morceau = taille_morceau
+        os.makedirs(dossier, exist_ok=True)
+        if os.path.exists(os.path.join(dossier, "schema.json")):
+            _verifier_schema(dossier)
+        else:
+            with open(os.path.join(dossier, "schema.json"), "w", encoding="utf-8") as fichier:
+                json.dump(_schema(), fichier)
+        nombre = _nombre_parties_completes(dossier)
+        self._fichiers = {}
+        for nom, type_numpy, largeur in COLONNES:
+            fichier = open(_chemin_colonne(dossier, nom), "ab")
+            fichier.truncate(nombre * np.dtype(type_numpy).itemsize * largeur)
+            self._fichiers[nom] = fichier
+        self._morceau = {nom: np.zeros((taille_morceau, largeur) if largeur > 1 else taille_morceau, type_numpy)
+                         for nom, type_numpy, largeur in COLONNES}
+        self._position = 0
+
+    def ajouter(self, graine_maitresse, partie, resultat, nombre_humains=None):
+        """
+        Méthode qui ajoute le résultat d'une partie.
+        Args:
+            graine_maitresse (int): Graine maîtresse de la simulation (entre 0 et 2**64 - 1)
+            partie (int): Numéro de la partie dans la simulation
+            resultat (ResultatPartie): Le résultat de la partie
+            nombre_humains (int, optional): Nombre de joueurs humains (par défaut, celui du résultat)
+        """
+        morceau = self._morceau
+        ligne = self._position
+        morceau["graine_maitresse"][ligne] = graine_maitresse
+        morceau["partie"][ligne] = partie
+        morceau["nombre_joueurs"][ligne] = len(resultat.scores)
+        morceau["nombre_humains"][ligne] = sum(resultat.humains) if nombre_humains is None else nombre_humains
+        morceau["premier_joueur"][ligne] = 0 if resultat.premier_joueur is None else resultat.premier_joueur - 1
+        morceau["sens"][ligne] = resultat.sens
+        morceau["nombre_rondes"][ligne] = resultat.nombre_rondes
+        scores = morceau["scores"][ligne]
+        scores[:] = 0
+        scores[:len(resultat.scores)] = resultat.scores
+        masque = 0
+        for identifiant in resultat.gagnants:
+            masque |= 1 << (identifiant - 1)
+        morceau["gagnants"][ligne] = masque
+        self._position += 1
+        if self._position == self.taille_morceau:
+            self.vider()
+
+    def vider(self):
+        """
+        Méthode qui écrit dans les colonnes les parties accumulées.
+        """
+        if not self._position:
+            return
+        for nom, _, _ in COLONNES:
+            self._fichiers[nom].write(self._morceau[nom][:self._position].tobytes())
+            self._fichiers[nom].flush()
+        self._position = 0
+
+    def fermer(self):
+        """
+        Méthode qui écrit les dernières parties et ferme les colonnes.
+        """
+        self.vider()
+        for fichier in self._fichiers.values():
+            fichier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+
+class StockageResultats:
+    """
+    Classe qui lit un stockage par projection en mémoire. Chaque colonne est un tableau NumPy en lecture seule qui
+    n'est chargé qu'à mesure qu'on le parcourt; les requêtes parcourent les parties par blocs de taille fixe, ce qui
+    garde la mémoire utilisée constante peu importe le nombre de parties.
+
+    Attributes:
+        dossier (str): Dossier du stockage
+        nombre_parties (int): Nombre de parties du stockage au moment de l'ouverture
+        colonnes (dict): Tableau (numpy.memmap) de chaque colonne
+    """
+
+    def __init__(self, dossier):
+        """
+        Constructeur de la classe StockageResultats
+        Args:
+            dossier (str): Dossier du stockage
+        Raises:
+            ValueError: Si le dossier contient un stockage d'un autre format
+        """
+        _verifier_schema(dossier)
+        self.dossier = dossier
+        self.nombre_parties = _nombre_parties_completes(dossier)
+        self.colonnes = {}
+        for nom, type_numpy, largeur in COLONNES:
+            forme = (self.nombre_parties, largeur) if largeur > 1 else (self.nombre_parties,)
+            if self.nombre_parties:
+                self.colonnes[nom] = np.memmap(_chemin_colonne(dossier, nom), type_numpy, "r", shape=forme)
+            else:
+                self.colonnes[nom] = np.zeros(forme, type_numpy)
+
+    def __len__(self):
+        """
+        Méthode qui retourne le nombre de parties du stockage.
+        Returns:
+            int: Nombre de parties
+        """
+        return self.nombre_parties
+
+    def __getitem__(self, nom):
+        """
+        Méthode qui retourne une colonne.
+        Args:
+            nom (str): Nom de la colonne (voir COLONNES)
+        Returns:
+            numpy.ndarray: La colonne, sans copie
+        """
+        return self.colonnes[nom]
+
+    def blocs(self, taille_bloc=TAILLE_BLOC_LECTURE):
+        """
+        Méthode génératrice qui parcourt les parties par blocs. Chaque bloc donne une vue (sans copie) de chaque
+        colonne.
+        Args:
+            taille_bloc (int, optional): Nombre de parties par bloc
+        Returns:
+            generator: Pour chaque bloc, un dict qui associe à chaque nom de colonne la tranche du bloc
+        """
+        for debut in range(0, self.nombre_parties, taille_bloc):
+            fin = min(debut + taille_bloc, self.nombre_parties)
+            yield {nom: colonne[debut:fin] for nom, colonne in self.colonnes.items()}
+
+    @staticmethod
+    def filtrer(bloc, **conditions):
+        """
+        Méthode statique qui calcule le masque des parties d'un bloc qui respectent des conditions d'égalité, par
+        exemple filtrer(bloc, nombre_joueurs=5, sens=-1).
+        Args:
+            bloc (dict): Bloc donné par la méthode blocs
+            **conditions: Valeur exigée pour des colonnes d'une seule valeur par partie
+        Returns:
+            numpy.ndarray: Le masque (True pour les parties retenues)
+        """
+        masque = np.ones(len(bloc["partie"]), bool)
+        for nom, valeur in conditions.items():
+            if valeur is not None:
+                masque &= bloc[nom] == valeur
+        return masque
+
+    def compter(self, **conditions):
+        """
+        Méthode qui compte les parties qui respectent des conditions (voir filtrer).
+        Args:
+            **conditions: Valeur exigée pour des colonnes d'une seule valeur par partie
+        Returns:
+            int: Nombre de parties
+        """
+        return sum(int(self.filtrer(bloc, **conditions).sum()) for bloc in self.blocs())
+
+    def victoires_par_siege(self, nombre_joueurs, **conditions):
+        """
+        Méthode qui compte les parties d'un certain nombre de joueurs et les victoires de chaque siège (un siège à
+        égalité au premier rang gagne aussi).
+        Args:
+            nombre_joueurs (int): Nombre de joueurs des parties considérées
+            **conditions: Autres conditions sur les parties (voir filtrer)
+        Returns:
+            int, numpy.ndarray: Nombre de parties et nombre de victoires de chaque siège
+        """
+        bits = (1 << np.arange(nombre_joueurs)).astype(np.uint8)
+        parties = 0
+        victoires = np.zeros(nombre_joueurs, np.int64)
+        for bloc in self.blocs():
+            gagnants = bloc["gagnants"][self.filtrer(bloc, nombre_joueurs=nombre_joueurs, **conditions)]
+            parties += len(gagnants)
+            victoires += ((gagnants[:, None] & bits) != 0).sum(axis=0)
+        return parties, victoires
+
+    def taux_de_victoire_par_siege(self, nombre_joueurs, **conditions):
+        """
+        Méthode qui calcule la proportion des parties gagnées par chaque siège.
+        Args:
+            nombre_joueurs (int): Nombre de joueurs des parties considérées
+            **conditions: Autres conditions sur les parties (voir filtrer)
+        Returns:
+            numpy.ndarray: Taux de victoire de chaque siège (nan s'il n'y a aucune partie)
+        """
+        parties, victoires = self.victoires_par_siege(nombre_joueurs, **conditions)
+        return victoires / parties if parties else np.full(nombre_joueurs, np.nan)
+
+    def taux_de_victoire_par_siege_et_sens(self, nombre_joueurs, **conditions):
+        """
+        Méthode qui calcule le taux de victoire de chaque siège, séparément pour chaque sens de la partie.
+        Args:
+            nombre_joueurs (int): Nombre de joueurs des parties considérées
+            **conditions: Autres conditions sur les parties (voir filtrer)
+        Returns:
+            dict: Pour chaque sens (1 et -1), le taux de victoire de chaque siège
+        """
+        return {sens: self.taux_de_victoire_par_siege(nombre_joueurs, sens=sens, **conditions) for sens in (1, -1)}
+
+    def score_moyen_par_siege(self, nombre_joueurs, **conditions):
+        """
+        Méthode qui calcule le score final moyen de chaque siège.
+        Args:
+            nombre_joueurs (int): Nombre de joueurs des parties considérées
+            **conditions: Autres conditions sur les parties (voir filtrer)
+        Returns:
+            numpy.ndarray: Score moyen de chaque siège (nan s'il n'y a aucune partie)
+        """
+        parties = 0
+        sommes = np.zeros(nombre_joueurs, np.int64)
+        for bloc in self.blocs():
+            scores = bloc["scores"][self.filtrer(bloc, nombre_joueurs=nombre_joueurs, **conditions), :nombre_joueurs]
+            parties += len(scores)
+            sommes += scores.sum(axis=0, dtype=np.int64)
+        return sommes / parties if parties else np.full(nombre_joueurs, np.nan)
+
+    def distribution(self, nom, **conditions):
+        """
+        Méthode qui compte les parties pour chaque valeur d'une colonne, par exemple le nombre de rondes jouées.
+        Args:
+            nom (str): Nom d'une colonne d'une seule valeur entière positive par partie
+            **conditions: Conditions sur les parties (voir filtrer)
+        Returns:
+            numpy.ndarray: Nombre de parties pour chaque valeur (l'index est la valeur)
+        """
+        comptes = np.zeros(1, np.int64)
+        for bloc in self.blocs():
+            valeurs = bloc[nom][self.filtrer(bloc, **conditions)]
+            if len(valeurs):
+                nouveaux = np.bincount(valeurs)
+                if len(nouveaux) > len(comptes):
+                    nouveaux[:len(comptes)] += comptes
+                    comptes = nouveaux
+                else:
+                    comptes[:len(nouveaux)] += nouveaux
+        return comptes
@@ -0,0 +1,21 @@
+"""
+Configuration des tests de pymafia.
+
+Les modules du jeu s'importent sous le nom pymafia (from pymafia.partie import ...). Si le dépôt n'est pas déjà
+importable sous ce nom (par exemple lorsqu'il est extrait dans un dossier qui porte un autre nom), il est chargé comme
+package pymafia à partir de son dossier.
+"""
+
+import importlib.util
+import os
+import sys
+
+try:
+    import pymafia  # noqa: F401
+except ImportError:
+    _racine = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    _spec = importlib.util.spec_from_file_location("pymafia", os.path.join(_racine, "__init__.py"),
+                                                   submodule_search_locations=[_racine])
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules["pymafia"] = _module
+    _spec.loader.exec_module(_module)
@@ -0,0 +1,52 @@
+"""
+Tests des sources de hasard.
+"""
+
+from pymafia.aleatoire import SourceCompteur, SourceTamponnee
+
+
+def test_meme_graine_memes_tirages():
+    premiere = SourceTamponnee(5, taille_tampon=64)
+    seconde = SourceTamponnee(5, taille_tampon=64)
+    for nombre in [1, 5, 40, 3, 200, 7]:
+        assert premiere.rouler_dés(nombre) == seconde.rouler_dés(nombre)
+        assert premiere.entier(nombre) == seconde.entier(nombre)
+        assert premiere.aleatoire() == seconde.aleatoire()
+
+
+def test_des_equiprobables():
+    lancers = SourceTamponnee(2, taille_tampon=100).rouler_dés(60000)
+    assert len(lancers) == 60000
+    for valeur in range(1, 7):
+        assert 9500 < lancers.count(valeur) < 10500
+    assert lancers.count(0) == 0
+
+
+def test_melanger_et_choisir_sens():
+    source = SourceTamponnee(3)
+    liste = list(range(20))
+    source.melanger(liste)
+    assert sorted(liste) == list(range(20))
+    assert liste != list(range(20))
+    assert {source.choisir_sens() for _ in range(100)} == {1, -1}
+
+
+def test_source_compteur_meme_partie_memes_tirages():
+    premiere = SourceCompteur(9, 3, taille_morceau=64)
+    seconde = SourceCompteur(9, 3, taille_morceau=64)
+    for nombre in [1, 5, 40, 3, 200, 7]:
+        assert premiere.rouler_dés(nombre) == seconde.rouler_dés(nombre)
+        assert premiere.entier(nombre) == seconde.entier(nombre)
+    assert premiere.aleatoire() == seconde.aleatoire()
+
+
+def test_source_compteur_flux_separes():
+    source = SourceCompteur(9, 3)
+    des = source.rouler_dés(50)
+    tirages = [SourceCompteur(9, 3).entier(1000) for _ in range(3)]
+    source.entier(1000)
+    assert SourceCompteur(9, 3).rouler_dés(50) == des
+    assert len(set(tirages)) == 1
+    assert SourceCompteur(9, 4).rouler_dés(50) != des
+    assert SourceCompteur(8, 3).rouler_dés(50) != des
+    assert SourceCompteur(9, 3, numero_flux=1).rouler_dés(50) != des
@@ -0,0 +1,56 @@
+"""
+Tests de la classe Anneau.
+"""
+
+from pymafia.anneau import Anneau
+from pymafia.joueur import Joueur
+
+
+def creer_anneau(nombre_joueurs):
+    joueurs = [Joueur(identifiant) for identifiant in range(1, nombre_joueurs + 1)]
+    return joueurs, Anneau(joueurs)
+
+
+def test_retirer_le_joueur_parcouru():
+    joueurs, anneau = creer_anneau(6)
+    parcourus = []
+    for joueur in anneau:
+        parcourus.append(joueur.identifiant)
+        if joueur.identifiant % 2 == 0:
+            anneau.retirer(joueur)
+    assert parcourus == [1, 2, 3, 4, 5, 6]
+    assert [joueur.identifiant for joueur in anneau] == [1, 3, 5]
+    assert anneau.suivant(joueurs[1]) is joueurs[2]
+    assert anneau.suivant(joueurs[1], -1) is joueurs[0]
+
+
+def test_retirer_tous_les_joueurs_pendant_le_parcours():
+    _, anneau = creer_anneau(4)
+    parcourus = []
+    for joueur in anneau:
+        parcourus.append(joueur.identifiant)
+        anneau.retirer(joueur)
+    assert parcourus == [1, 2, 3, 4]
+    assert len(anneau) == 0
+    assert anneau.tete is None
+
+
+def test_retirer_la_tete_pendant_le_parcours():
+    joueurs, anneau = creer_anneau(3)
+    for joueur in anneau:
+        if joueur is joueurs[0]:
+            anneau.retirer(joueur)
+    assert anneau.tete is joueurs[1]
+    assert [joueur.identifiant for joueur in anneau] == [2, 3]
+
+
+def test_suivant_dans_les_deux_sens_et_copie():
+    joueurs, anneau = creer_anneau(5)
+    copie = anneau.copy()
+    anneau.retirer(joueurs[4])
+    anneau.retirer(joueurs[1])
+    assert anneau.suivant(joueurs[0]) is joueurs[2]
+    assert anneau.suivant(joueurs[0], -1) is joueurs[3]
+    assert anneau.suivant(joueurs[4]) is joueurs[0]
+    assert len(anneau) == 3 and joueurs[1] not in anneau
+    assert len(copie) == 5 and joueurs[1] in copie
@@ -0,0 +1,95 @@
+"""
+Tests des tables de cotes de ronde.
+"""
+
+import pytest
+
+from pymafia.cotes import (DÉS_DÉPART, ÉCHELLE_PROBABILITÉ, TablesCotes, _etats, construire_tables, nombre_etats,
+                           points_perdus_moyens, rang_etat)
+from pymafia.solveur import SolveurRonde
+
+
+class JoueurTest:
+    """
+    Joueur réduit à ce que lisent les tables de cotes: son identifiant, son score et son nombre de dés.
+    """
+
+    def __init__(self, identifiant, score, nombre_dés):
+        self.identifiant = identifiant
+        self.score = score
+        self.nombre_dés = nombre_dés
+
+    def __len__(self):
+        return self.nombre_dés
+
+
+class PartieTest:
+    """
+    Partie réduite à ce que lisent les tables de cotes.
+    """
+
+    def __init__(self, joueurs, index_courant, sens):
+        self.joueurs_actifs = joueurs
+        self.joueur_courant = joueurs[index_courant]
+        self.sens = sens
+
+
+@pytest.fixture(scope="module")
+def chemin_tables(tmp_path_factory):
+    chemin = str(tmp_path_factory.mktemp("cotes") / "cotes.bin")
+    construire_tables(chemin, nombre_joueurs_max=3)
+    return chemin
+
+
+@pytest.mark.parametrize("nombre_joueurs", [2, 3, 4, 5])
+def test_rang_etat_est_une_bijection(nombre_joueurs):
+    etats = list(_etats(nombre_joueurs, DÉS_DÉPART * nombre_joueurs))
+    assert len(etats) == len(set(etats)) == nombre_etats(nombre_joueurs)
+    assert [rang_etat(etat) for etat in etats] == list(range(nombre_etats(nombre_joueurs)))
+
+
+def test_tables_lues_egales_au_solveur(chemin_tables):
+    solveur = SolveurRonde(avec_lois=True)
+    with TablesCotes(chemin_tables) as tables:
+        assert tables.couvre(2) and tables.couvre(3) and not tables.couvre(4)
+        for etat in [(5, 5), (1, 9), (5, 5, 5), (2, 7, 3), (1, 1, 13)]:
+            probabilites, lois = tables.cotes(etat)
+            assert probabilites == pytest.approx(solveur.resoudre(etat)[0], abs=1 / ÉCHELLE_PROBABILITÉ)
+            for loi, attendue in zip(lois, solveur.lois_dés_restants(etat)):
+                assert len(loi) == DÉS_DÉPART * len(etat) + 1
+                assert loi == pytest.approx(list(attendue) + [0.0] * (len(loi) - len(attendue)),
+                                            abs=1 / ÉCHELLE_PROBABILITÉ)
+        probabilites, lois = tables.cotes((0, 4, 2))
+        assert probabilites == [1.0, 0.0, 0.0]
+        assert [loi.index(1.0) for loi in lois] == [0, 4, 2]
+
+
+def test_points_perdus_moyens():
+    assert points_perdus_moyens(0, 10) == 0.0
+    assert points_perdus_moyens(1, 100) == pytest.approx(3.5)
+    assert points_perdus_moyens(1, 1) == pytest.approx(1.0)
+    assert points_perdus_moyens(2, 3) == pytest.approx(3 - 1 / 36)
+    assert points_perdus_moyens(3, 50) == pytest.approx(10.5)
+
+
+def test_cotes_partie_plafonnees_par_le_score(chemin_tables):
+    solveur = SolveurRonde(avec_lois=True)
+    joueurs = [JoueurTest(1, 60, 2), JoueurTest(3, 2, 7), JoueurTest(4, 40, 3)]
+    with TablesCotes(chemin_tables) as tables:
+        cotes = tables.cotes_partie(PartieTest(joueurs, 0, 1))
+        assert tables.cotes_partie(PartieTest(joueurs + [JoueurTest(5, 10, 5)], 0, 1)) is None
+    lois = solveur.lois_dés_restants((2, 7, 3))
+    probabilites = solveur.resoudre((2, 7, 3))[0]
+    for joueur, probabilite, loi in zip(joueurs, probabilites, lois):
+        attendus = sum(p * points_perdus_moyens(dés, joueur.score) for dés, p in enumerate(loi))
+        assert cotes[joueur.identifiant] == pytest.approx((probabilite, attendus), abs=1e-3)
+    assert cotes[3][1] <= 2
+    # Sans plafond, un perdant donne en moyenne 3,5 points par dé restant.
+    assert cotes[4][1] == pytest.approx(3.5 * solveur.resoudre((2, 7, 3))[1][2], abs=1e-3)
+
+
+def test_fichier_invalide(tmp_path):
+    chemin = tmp_path / "cotes.bin"
+    chemin.write_bytes(b"PAS UN FICHIER DE COTES")
+    with pytest.raises(ValueError):
+        TablesCotes(str(chemin))
@@ -0,0 +1,115 @@
+"""
+Tests des lois précalculées et des tables d'alias.
+"""
+
+from itertools import product
+from math import comb
+
+import pytest
+
+from pymafia import distributions
+from pymafia.aleatoire import SourceTamponnee
+
+
+def loi_de_la_table(table):
+    """
+    Fonction qui calcule la probabilité de chaque valeur d'une table d'alias: chaque case est choisie avec
+    probabilité 1 / len(table), puis donne sa valeur ou son alias.
+    """
+    probabilites = {}
+    for valeur, seuil, alias in zip(table.valeurs, table.seuils, table.alias):
+        probabilites[valeur] = probabilites.get(valeur, 0.0) + seuil / len(table)
+        probabilites[alias] = probabilites.get(alias, 0.0) + (1.0 - seuil) / len(table)
+    return probabilites
+
+
+def loi_par_enumeration(nombre_dés, grandeur):
+    """
+    Fonction qui calcule la loi exacte d'une grandeur d'un lancer en énumérant les 6**nombre_dés lancers possibles.
+    """
+    loi = {}
+    for lancer in product(range(1, 7), repeat=nombre_dés):
+        valeur = grandeur(lancer)
+        loi[valeur] = loi.get(valeur, 0.0) + 1.0 / 6 ** nombre_dés
+    return loi
+
+
+@pytest.mark.parametrize("nombre_dés", range(6))
+def test_loi_somme_des(nombre_dés):
+    exacte = loi_par_enumeration(nombre_dés, sum)
+    loi = distributions.loi_somme_dés(nombre_dés)
+    assert sum(loi) == pytest.approx(1.0)
+    assert {somme: probabilite for somme, probabilite in enumerate(loi) if probabilite} == pytest.approx(exacte)
+    if nombre_dés:
+        assert loi_de_la_table(distributions.TABLES_SOMME_DÉS[nombre_dés]) == pytest.approx(exacte, abs=1e-12)
+
+
+def test_table_alias_loi_quelconque():
+    probabilites = [0.5, 0.0, 0.125, 0.25, 0.125]
+    table = distributions.TableAlias(probabilites, "abcde")
+    attendue = {valeur: probabilite for valeur, probabilite in zip("abcde", probabilites)}
+    assert loi_de_la_table(table) == pytest.approx(attendue, abs=1e-12)
+
+
+def test_tirer_somme_des():
+    source = SourceTamponnee(8)
+    tirages = [distributions.tirer_somme_dés(2, source) for _ in range(36000)]
+    assert distributions.tirer_somme_dés(0, source) == 0
+    assert min(tirages) == 2 and max(tirages) == 12
+    assert 5600 < tirages.count(7) < 6400
+    assert 800 < tirages.count(12) < 1200
+
+
+@pytest.mark.parametrize("nombre_dés", range(6))
+def test_table_1_et_6_par_enumeration(nombre_dés):
+    exacte = loi_par_enumeration(nombre_dés, lambda lancer: (lancer.count(1), lancer.count(6)))
+    assert loi_de_la_table(distributions.TABLES_1_ET_6[nombre_dés]) == pytest.approx(exacte, abs=1e-12)
+
+
+@pytest.mark.parametrize("nombre_dés", [12, distributions.MAX_DÉS])
+def test_table_1_et_6_loi_multinomiale(nombre_dés):
+    exacte = {(nombre_1, nombre_6): comb(nombre_dés, nombre_1) * comb(nombre_dés - nombre_1, nombre_6)
+              * 4 ** (nombre_dés - nombre_1 - nombre_6) / 6 ** nombre_dés
+              for nombre_1 in range(nombre_dés + 1) for nombre_6 in range(nombre_dés - nombre_1 + 1)}
+    assert loi_de_la_table(distributions.TABLES_1_ET_6[nombre_dés]) == pytest.approx(exacte, abs=1e-12)
+
+
+def test_loi_somme_des_autres_faces():
+    loi = distributions.loi_somme_dés(3, range(2, 6))
+    exacte = {}
+    for lancer in product(range(2, 6), repeat=3):
+        exacte[sum(lancer)] = exacte.get(sum(lancer), 0.0) + 1.0 / 4 ** 3
+    assert {somme: probabilite for somme, probabilite in enumerate(loi) if probabilite} == pytest.approx(exacte)
+
+
+def test_tirer_1_et_6():
+    source = SourceTamponnee(9)
+    tirages = [distributions.tirer_1_et_6(3, source) for _ in range(21600)]
+    assert all(nombre_1 + nombre_6 <= 3 for nombre_1, nombre_6 in tirages)
+    assert 6100 < tirages.count((0, 0)) < 6700
+    assert 50 < tirages.count((3, 0)) < 150
+
+
+@pytest.mark.parametrize("nombre_dés", [1, 3, 12, distributions.MAX_DÉS])
+def test_tirer_lancer_memes_1_et_6(nombre_dés):
+    premiere = SourceTamponnee(5)
+    seconde = SourceTamponnee(5)
+    for _ in range(500):
+        nombre_1, nombre_6, total = distributions.tirer_lancer(nombre_dés, premiere)
+        assert (nombre_1, nombre_6) == distributions.tirer_1_et_6(nombre_dés, seconde)
+        autres = nombre_dés - nombre_1 - nombre_6
+        assert nombre_1 + 6 * nombre_6 + 2 * autres <= total <= nombre_1 + 6 * nombre_6 + 5 * autres
+    assert premiere.aleatoire() == seconde.aleatoire()
+
+
+def test_tirer_lancer_loi_exacte():
+    exacte = loi_par_enumeration(3, lambda lancer: (lancer.count(1), lancer.count(6), sum(lancer)))
+    source = SourceTamponnee(3)
+    nombre_tirages = 100000
+    frequences = {}
+    for _ in range(nombre_tirages):
+        lancer = distributions.tirer_lancer(3, source)
+        frequences[lancer] = frequences.get(lancer, 0) + 1
+    assert set(frequences) <= set(exacte)
+    for lancer, probabilite in exacte.items():
+        assert frequences.get(lancer, 0) / nombre_tirages == pytest.approx(probabilite, abs=0.006)
@@ -0,0 +1,70 @@
+"""
+Tests de l'instrumentation des parties.
+"""
+
+import io
+import json
+
+from pymafia import journal
+from pymafia.aleatoire import SourceTamponnee
+from pymafia.instrumentation import COMPTEURS, PHASES, Instrumentation, desinstrumenter, instrumenter
+from pymafia.partie_automatique import PartieAutomatique
+
+
+def jouer_partie_instrumentee(graine, instrumentation=None):
+    """
+    Fonction qui joue une partie automatique instrumentée et journalisée et retourne l'instrumentation et les
+    événements du journal.
+    """
+    fichier = io.BytesIO()
+    partie = PartieAutomatique(4, SourceTamponnee(graine))
+    partie.journal = journal.JournalBinaire(fichier)
+    instrumentation = instrumenter(partie, instrumentation)
+    partie.jouer()
+    desinstrumenter(partie)
+    partie.journal.fermer()
+    fichier.seek(0)
+    return instrumentation, list(journal.lire_journal_binaire(fichier))
+
+
+def test_compteurs_egaux_aux_evenements_du_journal():
+    instrumentation, evenements = jouer_partie_instrumentee(1)
+    types = [evenement[0] for evenement in evenements]
+    compteurs = instrumentation.compteurs
+    assert compteurs["lancers"] == sum(types.count(type_evenement) for type_evenement in (
+        journal.LANCER, journal.LANCER_FIN_DE_RONDE, journal.PREMIER_LANCER))
+    assert compteurs["eliminations"] == types.count(journal.ELIMINATION)
+    assert compteurs["dés_retirés"] == sum(evenement[2] for evenement in evenements if evenement[0] == journal.LANCER)
+    assert instrumentation.appels["jouer_un_tour"] == types.count(journal.LANCER)
+
+
+def test_fusionner():
+    premiere, _ = jouer_partie_instrumentee(2)
+    seconde, _ = jouer_partie_instrumentee(3)
+    total = Instrumentation()
+    total.fusionner(premiere)
+    total.fusionner(seconde)
+    for phase in PHASES:
+        assert total.appels[phase] == premiere.appels[phase] + seconde.appels[phase]
+        assert sum(total.histogrammes[phase]) == total.appels[phase]
+    for compteur in COMPTEURS:
+        assert total.compteurs[compteur] == premiere.compteurs[compteur] + seconde.compteurs[compteur]
+
+
+def test_exporter_json():
+    instrumentation, _ = jouer_partie_instrumentee(4)
+    document = json.loads(instrumentation.exporter_json())
+    assert document["compteurs"] == instrumentation.compteurs
+    assert document["phases"]["jouer_un_tour"]["appels"] == instrumentation.appels["jouer_un_tour"]
+    assert len(document["bornes_histogramme_s"]) + 1 == len(document["phases"]["jouer_un_tour"]["histogramme"])
+
+
+def test_exporter_prometheus():
+    instrumentation, _ = jouer_partie_instrumentee(5)
+    lignes = instrumentation.exporter_prometheus("test").splitlines()
+    for phase in PHASES:
+        assert 'test_phase_duree_secondes_bucket{{phase="{}",le="+Inf"}} {}'.format(
+            phase, instrumentation.appels[phase]) in lignes
+        assert 'test_phase_duree_secondes_count{{phase="{}"}} {}'.format(phase, instrumentation.appels[phase]) in lignes
+    assert "test_lancers_total {}".format(instrumentation.compteurs["lancers"]) in lignes
+    assert "test_des_retires_total {}".format(instrumentation.compteurs["dés_retirés"]) in lignes
@@ -0,0 +1,92 @@
+"""
+Tests des journaux d'événements.
+"""
+
+import io
+
+import pytest
+
+from pymafia import journal
+from pymafia.aleatoire import SourceTamponnee
+from pymafia.partie_automatique import PartieAutomatique
+
+EVENEMENTS = [
+    (journal.DEBUT_PARTIE, 0, 8, 2, 0),
+    (journal.SENS, 3, 0, 0, -1),
+    (journal.LANCER, 8, 255, 255, 32767),
+    (journal.TRANSFERT_POINTS, 1, 0, 7, -32768),
+    (journal.FIN_PARTIE, 0, 0, 0, 10),
+]
+
+
+def test_aller_retour_binaire():
+    fichier = io.BytesIO()
+    with journal.JournalBinaire(fichier, taille_tampon=12) as journal_binaire:
+        for evenement in EVENEMENTS * 3:
+            journal_binaire.enregistrer(*evenement)
+    assert len(fichier.getvalue()) == 6 * len(EVENEMENTS) * 3
+    fichier.seek(0)
+    assert list(journal.lire_journal_binaire(fichier, taille_morceau=10)) == EVENEMENTS * 3
+
+
+class LecteurPartiel(io.BytesIO):
+    """
+    Fichier qui ne rend jamais plus de 5 octets à la fois, comme un tube.
+    """
+
+    def read(self, taille=-1):
+        return super().read(min(taille, 5))
+
+
+def test_lectures_partielles():
+    fichier = io.BytesIO()
+    with journal.JournalBinaire(fichier) as journal_binaire:
+        for evenement in EVENEMENTS:
+            journal_binaire.enregistrer(*evenement)
+    assert list(journal.lire_journal_binaire(LecteurPartiel(fichier.getvalue()), taille_morceau=12)) == EVENEMENTS
+
+
+def test_journal_tronque():
+    fichier = io.BytesIO()
+    with journal.JournalBinaire(fichier) as journal_binaire:
+        for evenement in EVENEMENTS:
+            journal_binaire.enregistrer(*evenement)
+    tronque = io.BytesIO(fichier.getvalue()[:-4])
+    with pytest.warns(RuntimeWarning, match="2 derniers octets"):
+        assert list(journal.lire_journal_binaire(tronque, taille_morceau=12)) == EVENEMENTS[:-1]
+
+
+def test_nombre_de_joueurs_limite():
+    fichier = io.BytesIO()
+    with journal.JournalBinaire(fichier) as journal_binaire:
+        journal_binaire.enregistrer(journal.DEBUT_PARTIE, 0, journal.JOUEURS_MAX_BINAIRE, 0)
+        with pytest.raises(ValueError):
+            journal_binaire.enregistrer(journal.DEBUT_PARTIE, 0, journal.JOUEURS_MAX_BINAIRE + 1, 0)
+    assert len(fichier.getvalue()) == journal.FORMAT_EVENEMENT.size
+
+
+def test_aller_retour_json():
+    fichier = io.StringIO()
+    with journal.JournalJson(fichier, taille_tampon=2) as journal_json:
+        for evenement in EVENEMENTS:
+            journal_json.enregistrer(*evenement)
+    fichier.seek(0)
+    assert list(journal.lire_journal_json(fichier)) == EVENEMENTS
+
+
+def test_partie_journalisee_dans_les_deux_formats():
+    binaire = io.BytesIO()
+    texte = io.StringIO()
+    for fichier, type_journal in ((binaire, journal.JournalBinaire), (texte, journal.JournalJson)):
+        partie = PartieAutomatique(5, SourceTamponnee(4))
+        with type_journal(fichier) as partie.journal:
+            partie.jouer()
+        fichier.seek(0)
+    evenements = list(journal.lire_journal_binaire(binaire))
+    assert evenements == list(journal.lire_journal_json(texte))
+    assert evenements[0][0] == journal.DEBUT_PARTIE
+    assert evenements[-1][0] == journal.FIN_PARTIE
+    lancers = [evenement for evenement in evenements if evenement[0] == journal.LANCER]
+    assert lancers
+    for _, _, nombre_1, nombre_6, total in lancers:
+        assert total > 0 and total >= nombre_1 + 6 * nombre_6
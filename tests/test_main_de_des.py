@@ -0,0 +1,86 @@
+"""
+Tests de la classe MainDeDés.
+"""
+
+import pytest
+
+from pymafia.de import Dé
+from pymafia.main_de_des import MainDeDés
+
+
+def verifier_totaux(main):
+    assert main.nombre == sum(main.faces[1:]) == len(main)
+    assert main.total == sum(valeur * nombre for valeur, nombre in enumerate(main.faces))
+
+
+def test_ajouter_et_retirer():
+    main = MainDeDés()
+    main.ajouter(6, 2)
+    main.ajouter(1)
+    main.ajouter(3, 4)
+    verifier_totaux(main)
+    assert (main.nombre, main.total) == (7, 25)
+    assert main.retirer(6) == 2
+    assert main.retirer(6) == 0
+    assert main.retirer(1) == 1
+    verifier_totaux(main)
+    assert (main.nombre, main.total) == (4, 12)
+    main.vider()
+    assert not main
+    verifier_totaux(main)
+
+
+def test_rouler_garde_le_nombre_de_des():
+    main = MainDeDés()
+    main.reinitialiser(5)
+    for _ in range(100):
+        main.rouler()
+        verifier_totaux(main)
+        assert main.nombre == 5
+        assert main.faces[0] == 0
+
+
+def test_copie_independante_et_comparaison():
+    main = MainDeDés([Dé(), Dé()])
+    copie = main.copy()
+    copie.ajouter(4)
+    assert main == [Dé(), Dé()]
+    assert main != copie
+    assert len(main) == 2 and len(copie) == 3
+
+
+class SourceFixe:
+    """
+    Source de hasard qui lance toujours les mêmes valeurs.
+    """
+
+    def __init__(self, valeurs):
+        self.valeurs = bytes(valeurs)
+
+    def rouler_dés(self, nombre):
+        return self.valeurs[:nombre]
+
+
+def test_affichage_dans_l_ordre_du_lancer():
+    main = MainDeDés()
+    main.reinitialiser(5)
+    main.rouler(SourceFixe([4, 6, 1, 2, 6]))
+    assert str(main) == '⚃ ⚅ ⚀ ⚁ ⚅'
+    main.retirer(6)
+    main.retirer(1)
+    main.ajouter(6)
+    main.ajouter(1)
+    assert str(main) == '⚃ ⚁ ⚅ ⚀'
+    assert [dé.valeur for dé in main] == [4, 2, 6, 1]
+    assert main.copy() == main and str(main.partager()) == str(main)
+    verifier_totaux(main)
+    assert str(MainDeDés([Dé(3), Dé(1), Dé(3)])) == '⚂ ⚀ ⚂'
+    main.reinitialiser(2, 5)
+    main.ajouter(6)
+    assert str(main) == '⚄ ⚄ ⚅'
+
+
+def test_main_non_hachable():
+    assert MainDeDés.__hash__ is None
+    with pytest.raises(TypeError):
+        hash(MainDeDés())
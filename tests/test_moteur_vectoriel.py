@@ -0,0 +1,64 @@
+"""
+Tests du moteur vectoriel.
+"""
+
+from itertools import product
+
+import numpy as np
+import pytest
+
+from pymafia.distributions import MAX_DÉS, TABLES_1_ET_6
+from pymafia.moteur_vectoriel import construire_table_lancers, simuler_parties
+from pymafia.partie import RONDEMAX
+
+
+def test_table_lancers_suit_la_loi_des_des():
+    tables = construire_table_lancers(4)
+    for nombre_dés in range(5):
+        debut = tables["debuts"][nombre_dés]
+        taille = int(tables["tailles"][nombre_dés])
+        cases = range(debut, debut + taille)
+        probabilites = {}
+        for case in cases:
+            issue = (tables["nombre_1"][case], tables["nombre_6"][case])
+            alias = tables["alias"][case]
+            issue_alias = (tables["nombre_1"][alias], tables["nombre_6"][alias])
+            probabilites[issue] = probabilites.get(issue, 0.0) + tables["seuils"][case] / taille
+            probabilites[issue_alias] = probabilites.get(issue_alias, 0.0) + (1.0 - tables["seuils"][case]) / taille
+        exactes = {}
+        for lancer in product(range(1, 7), repeat=nombre_dés):
+            issue = (lancer.count(1), lancer.count(6))
+            exactes[issue] = exactes.get(issue, 0.0) + 1.0 / 6 ** nombre_dés
+        assert set(exactes) <= set(probabilites)
+        for issue, probabilite in probabilites.items():
+            assert probabilite == pytest.approx(exactes.get(issue, 0.0), abs=1e-12)
+
+
+
+def test_table_lancers_reprend_les_tables_d_alias():
+    tables = construire_table_lancers(MAX_DÉS)
+    for nombre_dés, table in enumerate(TABLES_1_ET_6):
+        debut = tables["debuts"][nombre_dés]
+        cases = range(debut, debut + len(table))
+        assert list(zip(tables["nombre_1"][cases], tables["nombre_6"][cases])) == list(table.valeurs)
+        assert list(tables["seuils"][cases]) == list(table.seuils)
+        alias = [(tables["nombre_1"][case], tables["nombre_6"][case]) for case in tables["alias"][cases]]
+        assert alias == list(table.alias)
+    with pytest.raises(ValueError):
+        construire_table_lancers(MAX_DÉS + 1)
+
+@pytest.mark.parametrize("nombre_joueurs", [2, 5, 8])
+def test_resultats_coherents(nombre_joueurs):
+    resultats = simuler_parties(nombre_joueurs, 500, np.random.default_rng(3), taille_lot=128)
+    assert len(resultats) == 500
+    assert (resultats.scores.sum(axis=1) == 100 * nombre_joueurs).all()
+    assert (resultats.scores >= 0).all()
+    assert ((resultats.nombre_rondes >= 1) & (resultats.nombre_rondes <= RONDEMAX)).all()
+    assert (resultats.gagnants == (resultats.scores == resultats.scores.max(axis=1, keepdims=True))).all()
+
+
+def test_meme_generateur_memes_resultats():
+    premiers = simuler_parties(4, 300, np.random.default_rng(9))
+    seconds = simuler_parties(4, 300, np.random.default_rng(9))
+    assert (premiers.scores == seconds.scores).all()
+    assert (premiers.sens == seconds.sens).all()
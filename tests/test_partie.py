@@ -0,0 +1,27 @@
+"""
+Tests de la classe Partie.
+"""
+
+import io
+
+import pytest
+
+from pymafia.affichage import AffichageTampon
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.partie import Partie
+
+
+@pytest.mark.parametrize("reponses, sens", [(["1"], 1), (["-1"], -1), (["--1", "2", "-1-", " 1", "-1"], -1)])
+def test_determiner_sens_humain(reponses, sens):
+    questions = []
+    restantes = iter(reponses)
+
+    def entree(invite):
+        questions.append(invite)
+        return next(restantes)
+
+    partie = Partie(2, 2, affichage=AffichageTampon(io.StringIO(), entree=entree),
+                    joueurs=[JoueurHumain(1), JoueurHumain(2)])
+    partie.determiner_sens()
+    assert partie.sens == sens
+    assert len(questions) == len(reponses)
@@ -0,0 +1,61 @@
+"""
+Tests des parties automatiques.
+"""
+
+import io
+
+import pytest
+
+from pymafia.aleatoire import SourceTamponnee
+from pymafia.instrumentation import instrumenter
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.journal import JournalBinaire, JournalJson
+from pymafia.partie import RONDEMAX
+from pymafia.partie_automatique import PartieAutomatique
+
+
+def jouer(nombre_joueurs, source, journal=None, instrumentee=False):
+    """
+    Fonction qui joue une partie automatique et retourne tous les attributs de son résultat.
+    """
+    partie = PartieAutomatique(nombre_joueurs, source)
+    partie.journal = journal
+    if instrumentee:
+        instrumenter(partie)
+    return vars(partie.jouer())
+
+
+@pytest.mark.parametrize("nombre_joueurs", range(2, 9))
+def test_resultat_coherent(nombre_joueurs):
+    for _ in range(20):
+        resultat = PartieAutomatique(nombre_joueurs).jouer()
+        assert len(resultat.scores) == nombre_joueurs
+        assert sum(resultat.scores) == 100 * nombre_joueurs
+        assert min(resultat.scores) >= 0
+        assert 1 <= resultat.nombre_rondes <= RONDEMAX
+        assert len(resultat.gagnants) == resultat.scores.count(max(resultat.scores))
+        assert set(resultat.gagnants) <= set(range(1, nombre_joueurs + 1))
+
+
+@pytest.mark.parametrize("nombre_joueurs", [2, 5, 8])
+def test_meme_graine_meme_resultat(nombre_joueurs):
+    reference = jouer(nombre_joueurs, SourceTamponnee(7))
+    assert jouer(nombre_joueurs, SourceTamponnee(7)) == reference
+    assert jouer(nombre_joueurs, SourceTamponnee(7), journal=JournalJson(io.StringIO())) == reference
+    assert jouer(nombre_joueurs, SourceTamponnee(7), journal=JournalBinaire(io.BytesIO())) == reference
+    assert jouer(nombre_joueurs, SourceTamponnee(7), instrumentee=True) == reference
+    assert jouer(nombre_joueurs, SourceTamponnee(7), journal=JournalBinaire(io.BytesIO()),
+                 instrumentee=True) == reference
+
+
+def test_sens_des_joueurs_humains_tire_au_hasard():
+    sens = set()
+    for graine in range(20):
+        humains = PartieAutomatique(3, SourceTamponnee(graine), types_joueurs=[JoueurHumain] * 3).jouer()
+        ordinateurs = PartieAutomatique(3, SourceTamponnee(graine), types_joueurs=[JoueurOrdinateur] * 3).jouer()
+        assert humains.humains == (True,) * 3
+        assert (humains.sens, humains.scores, humains.premier_joueur) == (
+            ordinateurs.sens, ordinateurs.scores, ordinateurs.premier_joueur)
+        sens.add(humains.sens)
+    assert sens == {1, -1}
@@ -0,0 +1,80 @@
+"""
+Tests du rejeu des parties enregistrées.
+"""
+
+import copy
+import io
+
+import pytest
+
+from pymafia import journal
+from pymafia.aleatoire import SourceTamponnee
+from pymafia.joueur_humain import JoueurHumain
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.partie_automatique import PartieAutomatique
+from pymafia.rejeu import EtatRejeu, Rejeu, rejouer_parties
+
+
+def jouer_partie_journalisee(nombre_joueurs, graine):
+    """
+    Fonction qui joue une partie automatique avec un journal binaire et retourne son résultat et ses événements.
+    """
+    fichier = io.BytesIO()
+    partie = PartieAutomatique(nombre_joueurs, SourceTamponnee(graine))
+    with journal.JournalBinaire(fichier) as partie.journal:
+        resultat = partie.jouer()
+    fichier.seek(0)
+    return resultat, list(journal.lire_journal_binaire(fichier))
+
+
+@pytest.mark.parametrize("nombre_joueurs, graine", [(2, 1), (4, 2), (8, 3)])
+def test_aller_a_egal_au_rejeu_depuis_le_debut(nombre_joueurs, graine):
+    _, evenements = jouer_partie_journalisee(nombre_joueurs, graine)
+    attendus = {}
+    etat = EtatRejeu(nombre_joueurs)
+    for evenement in evenements:
+        etat.appliquer(evenement)
+        if evenement[0] in (journal.DEBUT_RONDE, journal.LANCER):
+            attendus[(etat.ronde, etat.tour)] = etat.instantane()
+    rejeu = Rejeu(evenements, intervalle=4)
+    for (ronde, tour), instantane in attendus.items():
+        assert rejeu.aller_a(ronde, tour).instantane() == instantane
+    with pytest.raises(ValueError):
+        rejeu.aller_a(1, max(tour for ronde, tour in attendus if ronde == 1) + 1)
+
+
+@pytest.mark.parametrize("nombre_joueurs, graine", [(3, 5), (6, 6)])
+def test_etat_final_et_pointage_standard(nombre_joueurs, graine):
+    resultat, evenements = jouer_partie_journalisee(nombre_joueurs, graine)
+    assert Rejeu(evenements).etat_final().scores == resultat.scores
+    assert next(rejouer_parties(evenements)).scores == resultat.scores
+
+
+@pytest.mark.parametrize("graine, ronde", [(7, 2), (8, 3)])
+def test_reprise_depuis_aller_a_egale_a_la_partie_enregistree(graine, ronde):
+    types_joueurs = [JoueurOrdinateur, JoueurHumain, JoueurOrdinateur, JoueurOrdinateur]
+    fichier = io.BytesIO()
+    partie = PartieAutomatique(len(types_joueurs), SourceTamponnee(graine), types_joueurs=types_joueurs)
+    with journal.JournalBinaire(fichier) as partie.journal:
+        partie.preparer_une_partie()
+        while partie.ronde < ronde:
+            partie.jouer_une_ronde()
+            partie.terminer_ronde()
+            partie.passer_a_la_ronde_suivante()
+        source_reprise = copy.deepcopy(partie.source)
+        partie.jouer_une_partie()
+        resultat = partie.terminer_une_partie()
+    fichier.seek(0)
+    evenements = list(journal.lire_journal_binaire(fichier))
+    debut_reprise = evenements.index((journal.DEBUT_RONDE, 0, 0, 0, ronde))
+
+    reprise = Rejeu(evenements, intervalle=4).aller_a(ronde).vers_partie(source_reprise, types_joueurs)
+    assert [type(joueur) for joueur in reprise.joueurs] == types_joueurs
+    fichier_reprise = io.BytesIO()
+    with journal.JournalBinaire(fichier_reprise) as reprise.journal:
+        reprise.jouer_une_partie()
+        resultat_reprise = reprise.terminer_une_partie()
+    fichier_reprise.seek(0)
+    assert list(journal.lire_journal_binaire(fichier_reprise)) == evenements[debut_reprise:]
+    assert resultat_reprise.scores == resultat.scores
+    assert resultat_reprise.gagnants == resultat.gagnants
@@ -0,0 +1,77 @@
+"""
+Tests du serveur de parties en ligne (sans réseau: les connexions sont simulées).
+"""
+
+import asyncio
+
+from pymafia.aleatoire import SourceTamponnee
+from pymafia.serveur import Connexion, ServeurPymafia
+
+
+class ConnexionTest(Connexion):
+    """
+    Connexion qui garde les lignes envoyées au client et qui, si on le lui demande, répond d'elle-même aux demandes
+    du serveur.
+    """
+
+    def __init__(self, serveur, automatique=False):
+        super().__init__(None, None)
+        self.serveur = serveur
+        self.automatique = automatique
+        self.lignes = []
+
+    def envoyer(self, texte):
+        self.lignes.extend(texte.splitlines())
+        if self.automatique and texte.startswith("DEMANDE "):
+            reponse = "LANCER" if texte == "DEMANDE LANCER\n" else "SENS -1"
+            asyncio.get_running_loop().call_soon(self.serveur.traiter_commande, self, reponse)
+
+
+def test_commandes_invalides():
+    async def scenario():
+        serveur = ServeurPymafia(SourceTamponnee(1))
+        premiere = ConnexionTest(serveur)
+        seconde = ConnexionTest(serveur)
+        assert serveur.traiter_commande(premiere, "")
+        assert serveur.traiter_commande(premiere, "CREER 9 1")
+        assert serveur.traiter_commande(premiere, "CREER 3 4")
+        assert serveur.traiter_commande(premiere, "DANSER")
+        assert serveur.traiter_commande(premiere, "REJOINDRE 42")
+        assert serveur.traiter_commande(premiere, "LANCER")
+        assert serveur.traiter_commande(premiere, "CREER 3 2")
+        assert serveur.traiter_commande(premiere, "CREER 3 2")
+        assert serveur.traiter_commande(seconde, "REJOINDRE 1")
+        assert serveur.traiter_commande(seconde, "SENS 2")
+        assert not serveur.traiter_commande(seconde, "quitter")
+        assert [ligne.split()[0] for ligne in premiere.lignes[:7]] == ["ERREUR"] * 5 + ["TABLE", "SIEGE"]
+        assert premiere.lignes[5] == "TABLE 1"
+        assert premiere.lignes[7] == "ERREUR vous êtes déjà assis à une table"
+        assert seconde.lignes[0].startswith("SIEGE 1 ")
+        assert seconde.lignes[1].startswith("ERREUR")
+        serveur.fermer_table(1)
+        await asyncio.sleep(0)
+        assert not serveur.tables
+
+    asyncio.run(scenario())
+
+
+def test_partie_complete_par_le_protocole():
+    async def scenario():
+        serveur = ServeurPymafia(SourceTamponnee(2))
+        premiere = ConnexionTest(serveur, automatique=True)
+        seconde = ConnexionTest(serveur, automatique=True)
+        serveur.traiter_commande(premiere, "CREER 4 2")
+        serveur.traiter_commande(seconde, "REJOINDRE 1")
+        troisieme = ConnexionTest(serveur)
+        serveur.traiter_commande(troisieme, "REJOINDRE 1")
+        assert troisieme.lignes == ["ERREUR la table est pleine"]
+        for _ in range(100000):
+            if not serveur.tables:
+                break
+            await asyncio.sleep(0)
+        assert not serveur.tables
+        for connexion in (premiere, seconde):
+            assert connexion.lignes[-1] == "FIN 1"
+            assert "DEMANDE LANCER" in connexion.lignes
+
+    asyncio.run(scenario())
@@ -0,0 +1,36 @@
+"""
+Tests de la répartition des simulations en blocs et en processus.
+"""
+
+import pytest
+
+from pymafia.simulation import reproduire_partie, simuler, simuler_par_blocs
+
+
+def test_blocs_et_processus_ne_changent_pas_le_rapport():
+    reference = simuler(4, 600, 11, nombre_processus=1, taille_bloc=600)
+    assert reference.nombre_parties == 600
+    assert sum(reference.rondes.values()) == 600
+    for nombre_processus, taille_bloc in [(1, 1), (1, 37), (2, 50), (3, 599)]:
+        assert simuler(4, 600, 11, nombre_processus, taille_bloc) == reference
+
+
+def test_graines_differentes_rapports_differents():
+    assert simuler(4, 200, 1, nombre_processus=1) != simuler(4, 200, 2, nombre_processus=1)
+
+
+def test_reproduire_une_partie_de_la_simulation():
+    for debut, fin, _, resultats in simuler_par_blocs(5, 90, 4, nombre_processus=2, taille_bloc=30,
+                                                      garder_resultats=True):
+        for index_partie in (debut, fin - 1, (debut + fin) // 2):
+            assert vars(reproduire_partie(5, 4, index_partie)) == vars(resultats[index_partie - debut])
+
+
+@pytest.mark.parametrize("nombre_processus", [1, 2])
+def test_blocs_soumis_au_fur_et_a_mesure(nombre_processus):
+    # Un milliard de parties: seuls les premiers blocs doivent être soumis avant que l'appelant cesse de lire.
+    blocs = simuler_par_blocs(3, 10 ** 9, 5, nombre_processus, taille_bloc=4)
+    debut, fin, rapport, resultats = next(blocs)
+    blocs.close()
+    assert (debut, fin, rapport.nombre_parties, resultats) == (0, 4, 4, None)
+    assert rapport == simuler(3, 4, 5, nombre_processus=1)
@@ -0,0 +1,103 @@
+"""
+Tests du solveur de rondes.
+"""
+
+import random
+
+import pytest
+
+from pymafia.solveur import ÉTATS_MAX, JOUEURS_MAX, SolveurRonde, nombre_etats_atteignables
+
+
+def simuler_rondes(etat, nombre_rondes, graine):
+    """
+    Fonction qui estime les probabilités de victoire d'un état et la loi du nombre de dés restants de chaque position
+    en jouant des rondes dé par dé (méthode de Monte Carlo), indépendamment du solveur.
+    """
+    generateur = random.Random(graine)
+    victoires = [0] * len(etat)
+    fins = [[0] * (sum(etat) + 1) for _ in etat]
+    for _ in range(nombre_rondes):
+        dés = list(etat)
+        courant = 0
+        while True:
+            lancer = [generateur.randint(1, 6) for _ in range(dés[courant])]
+            suivant = (courant + 1) % len(dés)
+            dés[courant] -= lancer.count(1) + lancer.count(6)
+            dés[suivant] += lancer.count(6)
+            if not dés[courant]:
+                victoires[courant] += 1
+                for position, restants in enumerate(dés):
+                    fins[position][restants] += 1
+                break
+            courant = suivant
+    return ([nombre / nombre_rondes for nombre in victoires],
+            [[nombre / nombre_rondes for nombre in fin] for fin in fins])
+
+
+def test_forme_close_un_de_chacun():
+    # Avec un dé chacun, le joueur courant gagne avec probabilité 1/3 + 2/3 (1 - p), donc p = 3/5. Il lui reste en
+    # moyenne x = 2/3 y dés et à l'autre y = 1/6 + 2/6 + 2/3 x dés: x = 3/5 et y = 9/10.
+    probabilites, esperances = SolveurRonde().resoudre((1, 1))
+    assert probabilites == pytest.approx((0.6, 0.4), abs=1e-12)
+    assert esperances == pytest.approx((0.6, 0.9), abs=1e-12)
+
+
+def test_valeurs_connues_trois_joueurs():
+    probabilites = SolveurRonde().probabilites_victoire([5, 5, 5], 0, 1)
+    assert probabilites == pytest.approx([0.36422, 0.33759, 0.29819], abs=1e-5)
+
+
+@pytest.mark.parametrize("etat", [(5, 5, 5), (2, 7, 3), (4, 1, 5, 2), (1, 2, 1, 1, 2, 1, 1, 1)])
+def test_monte_carlo(etat):
+    solveur = SolveurRonde(avec_lois=True)
+    probabilites = solveur.resoudre(etat)[0]
+    estimations, lois_estimees = simuler_rondes(etat, 20000, 1)
+    assert estimations == pytest.approx(probabilites, abs=0.015)
+    for loi, loi_estimee in zip(solveur.lois_dés_restants(etat), lois_estimees):
+        assert loi == pytest.approx(loi_estimee, abs=0.015)
+
+
+@pytest.mark.parametrize("nombre_joueurs", [2, 3])
+def test_probabilites_somment_a_un(nombre_joueurs):
+    solveur = SolveurRonde()
+    for total in range(1, 5 * nombre_joueurs + 1):
+        for premier in range(1, total + 1):
+            reste = total - premier
+            etat = (premier, reste) if nombre_joueurs == 2 else (premier, reste // 2, reste - reste // 2)
+            probabilites = solveur.resoudre(etat)[0]
+            assert sum(probabilites) == pytest.approx(1.0, abs=1e-9)
+            assert all(0.0 <= probabilite <= 1.0 + 1e-12 for probabilite in probabilites)
+
+
+def test_probabilites_par_siege():
+    solveur = SolveurRonde()
+    probabilites = solveur.probabilites_victoire([5, 3, 4, 1], 2, -1)
+    assert sum(probabilites) == pytest.approx(1.0, abs=1e-9)
+    assert probabilites[2] == pytest.approx(solveur.resoudre((4, 3, 5, 1))[0][0], abs=1e-12)
+
+
+def test_borne_des_etats_atteignables():
+    assert JOUEURS_MAX == 5
+    assert nombre_etats_atteignables((5,) * 5) == ÉTATS_MAX
+    with pytest.raises(ValueError):
+        SolveurRonde().resoudre((5,) * 6)
+    with pytest.raises(ValueError):
+        SolveurRonde(etats_max=100).resoudre((5, 5, 5))
+    probabilites = SolveurRonde().resoudre((1,) * 8)[0]
+    assert sum(probabilites) == pytest.approx(1.0, abs=1e-9)
+
+
+@pytest.mark.parametrize("etat", [(1, 1), (5, 5), (2, 7, 3), (2, 1, 3)])
+def test_lois_des_des_restants(etat):
+    solveur = SolveurRonde(avec_lois=True)
+    probabilites, esperances = solveur.resoudre(etat)
+    lois = solveur.lois_dés_restants(etat)
+    assert len(lois) == len(etat)
+    for probabilite, esperance, loi in zip(probabilites, esperances, lois):
+        assert len(loi) == sum(etat) + 1
+        assert sum(loi) == pytest.approx(1.0, abs=1e-9)
+        assert loi[0] == pytest.approx(probabilite, abs=1e-12)
+        assert sum(dés * p for dés, p in enumerate(loi)) == pytest.approx(esperance, abs=1e-9)
+    with pytest.raises(ValueError):
+        SolveurRonde().lois_dés_restants(etat)
@@ -0,0 +1,72 @@
+"""
+Tests des statistiques cumulées.
+"""
+
+import json
+
+import pytest
+
+from pymafia.aleatoire import SourceTamponnee
+from pymafia.partie_automatique import PartieAutomatique
+from pymafia.simulation import simuler
+from pymafia.statistiques import Histogramme, StatistiquesParties
+
+
+def histogrammes(statistiques):
+    """
+    Fonction qui retourne tous les histogrammes d'un objet StatistiquesParties.
+    """
+    return [statistiques.rondes, statistiques.tours_par_ronde, statistiques.points_par_ronde,
+            statistiques.relances_bris_egalite] + statistiques.scores
+
+
+def comparer(premier, second):
+    assert premier.classes == second.classes
+    assert (premier.nombre, premier.minimum, premier.maximum) == (second.nombre, second.minimum, second.maximum)
+    assert premier.vers_dict() == second.vers_dict()
+
+
+def test_histogramme():
+    histogramme = Histogramme(0, 10, 2)
+    for valeur in [-3, 0, 1, 2, 9, 10, 15]:
+        histogramme.ajouter(valeur)
+    assert histogramme.classes == [1, 2, 1, 0, 0, 1, 2]
+    assert (histogramme.nombre, histogramme.minimum, histogramme.maximum) == (7, -3, 15)
+    assert histogramme.resume()["moyenne"] == pytest.approx(34 / 7)
+    assert histogramme.variance() == pytest.approx(sum((valeur - 34 / 7) ** 2 for valeur in
+                                                       [-3, 0, 1, 2, 9, 10, 15]) / 6)
+    with pytest.raises(ValueError):
+        histogramme.fusionner(Histogramme(0, 10, 1))
+
+
+def test_fusion_egale_a_un_seul_objet():
+    resultats = [PartieAutomatique(4, SourceTamponnee(graine)).jouer() for graine in range(60)]
+    tout = StatistiquesParties(4)
+    parties = [StatistiquesParties(4) for _ in range(3)]
+    for index, resultat in enumerate(resultats):
+        tout.ajouter(resultat)
+        parties[index % 3].ajouter(resultat)
+    fusion = StatistiquesParties(4)
+    for partie in parties:
+        fusion.fusionner(partie)
+    assert fusion.nombre_parties == tout.nombre_parties == 60
+    assert fusion.victoires_par_siege == tout.victoires_par_siege
+    assert fusion.victoires_par_type == tout.victoires_par_type
+    for premier, second in zip(histogrammes(fusion), histogrammes(tout)):
+        comparer(premier, second)
+
+
+def test_aller_retour_json():
+    statistiques = StatistiquesParties(3)
+    for graine in range(10):
+        statistiques.ajouter(PartieAutomatique(3, SourceTamponnee(graine)).jouer())
+    copie = StatistiquesParties.depuis_dict(json.loads(json.dumps(statistiques.vers_dict())))
+    assert copie.vers_dict() == statistiques.vers_dict()
+
+
+def test_fusion_exacte_peu_importe_les_blocs():
+    reference = simuler(5, 300, 8, nombre_processus=1, taille_bloc=300, type_rapport=StatistiquesParties)
+    assert reference.nombre_parties == 300
+    for nombre_processus, taille_bloc in [(1, 7), (2, 41), (3, 100)]:
+        rapport = simuler(5, 300, 8, nombre_processus, taille_bloc, type_rapport=StatistiquesParties)
+        assert rapport.vers_dict() == reference.vers_dict()
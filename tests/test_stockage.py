@@ -0,0 +1,63 @@
+"""
+Tests du stockage en colonnes des résultats.
+"""
+
+import os
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from pymafia.aleatoire import SourceTamponnee
+from pymafia.partie_automatique import PartieAutomatique
+from pymafia.stockage import EcrivainResultats, StockageResultats
+
+
+def jouer_parties(nombre_joueurs, graines):
+    return [PartieAutomatique(nombre_joueurs, SourceTamponnee(graine)).jouer() for graine in graines]
+
+
+def test_ecrire_puis_lire(tmp_path):
+    dossier = str(tmp_path / "resultats")
+    resultats = jouer_parties(3, range(30)) + jouer_parties(5, range(30, 50))
+    with EcrivainResultats(dossier, taille_morceau=7) as ecrivain:
+        for index, resultat in enumerate(resultats[:25]):
+            ecrivain.ajouter(12, index, resultat)
+    with EcrivainResultats(dossier, taille_morceau=7) as ecrivain:
+        for index, resultat in enumerate(resultats[25:], 25):
+            ecrivain.ajouter(12, index, resultat)
+
+    stockage = StockageResultats(dossier)
+    assert len(stockage) == 50
+    assert list(stockage["partie"]) == list(range(50))
+    assert (stockage["graine_maitresse"] == 12).all()
+    for index, resultat in enumerate(resultats):
+        assert list(stockage["scores"][index][:len(resultat.scores)]) == resultat.scores
+        assert stockage["sens"][index] == resultat.sens
+        assert stockage["nombre_rondes"][index] == resultat.nombre_rondes
+    assert stockage.compter(nombre_joueurs=3) == 30
+    parties, victoires = stockage.victoires_par_siege(5)
+    assert parties == 20
+    assert list(victoires) == [sum(identifiant in resultat.gagnants for resultat in resultats[30:])
+                               for identifiant in range(1, 6)]
+    assert stockage.score_moyen_par_siege(3) == pytest.approx(np.mean([resultat.scores for resultat in resultats[:30]],
+                                                                      axis=0))
+    distribution = stockage.distribution("nombre_rondes")
+    assert {rondes: nombre for rondes, nombre in enumerate(distribution) if nombre} == Counter(
+        resultat.nombre_rondes for resultat in resultats)
+
+
+def test_ecriture_interrompue_effacee(tmp_path):
+    dossier = str(tmp_path / "resultats")
+    with EcrivainResultats(dossier) as ecrivain:
+        for index, resultat in enumerate(jouer_parties(4, range(10))):
+            ecrivain.ajouter(0, index, resultat)
+    with open(os.path.join(dossier, "scores.bin"), "ab") as fichier:
+        fichier.write(b"\x01\x02\x03")
+    with open(os.path.join(dossier, "partie.bin"), "ab") as fichier:
+        fichier.write(bytes(8))
+    with EcrivainResultats(dossier) as ecrivain:
+        ecrivain.ajouter(0, 10, jouer_parties(4, [10])[0])
+    stockage = StockageResultats(dossier)
+    assert len(stockage) == 11
+    assert list(stockage["partie"]) == list(range(11))
@@ -0,0 +1,61 @@
+"""
+Tests des tournois entre stratégies.
+"""
+
+from collections import Counter
+
+import pytest
+
+from pymafia.tournoi import (Classement, JoueurOrdinateurCroissant, JoueurOrdinateurDecroissant, jouer_groupes,
+                             jouer_tournoi, tables_du_groupe)
+
+
+@pytest.mark.parametrize("groupe", range(7))
+def test_chaque_strategie_occupe_chaque_siege(groupe):
+    tables = tables_du_groupe(3, 5, groupe)
+    taille = len(tables[0])
+    assert taille == 2 + groupe
+    assert len(tables) == 2 * taille
+    assert tables == tables_du_groupe(3, 5, groupe)
+    presences = Counter(tables[0])
+    for siege in range(taille):
+        assert Counter(table[siege] for table in tables) == Counter({strategie: 2 * nombre
+                                                                     for strategie, nombre in presences.items()})
+    assert tables[taille] == tables[0][::-1]
+
+
+def test_jouer_groupes_ne_depend_pas_du_decoupage():
+    strategies = (JoueurOrdinateurDecroissant, JoueurOrdinateurCroissant)
+    assert jouer_groupes(strategies, 3, 0, 6) == jouer_groupes(strategies, 3, 0, 2) + jouer_groupes(strategies, 3, 2, 6)
+
+
+def test_classement_strategie_dominante():
+    classement = Classement(["forte", "moyenne", "faible"])
+    for _ in range(300):
+        classement.ajouter((0, 1, 2), (150, 100, 50))
+        classement.ajouter((2, 1), (0, 200))
+    assert classement.nombre_parties == 600
+    assert classement.parties == [300, 600, 600]
+    assert classement.victoires == [300, 300, 0]
+    cotes, demi_largeurs = classement.cotes()
+    assert cotes[0] > cotes[1] > cotes[2]
+    assert sum(cotes) / 3 == pytest.approx(1500.0)
+    assert classement.est_stable()
+    assert [ligne["strategie"] for ligne in classement.resume()["classement"]] == ["forte", "moyenne", "faible"]
+
+
+def test_classement_egalites():
+    classement = Classement(["a", "b"])
+    assert classement.cotes()[0] == pytest.approx([1500.0, 1500.0])
+    for _ in range(50):
+        classement.ajouter((0, 1), (100, 100))
+    cotes, demi_largeurs = classement.cotes()
+    assert cotes == pytest.approx([1500.0, 1500.0])
+    assert demi_largeurs[0] == pytest.approx(demi_largeurs[1])
+
+
+def test_tournoi_identique_peu_importe_les_processus():
+    strategies = [JoueurOrdinateurDecroissant, JoueurOrdinateurCroissant]
+    premier = jouer_tournoi(strategies, 2, nombre_processus=1, parties_min=200, parties_max=200, groupes_par_bloc=3)
+    second = jouer_tournoi(strategies, 2, nombre_processus=2, parties_min=200, parties_max=200, groupes_par_bloc=3)
+    assert premier.resume() == second.resume()
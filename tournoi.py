@@ -0,0 +1,505 @@
+"""
+Module des tournois entre stratégies de joueurs ordinateurs.
+
+Une stratégie est une sous-classe de JoueurOrdinateur (par exemple, une autre façon de choisir le sens avec
+demander_sens). Le tournoi joue des parties automatiques, sans affichage, entre les stratégies d'une liste, à des
+tables de 2 à 8 joueurs, et les classe sur une échelle de type Elo.
+
+Les parties sont jouées par groupes. Le groupe g choisit une taille de table (les tailles demandées, chacune à son tour)
+et une composition de table au hasard (chaque stratégie au plus une fois si la liste est assez longue). La composition
+est ensuite jouée dans toutes ses rotations et dans les deux sens de lecture: chaque stratégie occupe ainsi chaque
+siège, avec chaque voisin de chaque côté, le même nombre de fois. Tous les tirages dépendent seulement de la graine
+maîtresse et des numéros du groupe et de la partie (SourceCompteur): le tournoi donne le même résultat peu importe le
+nombre de processus.
+
+Chaque partie est comptée comme un ensemble de duels entre les sièges de stratégies différentes (le plus haut score
+final gagne, une égalité vaut une demi-victoire). Comme pour l'Elo multijoueur, chaque duel d'une table de n joueurs
+pèse 1 / (n - 1). Le classement est l'estimation du maximum de vraisemblance du modèle de Bradley-Terry, sur l'échelle
+Elo (400 points d'écart: 10 contre 1), avec un intervalle de confiance tiré de l'information de Fisher. Les compteurs
+sont mis à jour à chaque partie reçue; le tournoi s'arrête dès que le classement est stable: deux stratégies voisines
+dans le classement ont des intervalles disjoints, ou des intervalles assez étroits pour les déclarer équivalentes.
+
+Les stratégies offertes (hasard, croissant et decroissant) forment un groupe témoin: le sens est la seule décision d'un
+joueur ordinateur et il est choisi au début de la partie, quand tous les scores sont égaux, où les deux sens se valent.
+Ces stratégies jouent donc toutes aussi bien et un tournoi entre elles doit les déclarer équivalentes; il sert à
+vérifier le tournoi lui-même. Pour comparer de vraies stratégies, on les passe sous la forme module:Classe.
+
+Par exemple:
+    python -m pymafia.tournoi hasard croissant decroissant --processus 8 --graine 1 --sortie classement.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from math import exp, log, sqrt
+
+from pymafia.aleatoire import SourceCompteur
+from pymafia.joueur_ordinateur import JoueurOrdinateur
+from pymafia.partie_automatique import PartieAutomatique
+from pymafia.simulation import source_de_partie
+
+# Tailles de table jouées par défaut
+TAILLES_TABLES = tuple(range(2, 9))
+
+# Nombre de groupes de parties joués par un processus avant de retourner ses résultats
+GROUPES_PAR_BLOC = 20
+
+# Nombre maximal de parties d'un groupe (toutes les rotations d'une table de 8, dans les deux sens)
+PARTIES_PAR_GROUPE_MAX = 16
+
+# Numéro de la paire de flux des sources à compteur qui choisissent les compositions de table
+FLUX_COMPOSITIONS = 2
+
+# Échelle Elo: un écart de 400 points correspond à une cote de 10 contre 1
+ÉCHELLE_ELO = 400 / log(10)
+
+# Cote moyenne du classement
+ELO_MOYEN = 1500.0
+
+# Quantile de la loi normale des intervalles de confiance (95 %)
+Z_CONFIANCE = 1.96
+
+# Demi-largeur d'intervalle (en points Elo) sous laquelle deux stratégies voisines sont jugées équivalentes
+PRECISION_ELO = 10.0
+
+# Nombre minimal et nombre maximal de parties d'un tournoi
+PARTIES_MIN = 10000
+PARTIES_MAX = 10000000
+
+# Nombre maximal d'itérations et tolérance de l'ajustement du modèle de Bradley-Terry
+ITERATIONS_MAX = 1000
+TOLERANCE = 1e-10
+
+
+class JoueurOrdinateurCroissant(JoueurOrdinateur):
+    """
+    Stratégie qui choisit toujours le sens croissant.
+    """
+
+    __slots__ = ()
+
+    def demander_sens(self, partie=None):
+        """
+        Méthode qui choisit toujours le sens croissant.
+        Args:
+            partie (Partie, optional): La partie (ignorée)
+        Returns:
+            tuple: Le sens (1) et le message qui annonce le choix
+        """
+        return (1, "Le joueur " + str(self.identifiant) + " à choisit de jouer vers la gauche (en ordre croissant)")
+
+
+class JoueurOrdinateurDecroissant(JoueurOrdinateur):
+    """
+    Stratégie qui choisit toujours le sens décroissant.
+    """
+
+    __slots__ = ()
+
+    def demander_sens(self, partie=None):
+        """
+        Méthode qui choisit toujours le sens décroissant.
+        Args:
+            partie (Partie, optional): La partie (ignorée)
+        Returns:
+            tuple: Le sens (-1) et le message qui annonce le choix
+        """
+        return (-1, "Le joueur " + str(self.identifiant) + " à choisit de jouer vers la droite (en ordre décroissant).")
+
+
+# Stratégies connues par leur nom (un groupe témoin: voir la documentation du module)
+STRATEGIES = {
+    "hasard": JoueurOrdinateur,
+    "croissant": JoueurOrdinateurCroissant,
+    "decroissant": JoueurOrdinateurDecroissant,
+}
+
+
+def trouver_strategie(nom):
+    """
+    Fonction qui trouve la classe d'une stratégie à partir de son nom: un nom de STRATEGIES, ou le chemin d'une classe
+    sous la forme module:Classe.
+    Args:
+        nom (str): Le nom de la stratégie
+    Returns:
+        type: La classe de la stratégie
+    Raises:
+        ValueError: Si la stratégie est inconnue ou n'est pas une sous-classe de JoueurOrdinateur
+    """
+    if nom in STRATEGIES:
+        return STRATEGIES[nom]
+    if ":" not in nom:
+        raise ValueError("Stratégie inconnue: {} (choix: {}, ou module:Classe)".format(nom, ", ".join(STRATEGIES)))
+    nom_module, nom_classe = nom.split(":", 1)
+    strategie = getattr(importlib.import_module(nom_module), nom_classe, None)
+    if not (isinstance(strategie, type) and issubclass(strategie, JoueurOrdinateur)):
+        raise ValueError("La stratégie {} n'est pas une sous-classe de JoueurOrdinateur.".format(nom))
+    return strategie
+
+
+def tables_du_groupe(nombre_strategies, graine_maitresse, groupe, tailles=TAILLES_TABLES):
+    """
+    Fonction qui donne les tables d'un groupe de parties: une composition tirée au hasard, dans toutes ses rotations
+    et dans les deux sens de lecture.
+    Args:
+        nombre_strategies (int): Nombre de stratégies du tournoi
+        graine_maitresse (int): Graine maîtresse du tournoi
+        groupe (int): Numéro du groupe
+        tailles (tuple, optional): Tailles de table jouées à tour de rôle
+    Returns:
+        list: Pour chaque partie du groupe, le tuple de l'index de la stratégie de chaque siège
+    """
+    taille = tailles[groupe % len(tailles)]
+    source = SourceCompteur(graine_maitresse, groupe, numero_flux=FLUX_COMPOSITIONS)
+    strategies = list(range(nombre_strategies))
+    source.melanger(strategies)
+    while len(strategies) < taille:
+        supplement = list(range(nombre_strategies))
+        source.melanger(supplement)
+        strategies.extend(supplement)
+    composition = strategies[:taille]
+    source.melanger(composition)
+    tables = []
+    for lecture in (composition, composition[::-1]):
+        for rotation in range(taille):
+            tables.append(tuple(lecture[rotation:] + lecture[:rotation]))
+    return tables
+
+
+def jouer_groupes(strategies, graine_maitresse, debut, fin, tailles=TAILLES_TABLES):
+    """
+    Fonction qui joue les groupes debut à fin - 1 d'un tournoi. La partie numéro a du groupe g utilise la source de
+    la partie g * PARTIES_PAR_GROUPE_MAX + a (voir simulation.source_de_partie).
+    Args:
+        strategies (tuple): Classe de chaque stratégie
+        graine_maitresse (int): Graine maîtresse du tournoi
+        debut (int): Numéro du premier groupe
+        fin (int): Numéro suivant le dernier groupe
+        tailles (tuple, optional): Tailles de table jouées à tour de rôle
+    Returns:
+        list: Pour chaque partie, le tuple (index de la stratégie de chaque siège, score final de chaque siège)
+    """
+    resultats = []
+    for groupe in range(debut, fin):
+        for numero, table in enumerate(tables_du_groupe(len(strategies), graine_maitresse, groupe, tailles)):
+            source = source_de_partie(graine_maitresse, groupe * PARTIES_PAR_GROUPE_MAX + numero)
+            partie = PartieAutomatique(len(table), source, types_joueurs=[strategies[index] for index in table])
+            resultats.append((table, tuple(partie.jouer().scores)))
+    return resultats
+
+
+def _inverser(matrice):
+    """
+    Fonction qui inverse une petite matrice carrée (élimination de Gauss-Jordan avec pivot partiel).
+    Args:
+        matrice (list): La matrice (liste de lignes)
+    Returns:
+        list: La matrice inverse
+    """
+    taille = len(matrice)
+    lignes = [list(ligne) + [1.0 if i == j else 0.0 for j in range(taille)] for i, ligne in enumerate(matrice)]
+    for colonne in range(taille):
+        pivot = max(range(colonne, taille), key=lambda i: abs(lignes[i][colonne]))
+        lignes[colonne], lignes[pivot] = lignes[pivot], lignes[colonne]
+        diviseur = lignes[colonne][colonne]
+        lignes[colonne] = [valeur / diviseur for valeur in lignes[colonne]]
+        for i in range(taille):
+            if i != colonne and lignes[i][colonne]:
+                facteur = lignes[i][colonne]
+                lignes[i] = [a - facteur * b for a, b in zip(lignes[i], lignes[colonne])]
+    return [ligne[taille:] for ligne in lignes]
+
+
+class Classement:
+    """
+    Classe qui tient le classement des stratégies d'un tournoi (modèle de Bradley-Terry sur l'échelle Elo). Les
+    compteurs sont mis à jour à chaque partie ajoutée; les cotes sont recalculées au besoin, à partir des précédentes.
+    Chaque paire de stratégies part d'un match nul fictif, ce qui garde les cotes finies même sans défaite.
+
+    Attributes:
+        noms (list): Nom de chaque stratégie
+        nombre_parties (int): Nombre de parties comptées
+        parties (list): Nombre de parties jouées par chaque stratégie (une par siège occupé)
+        victoires (list): Nombre de parties gagnées par chaque stratégie (un siège à égalité au premier rang gagne
+            aussi)
+        total_scores (list): Somme des scores finaux de chaque stratégie
+        duels (list): duels[i][j], le poids total des duels entre les stratégies i et j
+        gains (list): gains[i][j], le poids des duels gagnés par la stratégie i contre la stratégie j
+    """
+
+    def __init__(self, noms):
+        """
+        Constructeur de la classe Classement
+        Args:
+            noms (list): Nom de chaque stratégie
+        """
+        self.noms = list(noms)
+        nombre = len(self.noms)
+        self.nombre_parties = 0
+        self.parties = [0] * nombre
+        self.victoires = [0] * nombre
+        self.total_scores = [0] * nombre
+        self.duels = [[0.0 if i == j else 1.0 for j in range(nombre)] for i in range(nombre)]
+        self.gains = [[0.0 if i == j else 0.5 for j in range(nombre)] for i in range(nombre)]
+        self._forces = [0.0] * nombre
+        self._a_jour = True
+
+    def ajouter(self, table, scores):
+        """
+        Méthode qui ajoute le résultat d'une partie.
+        Args:
+            table (tuple): Index de la stratégie de chaque siège
+            scores (tuple): Score final de chaque siège
+        """
+        self.nombre_parties += 1
+        meilleur = max(scores)
+        poids = 1.0 / (len(table) - 1)
+        for siege, (strategie, score) in enumerate(zip(table, scores)):
+            self.parties[strategie] += 1
+            self.total_scores[strategie] += score
+            if score == meilleur:
+                self.victoires[strategie] += 1
+            for autre, autre_score in zip(table[siege + 1:], scores[siege + 1:]):
+                if autre == strategie:
+                    continue
+                self.duels[strategie][autre] += poids
+                self.duels[autre][strategie] += poids
+                if score > autre_score:
+                    self.gains[strategie][autre] += poids
+                elif score < autre_score:
+                    self.gains[autre][strategie] += poids
+                else:
+                    self.gains[strategie][autre] += poids / 2
+                    self.gains[autre][strategie] += poids / 2
+        self._a_jour = False
+
+    def _ajuster(self):
+        """
+        Méthode qui recalcule les forces (logarithmes des paramètres de Bradley-Terry, de moyenne nulle) par
+        l'algorithme MM de Hunter, à partir des forces précédentes.
+        """
+        if self._a_jour:
+            return
+        nombre = len(self.noms)
+        forces = [exp(force) for force in self._forces]
+        gains_totaux = [sum(ligne) for ligne in self.gains]
+        for _ in range(ITERATIONS_MAX):
+            nouvelles = []
+            for i in range(nombre):
+                denominateur = sum(self.duels[i][j] / (forces[i] + forces[j]) for j in range(nombre) if j != i)
+                nouvelles.append(gains_totaux[i] / denominateur if denominateur else forces[i])
+            moyenne = sum(log(force) for force in nouvelles) / nombre
+            nouvelles = [force / exp(moyenne) for force in nouvelles]
+            ecart = max(abs(log(a / b)) for a, b in zip(nouvelles, forces))
+            forces = nouvelles
+            if ecart < TOLERANCE:
+                break
+        self._forces = [log(force) for force in forces]
+        self._a_jour = True
+
+    def _variances(self):
+        """
+        Méthode qui calcule la variance de la force de chaque stratégie (pseudo-inverse de la matrice d'information de
+        Fisher, pour des forces de moyenne nulle).
+        Returns:
+            list: La variance de chaque force
+        """
+        nombre = len(self.noms)
+        information = [[0.0] * nombre for _ in range(nombre)]
+        for i in range(nombre):
+            for j in range(nombre):
+                if i != j:
+                    probabilite = 1.0 / (1.0 + exp(self._forces[j] - self._forces[i]))
+                    terme = self.duels[i][j] * probabilite * (1.0 - probabilite)
+                    information[i][j] -= terme
+                    information[i][i] += terme
+        inverse = _inverser([[valeur + 1.0 / nombre for valeur in ligne] for ligne in information])
+        return [max(inverse[i][i] - 1.0 / nombre, 0.0) for i in range(nombre)]
+
+    def cotes(self):
+        """
+        Méthode qui calcule la cote Elo de chaque stratégie et la demi-largeur de son intervalle de confiance.
+        Returns:
+            list, list: La cote et la demi-largeur de l'intervalle (en points Elo) de chaque stratégie
+        """
+        self._ajuster()
+        if len(self.noms) == 1:
+            return [ELO_MOYEN], [0.0]
+        cotes = [ELO_MOYEN + ÉCHELLE_ELO * force for force in self._forces]
+        demi_largeurs = [Z_CONFIANCE * ÉCHELLE_ELO * sqrt(variance) for variance in self._variances()]
+        return cotes, demi_largeurs
+
+    def est_stable(self, precision=PRECISION_ELO):
+        """
+        Méthode qui indique si le classement est stable: deux stratégies voisines dans le classement ont des
+        intervalles de confiance disjoints, ou des intervalles dont la demi-largeur ne dépasse pas la précision.
+        Args:
+            precision (float, optional): Demi-largeur (en points Elo) sous laquelle deux voisines sont équivalentes
+        Returns:
+            bool: True si le classement est stable, False autrement
+        """
+        cotes, demi_largeurs = self.cotes()
+        ordre = sorted(range(len(cotes)), key=lambda i: -cotes[i])
+        for haut, bas in zip(ordre, ordre[1:]):
+            disjoints = cotes[haut] - demi_largeurs[haut] > cotes[bas] + demi_largeurs[bas]
+            etroits = demi_largeurs[haut] <= precision and demi_largeurs[bas] <= precision
+            if not (disjoints or etroits):
+                return False
+        return True
+
+    def resume(self):
+        """
+        Méthode qui résume le classement sous une forme facile à écrire en JSON.
+        Returns:
+            dict: Le nombre de parties et, du premier au dernier, la cote et l'intervalle de chaque stratégie avec
+                ses parties, ses victoires et son score moyen
+        """
+        cotes, demi_largeurs = self.cotes()
+        classement = []
+        for i in sorted(range(len(self.noms)), key=lambda i: -cotes[i]):
+            classement.append({"strategie": self.noms[i], "elo": cotes[i],
+                               "intervalle": [cotes[i] - demi_largeurs[i], cotes[i] + demi_largeurs[i]],
+                               "parties": self.parties[i], "victoires": self.victoires[i],
+                               "taux_de_victoire": self.victoires[i] / self.parties[i] if self.parties[i] else 0.0,
+                               "score_moyen": self.total_scores[i] / self.parties[i] if self.parties[i] else 0.0})
+        return {"nombre_parties": self.nombre_parties, "classement": classement}
+
+
+def jouer_par_blocs(strategies, graine_maitresse, tailles=TAILLES_TABLES, nombre_processus=None,
+                    groupes_par_bloc=GROUPES_PAR_BLOC):
+    """
+    Fonction génératrice qui joue les groupes d'un tournoi bloc par bloc, sans fin, et qui donne les résultats de
+    chaque bloc dans l'ordre des blocs. Quelques blocs d'avance sont confiés aux processus; ceux qui restent sont
+    annulés lorsque l'appelant cesse de lire.
+    Args:
+        strategies (tuple): Classe de chaque stratégie
+        graine_maitresse (int): Graine maîtresse du tournoi
+        tailles (tuple, optional): Tailles de table jouées à tour de rôle
+        nombre_processus (int, optional): Nombre de processus (par défaut, le nombre de coeurs). Avec 1, les parties
+            sont jouées dans le processus courant.
+        groupes_par_bloc (int, optional): Nombre de groupes par bloc
+    Returns:
+        generator: Les résultats de chaque bloc (voir jouer_groupes)
+    """
+    debut = 0
+    if nombre_processus == 1:
+        while True:
+            yield jouer_groupes(strategies, graine_maitresse, debut, debut + groupes_par_bloc, tailles)
+            debut += groupes_par_bloc
+    with ProcessPoolExecutor(max_workers=nombre_processus) as executeur:
+        en_cours = deque()
+        try:
+            while True:
+                while len(en_cours) < 2 * (nombre_processus or os.cpu_count() or 1):
+                    en_cours.append(executeur.submit(jouer_groupes, strategies, graine_maitresse, debut,
+                                                     debut + groupes_par_bloc, tailles))
+                    debut += groupes_par_bloc
+                yield en_cours.popleft().result()
+        finally:
+            for travail in en_cours:
+                travail.cancel()
+
+
+def jouer_tournoi(strategies, graine_maitresse=0, noms=None, tailles=TAILLES_TABLES, nombre_processus=None,
+                  parties_min=PARTIES_MIN, parties_max=PARTIES_MAX, precision=PRECISION_ELO,
+                  groupes_par_bloc=GROUPES_PAR_BLOC, progression=None):
+    """
+    Fonction qui joue un tournoi jusqu'à ce que le classement soit stable (après au moins parties_min parties) ou
+    jusqu'à parties_max parties. Le classement est vérifié après chaque bloc: le résultat ne dépend pas du nombre de
+    processus.
+    Args:
+        strategies (list): Classe de chaque stratégie (des sous-classes de JoueurOrdinateur)
+        graine_maitresse (int, optional): Graine maîtresse du tournoi
+        noms (list, optional): Nom de chaque stratégie (par défaut, le nom de sa classe)
+        tailles (tuple, optional): Tailles de table jouées à tour de rôle (entre 2 et 8)
+        nombre_processus (int, optional): Nombre de processus (par défaut, le nombre de coeurs)
+        parties_min (int, optional): Nombre de parties à jouer avant de vérifier la stabilité
+        parties_max (int, optional): Nombre maximal de parties
+        precision (float, optional): Demi-largeur (en points Elo) sous laquelle deux voisines sont équivalentes
+        groupes_par_bloc (int, optional): Nombre de groupes par bloc
+        progression (function, optional): Fonction appelée avec le classement après chaque bloc
+    Returns:
+        Classement: Le classement final
+    """
+    strategies = tuple(strategies)
+    classement = Classement([strategie.__name__ for strategie in strategies] if noms is None else noms)
+    blocs = jouer_par_blocs(strategies, graine_maitresse, tuple(tailles), nombre_processus, groupes_par_bloc)
+    try:
+        for resultats in blocs:
+            for table, scores in resultats:
+                classement.ajouter(table, scores)
+            if progression is not None:
+                progression(classement)
+            if classement.nombre_parties >= parties_max:
+                break
+            if classement.nombre_parties >= parties_min and classement.est_stable(precision):
+                break
+    finally:
+        blocs.close()
+    return classement
+
+
+def main(arguments=None):
+    """
+    Fonction principale d'un tournoi lancé en ligne de commande.
+    Args:
+        arguments (list, optional): Arguments de la ligne de commande (sys.argv par défaut)
+    Returns:
+        int: Code de sortie du programme
+    """
+    analyseur = argparse.ArgumentParser(prog="python -m pymafia.tournoi",
+                                        description="Classe des stratégies de joueurs ordinateurs de pymafia.")
+    analyseur.add_argument("strategies", nargs="+", metavar="strategie",
+                           help="Stratégies du tournoi: " + ", ".join(STRATEGIES) + ", ou module:Classe")
+    analyseur.add_argument("--tailles", type=int, nargs="+", default=list(TAILLES_TABLES),
+                           help="Tailles de table jouées à tour de rôle (entre 2 et 8)")
+    analyseur.add_argument("--processus", type=int, default=None,
+                           help="Nombre de processus (par défaut, le nombre de coeurs)")
+    analyseur.add_argument("--graine", type=int, default=0, help="Graine maîtresse du tournoi")
+    analyseur.add_argument("--parties-min", type=int, default=PARTIES_MIN,
+                           help="Nombre de parties à jouer avant de vérifier la stabilité du classement")
+    analyseur.add_argument("--parties-max", type=int, default=PARTIES_MAX, help="Nombre maximal de parties")
+    analyseur.add_argument("--precision", type=float, default=PRECISION_ELO,
+                           help="Demi-largeur d'intervalle (en points Elo) sous laquelle deux stratégies voisines "
+                                "sont jugées équivalentes")
+    analyseur.add_argument("--sortie", help="Fichier JSON où écrire le classement (la sortie standard par défaut)")
+    options = analyseur.parse_args(arguments)
+    try:
+        strategies = [trouver_strategie(nom) for nom in options.strategies]
+    except (ImportError, ValueError) as erreur:
+        analyseur.error(str(erreur))
+    if not all(2 <= taille <= 8 for taille in options.tailles):
+        analyseur.error("les tailles de table doivent être entre 2 et 8")
+    if options.graine < 0:
+        analyseur.error("la graine doit être positive ou nulle")
+
+    debut = time.perf_counter()
+
+    def afficher_progression(classement):
+        cotes, demi_largeurs = classement.cotes()
+        sys.stderr.write("\r{:,} parties, {:.0f} parties/s, demi-largeur max {:.1f} Elo   ".format(
+            classement.nombre_parties, classement.nombre_parties / (time.perf_counter() - debut), max(demi_largeurs)))
+        sys.stderr.flush()
+
+    classement = jouer_tournoi(strategies, options.graine, options.strategies, options.tailles, options.processus,
+                               options.parties_min, options.parties_max, options.precision,
+                               progression=afficher_progression)
+    sys.stderr.write("\n")
+    resume = {"graine": options.graine, "duree_s": time.perf_counter() - debut,
+              "stable": classement.est_stable(options.precision)}
+    resume.update(classement.resume())
+    if options.sortie:
+        with open(options.sortie, "w", encoding="utf-8") as fichier:
+            json.dump(resume, fichier, indent=2, ensure_ascii=False)
+    else:
+        print(json.dumps(resume, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())